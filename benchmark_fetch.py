@@ -0,0 +1,80 @@
+"""
+fetch 경로 벤치마크 (네트워크 없이 로컬 재생 시장 사용)
+1. CoinFetcher 순차 vs 동시 다운로드 - 티커 수를 늘리면서 wall time 비교
+2. Backfiller - HTTP 재생 서버에 rate limit/실패를 걸고 전체 백필 시간 측정
+
+python benchmark_fetch.py
+"""
+import sys
+sys.path.insert(0, '.')
+
+import time
+import tempfile
+
+from src.data.fetcher import CoinFetcher
+from src.data.backfill import Backfiller, RateLimiter
+from src.data.store import OHLCVStore
+from src.data.replay import ReplayMarket, ReplayServer, ReplayExchange, replay_history_provider
+
+LATENCY = 0.05       # 페이지 요청당 지연 (초)
+TICKER_COUNTS = [1, 2, 4, 8, 16]
+MAX_WORKERS = 8
+
+
+def run_fetch(tickers: list, concurrent: bool) -> float:
+    market = ReplayMarket(latency=LATENCY)
+    # 티커 수를 늘리기 위해 COIN{i}-USD → BTC/ETH 번갈아 매핑
+    provider = replay_history_provider(market, lambda t: market.symbols[int(t[4:].split('-')[0]) % 2])
+    fetcher = CoinFetcher(tickers, history_provider=provider, max_workers=MAX_WORKERS)
+    
+    start = time.perf_counter()
+    data = fetcher.fetch(period='2y', interval='4h', concurrent=concurrent)
+    elapsed = time.perf_counter() - start
+    
+    assert list(data.keys()) == tickers
+    return elapsed
+
+
+def run_backfill(rate_limit: float, failure_rate: float) -> tuple:
+    market = ReplayMarket(latency=LATENCY, rate_limit=rate_limit, failure_rate=failure_rate)
+    
+    with ReplayServer(market) as server, tempfile.TemporaryDirectory() as tmp:
+        backfiller = Backfiller(ReplayExchange(url=server.url), OHLCVStore(tmp),
+                                rate_limiter=RateLimiter(initial=0.01, min_interval=0.01),
+                                max_retries=50)
+        
+        start = time.perf_counter()
+        counts = backfiller.run_many([(s, '4h') for s in market.symbols])
+        elapsed = time.perf_counter() - start
+    
+    return elapsed, sum(counts.values()), market.request_count
+
+
+if __name__ == "__main__":
+    fetch_results = []
+    for n in TICKER_COUNTS:
+        tickers = [f"COIN{i}-USD" for i in range(n)]
+        fetch_results.append((n, run_fetch(tickers, False), run_fetch(tickers, True)))
+    
+    backfill_results = []
+    for rate_limit, failure_rate in [(None, 0.0), (20, 0.0), (20, 0.1)]:
+        backfill_results.append((rate_limit, failure_rate) + run_backfill(rate_limit, failure_rate))
+    
+    print()
+    print("=" * 60)
+    print(f"📊 CoinFetcher wall time (2년 4시간봉, 페이지당 지연 {LATENCY}초, 스레드 {MAX_WORKERS}개)")
+    print("=" * 60)
+    print(f"{'티커 수':>6} | {'순차':>8} | {'동시':>8} | {'배속':>6}")
+    print("-" * 40)
+    for n, serial, concurrent in fetch_results:
+        print(f"{n:>6} | {serial:>7.2f}s | {concurrent:>7.2f}s | {serial / concurrent:>5.1f}x")
+    
+    print()
+    print("=" * 60)
+    print("📊 Backfiller (HTTP 재생 서버, BTC/ETH 5년 4시간봉 동시 백필)")
+    print("=" * 60)
+    print(f"{'초당제한':>8} | {'실패율':>6} | {'시간':>8} | {'저장 봉':>8} | {'요청 수':>6}")
+    print("-" * 50)
+    for rate_limit, failure_rate, elapsed, rows, requests in backfill_results:
+        limit_text = f"{rate_limit:.0f}/s" if rate_limit else "없음"
+        print(f"{limit_text:>8} | {failure_rate:>6.0%} | {elapsed:>7.2f}s | {rows:>8,} | {requests:>6}")
@@ -0,0 +1,146 @@
+"""
+지표 커널 벤치마크 (pandas rolling/ewm vs 배열 커널)
+1. 개별 지표 - rolling 평균/표준편차, EMA, MACD, RSI, 볼린저 밴드
+2. TechnicalIndicators.calculate_all - backend별 전체 지표 계산
+
+입력: data/btc_4h_5y.csv (약 13k봉) + 같은 통계의 합성 500만 봉
+오차: pandas 결과 대비 최대 절대 오차 / 가격 수준 (NaN 위치가 다르면 실패)
+
+python benchmark_indicators.py
+"""
+import sys
+sys.path.insert(0, '.')
+
+import time
+import numpy as np
+import pandas as pd
+
+from src.features import kernels
+from src.features.technical import TechnicalIndicators
+
+LARGE_BARS = 5_000_000
+REPEAT = 5  # 작은 입력은 여러 번 재서 최솟값 사용
+
+
+def load_inputs() -> dict:
+    btc = pd.read_csv('data/btc_4h_5y.csv', index_col=0, parse_dates=True)
+    
+    # 실제 종가를 정방향/역방향으로 이어붙인 합성 가격 (가격대와 변동성 유지, 경계 불연속 없음)
+    # 가격이 수십만 배 움직이는 랜덤워크는 pandas rolling std 자체의 누적 오차가 커서 비교에 부적합
+    real = btc['Close'].to_numpy()
+    close = np.resize(np.r_[real, real[::-1]], LARGE_BARS)
+    index = pd.date_range('2000-01-01', periods=LARGE_BARS, freq='4h', tz='UTC')
+    large = pd.DataFrame({'Open': close, 'High': close, 'Low': close, 'Close': close,
+                          'Volume': 1.0}, index=index)
+    return {f'BTC 4h ({len(btc):,}봉)': btc, f'합성 ({LARGE_BARS:,}봉)': large}
+
+
+def pandas_cases(c: pd.Series) -> dict:
+    """TechnicalIndicators의 pandas 계산과 같은 식"""
+    def rsi():
+        delta = c.diff()
+        gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
+        loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
+        return 100 - (100 / (1 + gain / loss))
+    
+    def macd():
+        line = c.ewm(span=12, adjust=False).mean() - c.ewm(span=26, adjust=False).mean()
+        return line - line.ewm(span=9, adjust=False).mean()
+    
+    def bollinger():
+        return c.rolling(window=20).mean() + c.rolling(window=20).std() * 2
+    
+    return {
+        'rolling mean(20)': lambda: c.rolling(window=20).mean(),
+        'rolling std(20)': lambda: c.rolling(window=20).std(),
+        'EMA(26)': lambda: c.ewm(span=26, adjust=False).mean(),
+        'MACD hist': macd,
+        'RSI(14)': rsi,
+        'Bollinger upper': bollinger,
+    }
+
+
+def kernel_cases(c: np.ndarray, backend: str) -> dict:
+    return {
+        'rolling mean(20)': lambda: kernels.rolling_mean(c, 20, backend),
+        'rolling std(20)': lambda: kernels.rolling_std(c, 20, backend),
+        'EMA(26)': lambda: kernels.ema(c, 26, backend=backend),
+        'MACD hist': lambda: kernels.macd(c, 12, 26, 9, backend)[2],
+        'RSI(14)': lambda: kernels.rsi(c, 14, backend),
+        'Bollinger upper': lambda: kernels.bollinger(c, 20, 2, backend)[0],
+    }
+
+
+def timed(fn, repeat: int) -> tuple:
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def max_error(result, reference, scale: float) -> float:
+    result = np.asarray(result, dtype=float)
+    reference = np.asarray(reference, dtype=float)
+    if not np.array_equal(np.isnan(result), np.isnan(reference)):
+        return np.inf
+    diff = np.abs(result - reference)
+    return float(np.nanmax(diff) / scale) if np.isfinite(diff).any() else 0.0
+
+
+if __name__ == "__main__":
+    backends = kernels.available_backends()
+    if 'numba' in backends:
+        # JIT 컴파일 시간은 제외
+        warm = np.linspace(1, 2, 100)
+        for fn in kernel_cases(warm, 'numba').values():
+            fn()
+    
+    results = []
+    full_results = []
+    for label, df in load_inputs().items():
+        close = df['Close']
+        values = close.to_numpy(dtype=float)
+        scale = float(np.nanmax(np.abs(values)))
+        repeat = REPEAT if len(df) < 100_000 else 1
+        
+        reference = {}
+        for name, fn in pandas_cases(close).items():
+            reference[name] = timed(fn, repeat)
+        
+        for backend in backends:
+            for name, fn in kernel_cases(values, backend).items():
+                elapsed, result = timed(fn, repeat)
+                base_elapsed, base_result = reference[name]
+                results.append((label, name, backend, base_elapsed, elapsed,
+                                max_error(result, base_result, scale)))
+        
+        base_elapsed, base_frame = timed(lambda: TechnicalIndicators().calculate_all(df), repeat)
+        for backend in backends:
+            ti = TechnicalIndicators(backend=backend)
+            elapsed, frame = timed(lambda: ti.calculate_all(df), repeat)
+            error = max(max_error(frame[c].to_numpy(dtype=float), base_frame[c].to_numpy(dtype=float),
+                                  float(np.nanmax(np.abs(base_frame[c].to_numpy(dtype=float)))) or 1.0)
+                        for c in TechnicalIndicators.COLUMNS)
+            full_results.append((label, backend, base_elapsed, elapsed, error))
+    
+    print()
+    print("=" * 78)
+    print(f"📊 지표 커널 vs pandas (backend: {', '.join(backends)})")
+    print("=" * 78)
+    print(f"{'입력':<20} | {'지표':<16} | {'backend':<7} | {'pandas':>9} | {'커널':>9} | {'배속':>6} | {'오차':>8}")
+    print("-" * 78)
+    for label, name, backend, base_elapsed, elapsed, error in results:
+        print(f"{label:<20} | {name:<16} | {backend:<7} | {base_elapsed * 1000:>7.2f}ms | "
+              f"{elapsed * 1000:>7.2f}ms | {base_elapsed / elapsed:>5.1f}x | {error:>8.1e}")
+    
+    print()
+    print("=" * 78)
+    print("📊 TechnicalIndicators.calculate_all (오차: 컬럼별 최대 절대 오차 / 컬럼 크기)")
+    print("=" * 78)
+    print(f"{'입력':<20} | {'backend':<7} | {'pandas':>9} | {'커널':>9} | {'배속':>6} | {'오차':>8}")
+    print("-" * 78)
+    for label, backend, base_elapsed, elapsed, error in full_results:
+        print(f"{label:<20} | {backend:<7} | {base_elapsed * 1000:>7.2f}ms | "
+              f"{elapsed * 1000:>7.2f}ms | {base_elapsed / elapsed:>5.1f}x | {error:>8.1e}")
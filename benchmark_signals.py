@@ -0,0 +1,165 @@
+"""
+RSI 시그널 벤치마크 (봉마다 .iloc 루프 vs src.signals 벡터화 엔진)
+
+1. 시그널 생성: 기존 루프 vs 벡터화 엔진 (dict 리스트 반환)
+2. 시뮬레이터 입력 준비: dict 리스트 + {confirm_date: dict} 맵 vs SignalSet + 봉별 확인 가격 배열
+3. 숏 진입 피크 시그널: 봉마다 lookback 슬라이스 루프 vs 마지막 피크 위치 누적 (+ 조합 일괄 계산)
+4. 최적화 격자: (과매도, 탈출) 쌍마다 rsi_buy_signal_set vs rsi_buy_signal_sets 한 번
+
+입력: data/btc_4h_5y.csv (약 13k봉) + 실제 종가를 이어붙인 합성 500만 봉
+기존 루프는 500만 봉에서 수 분이 걸리므로 앞 LOOP_SAMPLE봉으로 재서 봉 수에 비례해 환산한다
+(루프는 봉당 일정한 비용이라 선형).
+
+python benchmark_signals.py
+"""
+import sys
+sys.path.insert(0, '.')
+
+import time
+import numpy as np
+import pandas as pd
+
+from src.features.rsi import RSI
+from src.signals import (confirm_prices, rsi_buy_signal_set, rsi_sell_signal_set,
+                         rsi_buy_signals, rsi_sell_signals, rsi_buy_signal_sets, rsi_sell_signal_sets,
+                         rsi_peak_short_signal_set, rsi_peak_short_signal_sets, rsi_peak_short_signals)
+from verify_signal_parity import legacy_buy_signals, legacy_sell_signals, legacy_short_signals_peak, same_signals
+
+LARGE_BARS = 5_000_000
+LOOP_SAMPLE = 200_000
+SHORT_LOOP_SAMPLE = 50_000
+# optimize_dual_strategy 숏 격자 크기의 (rsi_peak, rsi_entry, lookback) 조합
+# optimize_balanced 격자 (탈출 > 과매도 / 탈출 < 과매수인 쌍만)
+BUY_PAIRS = [(o, e) for o in (15, 20, 25, 30, 35) for e in (30, 35, 40, 45, 50, 55, 60) if e > o]
+SELL_PAIRS = [(o, e) for o in (65, 70, 75, 80, 85) for e in (30, 35, 40, 45, 50, 55) if e < o]
+SHORT_GRID = [(p, e, lb) for p in (75, 78, 80, 85) for e in (60, 65, 70) for lb in (12, 24, 48, 96)]
+REPEAT = 3
+
+
+def load_inputs() -> dict:
+    btc = pd.read_csv('data/btc_4h_5y.csv', index_col=0, parse_dates=True)
+    
+    # 실제 종가를 정방향/역방향으로 이어붙인 합성 가격 (RSI 분포 유지)
+    real = btc['Close'].to_numpy()
+    close = np.resize(np.r_[real, real[::-1]], LARGE_BARS)
+    index = pd.date_range('2000-01-01', periods=LARGE_BARS, freq='4h', tz='UTC')
+    large = pd.DataFrame({'Close': close}, index=index)
+    
+    frames = {}
+    for name, df in ((f'BTC 4h ({len(btc):,}봉)', btc[['Close']].copy()), (f'합성 ({LARGE_BARS:,}봉)', large)):
+        df['rsi'] = RSI(14).calculate(df['Close'])
+        df['golden_cross'] = df['Close'].rolling(40).mean() > df['Close'].rolling(200).mean()
+        frames[name] = df
+    return frames
+
+
+def timed(fn, repeat: int) -> tuple:
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+if __name__ == '__main__':
+    print("=" * 90)
+    print("⏱️  RSI 시그널 벤치마크 (매수 35/40 + GC, 매도 80/55)")
+    print("=" * 90)
+    
+    inputs = load_inputs()
+    cases = {
+        '매수 (GC)': (lambda d: legacy_buy_signals(d, 35, 40, True), lambda d: rsi_buy_signals(d, 35, 40, True)),
+        '매도': (lambda d: legacy_sell_signals(d, 80, 55), lambda d: rsi_sell_signals(d, 80, 55)),
+    }
+    
+    for name, df in inputs.items():
+        n = len(df)
+        sample = df.iloc[:min(n, LOOP_SAMPLE)]
+        print(f"\n📊 {name}")
+        print(f"  {'시그널':<10} {'기존 루프':>12} {'벡터화':>10} {'배속':>8}  {'시그널 수':>9}  결과")
+        print("  " + "-" * 70)
+        for label, (legacy, engine) in cases.items():
+            loop_time, expected = timed(lambda: legacy(sample), 1)
+            loop_time *= n / len(sample)
+            fast_time, actual = timed(lambda: engine(df), REPEAT)
+            # 결과 비교는 루프를 돈 구간에서
+            same = same_signals(expected, engine(sample))
+            note = "" if len(sample) == n else " (루프 시간 환산)"
+            print(f"  {label:<10} {loop_time:>11.3f}s {fast_time:>9.4f}s {loop_time / fast_time:>7.0f}x  "
+                  f"{len(actual):>9,}  {'✅ 동일' if same else '❌ 불일치'}{note}")
+    
+    # 시뮬레이터가 루프 전에 하는 일: 시그널 → 확인 봉 조회 구조
+    lookups = {
+        '매수 (GC)': (lambda d: {s['confirm_date']: s for s in rsi_buy_signals(d, 35, 40, True)},
+                     lambda d: confirm_prices(rsi_buy_signal_set(d, 35, 40, True), d.index)),
+        '매도': (lambda d: {s['confirm_date']: s for s in rsi_sell_signals(d, 80, 55)},
+               lambda d: confirm_prices(rsi_sell_signal_set(d, 80, 55), d.index)),
+    }
+    
+    print("\n" + "=" * 90)
+    print("📦 시뮬레이터 입력 (dict 리스트 + 날짜 맵 vs SignalSet + 봉별 가격 배열)")
+    print("=" * 90)
+    for name, df in inputs.items():
+        print(f"\n📊 {name}")
+        print(f"  {'시그널':<10} {'dict':>10} {'SignalSet':>10} {'배속':>8}  결과")
+        print("  " + "-" * 60)
+        for label, (by_dict, by_set) in lookups.items():
+            dict_time, dates = timed(lambda: by_dict(df), REPEAT)
+            set_time, prices = timed(lambda: by_set(df), REPEAT)
+            # 같은 봉에 같은 가격
+            hit = np.flatnonzero(~np.isnan(prices))
+            same = list(df.index[hit]) == list(dates) and \
+                np.array_equal(prices[hit], [s['confirm_price'] for s in dates.values()])
+            print(f"  {label:<10} {dict_time:>9.4f}s {set_time:>9.4f}s {dict_time / set_time:>7.0f}x  "
+                  f"{'✅ 동일' if same else '❌ 불일치'}")
+    
+    print("\n" + "=" * 90)
+    print("🔻 숏 진입 피크 시그널 (피크 80 → 70 하향, lookback별)")
+    print("=" * 90)
+    for name, df in inputs.items():
+        n = len(df)
+        sample = df.iloc[:min(n, SHORT_LOOP_SAMPLE)]
+        print(f"\n📊 {name}")
+        print(f"  {'lookback':<10} {'기존 루프':>12} {'벡터화':>10} {'배속':>8}  {'시그널 수':>9}  결과")
+        print("  " + "-" * 70)
+        for lookback in (24, 240):
+            loop_time, expected = timed(lambda: legacy_short_signals_peak(sample, 80, 70, lookback), 1)
+            loop_time *= n / len(sample)
+            fast_time, actual = timed(lambda: rsi_peak_short_signal_set(df, 80, 70, lookback), REPEAT)
+            same = same_signals(expected, rsi_peak_short_signals(sample, 80, 70, lookback))
+            note = "" if len(sample) == n else " (루프 시간 환산)"
+            print(f"  {lookback:<10} {loop_time:>11.3f}s {fast_time:>9.4f}s {loop_time / fast_time:>7.0f}x  "
+                  f"{len(actual):>9,}  {'✅ 동일' if same else '❌ 불일치'}{note}")
+        
+        # 조합마다 따로 vs 피크 위치/하향 돌파 공유 일괄 계산
+        single_time, singles = timed(lambda: {t: rsi_peak_short_signal_set(df, *t) for t in SHORT_GRID}, REPEAT)
+        batch_time, batch = timed(lambda: rsi_peak_short_signal_sets(df, SHORT_GRID), REPEAT)
+        same = all(np.array_equal(singles[t].confirm_idx, batch[t].confirm_idx) and
+                   np.array_equal(singles[t].signal_idx, batch[t].signal_idx) for t in SHORT_GRID)
+        print(f"  {len(SHORT_GRID)}개 조합: 따로 {single_time:.4f}s → 일괄 {batch_time:.4f}s "
+              f"({single_time / batch_time:.1f}x)  {'✅ 동일' if same else '❌ 불일치'}")
+    
+    grids = {
+        '매수 (첫 봉)': (lambda d: {p: rsi_buy_signal_set(d, *p, anchor='first') for p in BUY_PAIRS},
+                       lambda d: rsi_buy_signal_sets(d, BUY_PAIRS, anchor='first')),
+        '매수 (GC)': (lambda d: {p: rsi_buy_signal_set(d, *p, True) for p in BUY_PAIRS},
+                     lambda d: rsi_buy_signal_sets(d, BUY_PAIRS, True)),
+        '매도 (첫 봉)': (lambda d: {p: rsi_sell_signal_set(d, *p, anchor='first') for p in SELL_PAIRS},
+                       lambda d: rsi_sell_signal_sets(d, SELL_PAIRS, anchor='first')),
+    }
+    
+    print("\n" + "=" * 90)
+    print(f"🧮 최적화 격자 (매수 {len(BUY_PAIRS)}쌍, 매도 {len(SELL_PAIRS)}쌍: 쌍마다 따로 vs 일괄)")
+    print("=" * 90)
+    for name, df in inputs.items():
+        print(f"\n📊 {name}")
+        print(f"  {'시그널':<10} {'쌍마다':>10} {'일괄':>10} {'배속':>8}  결과")
+        print("  " + "-" * 60)
+        for label, (per_pair, batched) in grids.items():
+            single_time, singles = timed(lambda: per_pair(df), REPEAT)
+            batch_time, batch = timed(lambda: batched(df), REPEAT)
+            same = all(np.array_equal(singles[p].confirm_idx, batch[p].confirm_idx) and
+                       np.array_equal(singles[p].signal_idx, batch[p].signal_idx) for p in singles)
+            print(f"  {label:<10} {single_time:>9.4f}s {batch_time:>9.4f}s {single_time / batch_time:>7.1f}x  "
+                  f"{'✅ 동일' if same else '❌ 불일치'}")
@@ -1,11 +1,16 @@
 """
 BTC 5년 데이터: 1달 보유 시 최대 낙폭 → 안전 레버리지 계산
 """
+import sys
+sys.path.insert(0, '.')
+
 import pandas as pd
 import numpy as np
 import yfinance as yf
 from datetime import datetime, timedelta
 
+from src.features.extremes import rolling_min, rolling_argmin
+
 
 def main():
     print("=" * 60)
@@ -33,18 +38,20 @@ def main():
     
     print(f"\n🔍 각 시점에서 {holding_days}일 보유 시 최대 낙폭 계산 중...")
     
-    for i in range(len(df) - holding_days):
-        buy_price = df['Close'].iloc[i]
-        buy_date = df.index[i]
-        
-        # 보유 기간 동안 최저가
-        holding_period = df['Low'].iloc[i:i+holding_days]
-        min_price = holding_period.min()
-        min_date = holding_period.idxmin()
-        
-        # 최대 낙폭 (매수가 대비)
-        mdd = (min_price / buy_price - 1) * 100
-        
+    # 보유 기간(매수일 포함 holding_days일) 동안 최저가와 그 날짜 (forward 창 한 번에)
+    m = len(df) - holding_days
+    buy_prices = df['Close'].to_numpy(dtype=float)[:m]
+    low = df['Low'].to_numpy(dtype=float)
+    min_prices = rolling_min(low, holding_days, forward=True)[:m]
+    # 창 안에 결측 저가가 있으면 위치가 -1 → 마지막 날짜가 아니라 NaT
+    min_pos = rolling_argmin(low, holding_days, forward=True)[:m]
+    min_dates = df.index[min_pos.clip(0)].where(min_pos >= 0)
+    
+    # 최대 낙폭 (매수가 대비)
+    mdds = (min_prices / buy_prices - 1) * 100
+    
+    for buy_date, buy_price, min_date, min_price, mdd in zip(
+            df.index[:m], buy_prices, min_dates, min_prices, mdds):
         max_drawdowns.append({
             'buy_date': buy_date,
             'buy_price': buy_price,
@@ -53,8 +60,8 @@ def main():
             'mdd': mdd
         })
     
-    # 최악의 케이스들 정렬
-    sorted_mdd = sorted(max_drawdowns, key=lambda x: x['mdd'])
+    # 최악의 케이스들 정렬 (결측 창은 낙폭을 알 수 없으므로 제외)
+    sorted_mdd = sorted((x for x in max_drawdowns if not np.isnan(x['mdd'])), key=lambda x: x['mdd'])
     
     print("\n" + "=" * 60)
     print("📉 최악의 낙폭 TOP 10 (1달 보유 기준)")
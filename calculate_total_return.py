@@ -8,6 +8,7 @@ sys.path.insert(0, '.')
 import pandas as pd
 import numpy as np
 
+from src.features.technical import trim_warmup
 from dashboard_4h import (
     find_buy_signals,
     find_sell_signals,
@@ -24,7 +25,7 @@ USE_GOLDEN_CROSS = False
 
 # 데이터 로드
 df = pd.read_csv("data/btc_4h_5y.csv", index_col=0, parse_dates=True)
-df = df.dropna()
+df = trim_warmup(df)  # MA 워밍업 구간 제외 (복사 없이 슬라이스)
 
 # 지표 계산
 df['MA20'] = df['Close'].rolling(20).mean()
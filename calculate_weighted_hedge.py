@@ -8,6 +8,8 @@ sys.path.insert(0, '.')
 import pandas as pd
 import numpy as np
 
+from src.features.technical import trim_warmup
+from src.features.rsi import RSI
 from dashboard_4h import (
     find_buy_signals,
     find_sell_signals,
@@ -25,7 +27,7 @@ CAPITAL_PER_ENTRY = 1000  # 각 진입당 $1000
 
 # 데이터 로드
 df = pd.read_csv("data/btc_4h_5y.csv", index_col=0, parse_dates=True)
-df = df.dropna()
+df = trim_warmup(df)  # MA 워밍업 구간 제외 (복사 없이 슬라이스)
 
 # 지표 계산
 df['MA20'] = df['Close'].rolling(20).mean()
@@ -34,11 +36,7 @@ exp12 = df['Close'].ewm(span=12).mean()
 exp26 = df['Close'].ewm(span=26).mean()
 df['MACD'] = exp12 - exp26
 
-delta = df['Close'].diff()
-gain = delta.where(delta > 0, 0).rolling(14).mean()
-loss = (-delta.where(delta < 0, 0)).rolling(14).mean()
-rs = gain / loss
-df['RSI'] = 100 - (100 / (1 + rs))
+df['RSI'] = RSI(14).calculate(df['Close'])
 
 df['high_60'] = df['High'].rolling(60).max()
 df['drawdown_60'] = (df['Close'] - df['high_60']) / df['high_60'] * 100
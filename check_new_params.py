@@ -11,52 +11,21 @@ import numpy as np
 from src.data.cache import DataCache
 from src.data.fetcher import CoinFetcher, validate_data
 from src.features.technical import TechnicalIndicators
+from src.signals import confirm_prices, rsi_buy_signal_set, rsi_sell_signal_set
 
 
 def find_buy_signals(df, rsi_oversold, rsi_exit):
-    signals = []
-    in_oversold = False
-    
-    for i in range(len(df)):
-        row = df.iloc[i]
-        current_rsi = row.get('rsi', 50)
-        
-        if current_rsi < rsi_oversold and not in_oversold:
-            in_oversold = True
-        elif in_oversold and current_rsi >= rsi_exit:
-            signals.append({
-                'confirm_date': df.index[i],
-                'confirm_price': row['Close']
-            })
-            in_oversold = False
-    
-    return signals
+    return rsi_buy_signal_set(df, rsi_oversold, rsi_exit, anchor='first')
 
 
 def find_sell_signals(df, rsi_overbought, rsi_exit):
-    signals = []
-    in_overbought = False
-    
-    for i in range(len(df)):
-        row = df.iloc[i]
-        current_rsi = row.get('rsi', 50)
-        
-        if current_rsi > rsi_overbought and not in_overbought:
-            in_overbought = True
-        elif in_overbought and current_rsi <= rsi_exit:
-            signals.append({
-                'confirm_date': df.index[i],
-                'confirm_price': row['Close']
-            })
-            in_overbought = False
-    
-    return signals
+    return rsi_sell_signal_set(df, rsi_overbought, rsi_exit, anchor='first')
 
 
 def simulate_new_strategy(df, buy_signals, sell_signals, stop_loss=-25):
     """새 전략: 수익일 때만 매도"""
-    all_buy_dates = {bs['confirm_date']: bs for bs in buy_signals}
-    all_sell_dates = {ss['confirm_date']: ss for ss in sell_signals}
+    buy_prices = confirm_prices(buy_signals, df.index)
+    sell_prices = confirm_prices(sell_signals, df.index)
     
     trades = []
     positions = []
@@ -74,8 +43,8 @@ def simulate_new_strategy(df, buy_signals, sell_signals, stop_loss=-25):
             
             if current_return <= stop_loss:
                 exit_reason = "손절"
-            elif current_date in all_sell_dates:
-                sell_price = all_sell_dates[current_date]['confirm_price']
+            elif not np.isnan(sell_prices[idx]):
+                sell_price = sell_prices[idx]
                 sell_return = (sell_price / avg_price - 1) * 100
                 if sell_return > 0:
                     exit_reason = "익절"
@@ -86,10 +55,10 @@ def simulate_new_strategy(df, buy_signals, sell_signals, stop_loss=-25):
                 trades.append({'return': final_return})
                 positions = []
         
-        if current_date in all_buy_dates:
+        if not np.isnan(buy_prices[idx]):
             positions.append({
                 'date': current_date,
-                'price': all_buy_dates[current_date]['confirm_price']
+                'price': buy_prices[idx]
             })
     
     return trades, positions
@@ -144,7 +113,7 @@ def main():
         cache.set(f'{ticker}_4h', df_4h)
     
     ti = TechnicalIndicators()
-    df_4h = ti.calculate_all(df_4h)
+    df_4h = ti.calculate(df_4h, ['rsi'])
     
     print(f"   기간: {df_4h.index[0].strftime('%Y-%m-%d')} ~ {df_4h.index[-1].strftime('%Y-%m-%d')}")
     
@@ -170,7 +139,7 @@ def main():
         df_1d, _ = validate_data(df_1d, ticker)
         cache_1d.set(f'{ticker}_1d', df_1d)
     
-    df_1d = ti.calculate_all(df_1d)
+    df_1d = ti.calculate(df_1d, ['rsi'])
     
     print(f"   기간: {df_1d.index[0].strftime('%Y-%m-%d')} ~ {df_1d.index[-1].strftime('%Y-%m-%d')}")
     
@@ -16,7 +16,6 @@ import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
 from pathlib import Path
-import json
 from datetime import datetime
 import sys
 
@@ -24,8 +23,10 @@ project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
 from src.data.cache import DataCache
-from src.data.fetcher import CoinFetcher, validate_data
+from src.data.loader import load_resampled
 from src.features.technical import TechnicalIndicators
+from src.features.cache import IndicatorCache
+from src.signals import confirm_prices, rsi_buy_signals, rsi_sell_signals
 from src.utils.helpers import load_config
 
 # 페이지 설정
@@ -41,36 +42,22 @@ def load_data(ticker: str):
     """4시간봉 데이터 로드 및 지표 계산"""
     config = load_config()
     
-    # 4시간봉용 별도 캐시
+    # 1시간봉 공유 캐시 (일봉/4시간봉 대시보드 공통)
     cache = DataCache(
-        cache_dir=str(project_root / "data" / "cache_4h"),
-        max_age_hours=1  # 1시간마다 갱신
+        cache_dir=str(project_root / "data" / "cache_1h"),
+        interval='1h',  # 1시간봉 마감 후에만 갱신
+        grace_minutes=config.get('data', {}).get('cache_grace_minutes', 5)
     )
     
-    cache_key = f"{ticker}_4h"
-    df = cache.get(cache_key)
-    if df is None:
-        fetcher = CoinFetcher([ticker])
-        # 4시간봉, 2년 데이터
-        data = fetcher.fetch(period='2y', interval='4h')
-        if ticker in data:
-            df = data[ticker]
-            df, _ = validate_data(df, ticker)
-            cache.set(cache_key, df)
+    # 1시간봉 2년 데이터에서 4시간봉 파생 (만료 시 마지막 봉 이후만 추가로 받음)
+    df = load_resampled(ticker, '4h', cache, period='2y',
+                        gap_method=config.get('data', {}).get('gap_repair'))
     
     if df is not None:
-        ti = TechnicalIndicators(config.get('indicators', {}))
-        df = ti.calculate_all(df)
-        
-        # 골든크로스용 이동평균선 추가
-        df['MA40'] = df['Close'].rolling(window=40).mean()
-        df['MA200'] = df['Close'].rolling(window=200).mean()
-        df['golden_cross'] = df['MA40'] > df['MA200']
-        
-        # MACD 추가 (헷징용)
-        exp12 = df['Close'].ewm(span=12).mean()
-        exp26 = df['Close'].ewm(span=26).mean()
-        df['MACD'] = exp12 - exp26
+        ti = TechnicalIndicators(config.get('indicators', {}),
+                                 cache=IndicatorCache(str(project_root / "data" / "cache_indicators")))
+        # 기본 지표 + 골든크로스용 이동평균선 + MACD (헷징용)
+        df = ti.calculate(df, ti.COLUMNS + ['MA40', 'MA200', 'golden_cross', 'MACD'])
     
     return df
 
@@ -81,47 +68,7 @@ def find_buy_signals(df: pd.DataFrame, rsi_oversold: float = 30, rsi_exit: float
     조건: RSI < rsi_oversold 후 → RSI >= rsi_exit 탈출 시 매수
     골든크로스 필터: MA40 > MA200 일 때만 매수 허용
     """
-    buy_signals = []
-    
-    in_oversold = False
-    last_signal_date = None
-    last_signal_price = None
-    last_signal_rsi = None
-    
-    for idx in range(len(df)):
-        rsi = df['rsi'].iloc[idx]
-        
-        if pd.isna(rsi):
-            continue
-        
-        # 골든크로스 체크
-        golden_cross_ok = True
-        if use_golden_cross and 'golden_cross' in df.columns:
-            gc = df['golden_cross'].iloc[idx]
-            golden_cross_ok = gc if not pd.isna(gc) else False
-        
-        if rsi < rsi_oversold:
-            in_oversold = True
-            last_signal_date = df.index[idx]
-            last_signal_price = df['Close'].iloc[idx]
-            last_signal_rsi = rsi
-        else:
-            if in_oversold and rsi >= rsi_exit and last_signal_date is not None:
-                # 골든크로스 필터: 상승장에서만 매수
-                if golden_cross_ok:
-                    buy_signals.append({
-                        'signal_date': last_signal_date,
-                        'signal_price': last_signal_price,
-                        'signal_rsi': last_signal_rsi,
-                        'confirm_date': df.index[idx],
-                        'confirm_price': df['Close'].iloc[idx],
-                        'confirm_rsi': rsi,
-                        'golden_cross': golden_cross_ok
-                    })
-                    in_oversold = False
-                    last_signal_date = None
-    
-    return buy_signals
+    return rsi_buy_signals(df, rsi_oversold, rsi_exit, use_golden_cross)
 
 
 def find_sell_signals(df: pd.DataFrame, rsi_overbought: float = 70, rsi_exit: float = 50):
@@ -129,38 +76,7 @@ def find_sell_signals(df: pd.DataFrame, rsi_overbought: float = 70, rsi_exit: fl
     매도 시그널 찾기 (RSI 탈출 방식)
     조건: RSI > rsi_overbought 후 → RSI <= rsi_exit 하락 시 매도
     """
-    sell_signals = []
-    
-    in_overbought = False
-    last_signal_date = None
-    last_signal_price = None
-    last_signal_rsi = None
-    
-    for idx in range(len(df)):
-        rsi = df['rsi'].iloc[idx]
-        
-        if pd.isna(rsi):
-            continue
-        
-        if rsi > rsi_overbought:
-            in_overbought = True
-            last_signal_date = df.index[idx]
-            last_signal_price = df['Close'].iloc[idx]
-            last_signal_rsi = rsi
-        else:
-            if in_overbought and rsi <= rsi_exit and last_signal_date is not None:
-                sell_signals.append({
-                    'signal_date': last_signal_date,
-                    'signal_price': last_signal_price,
-                    'signal_rsi': last_signal_rsi,
-                    'confirm_date': df.index[idx],
-                    'confirm_price': df['Close'].iloc[idx],
-                    'confirm_rsi': rsi
-                })
-                in_overbought = False
-                last_signal_date = None
-    
-    return sell_signals
+    return rsi_sell_signals(df, rsi_overbought, rsi_exit)
 
 
 def simulate_trades(df: pd.DataFrame, buy_signals: list, sell_signals: list, stop_loss: float = -25,
@@ -182,9 +98,9 @@ def simulate_trades(df: pd.DataFrame, buy_signals: list, sell_signals: list, sto
     - 숏 투자금 = 현재 롱 투자금 × hedge_ratio
     - 숏 청산: 익절 hedge_profit% / 손절 hedge_stop% / 롱 청산시
     """
-    # confirm_date 기준으로 매수/매도 시점 결정 (실제 거래 시점)
-    all_buy_dates = {bs['confirm_date']: bs for bs in buy_signals}
-    all_sell_dates = {ss['confirm_date']: ss for ss in sell_signals}
+    # 확인 봉 기준으로 매수/매도 시점 결정 (실제 거래 시점, 봉별 확인 가격 - 시그널 없으면 NaN)
+    buy_prices = confirm_prices(buy_signals, df.index)
+    sell_prices = confirm_prices(sell_signals, df.index)
     
     trades = []
     positions = []
@@ -245,8 +161,8 @@ def simulate_trades(df: pd.DataFrame, buy_signals: list, sell_signals: list, sto
             if current_return <= stop_loss:
                 exit_reason = "손절"
             # 2) RSI 매도 시그널 + 수익인 경우만 익절
-            elif current_date in all_sell_dates:
-                sell_price = all_sell_dates[current_date]['confirm_price']
+            elif not np.isnan(sell_prices[idx]):
+                sell_price = sell_prices[idx]
                 sell_return = (sell_price / avg_price - 1) * 100
                 if sell_return > 0:  # 수익일 때만 매도!
                     exit_reason = "익절"
@@ -283,10 +199,10 @@ def simulate_trades(df: pd.DataFrame, buy_signals: list, sell_signals: list, sto
                 
                 positions = []
         
-        if current_date in all_buy_dates:
+        if not np.isnan(buy_prices[idx]):
             positions.append({
                 'date': current_date,
-                'price': all_buy_dates[current_date]['confirm_price']
+                'price': buy_prices[idx]
             })
             
             num_buys = len(positions)
@@ -635,7 +551,7 @@ def main():
                 showlegend=False,
                 hovertemplate=f"🟢 매수: ${trade['entry_prices'][0]:,.2f}<br>{trade['entry_dates'][0].strftime('%Y-%m-%d %H:%M')}<extra></extra>"
             ))
-        
+            
             # 물타기 (연초록색 작은 원)
             if trade['num_buys'] > 1:
                 for i in range(1, trade['num_buys']):
@@ -1167,15 +1083,9 @@ def main():
         )
         
         # 모든 RSI 과매도 시점 (시그널 발생)
-        all_oversold = []
-        for idx in range(len(df)):
-            rsi = df['rsi'].iloc[idx]
-            if pd.notna(rsi) and rsi < rsi_oversold:
-                all_oversold.append({
-                    'date': df.index[idx],
-                    'price': df['Close'].iloc[idx],
-                    'rsi': rsi
-                })
+        oversold = df[df['rsi'] < rsi_oversold]
+        all_oversold = [{'date': date, 'price': price, 'rsi': rsi}
+                        for date, price, rsi in zip(oversold.index, oversold['Close'], oversold['rsi'])]
         
         # 실제 매수 시그널 (탈출 확인 + 골든크로스 필터)
         actual_buy_signals = find_buy_signals(df, rsi_oversold, buy_exit_slider, use_golden_cross)
@@ -1262,15 +1172,9 @@ def main():
         )
         
         # 모든 RSI 과매수 시점 (시그널 발생)
-        all_overbought = []
-        for idx in range(len(df)):
-            rsi = df['rsi'].iloc[idx]
-            if pd.notna(rsi) and rsi > rsi_overbought:
-                all_overbought.append({
-                    'date': df.index[idx],
-                    'price': df['Close'].iloc[idx],
-                    'rsi': rsi
-                })
+        overbought = df[df['rsi'] > rsi_overbought]
+        all_overbought = [{'date': date, 'price': price, 'rsi': rsi}
+                          for date, price, rsi in zip(overbought.index, overbought['Close'], overbought['rsi'])]
         
         # 실제 매도 시그널 (탈출 확인)
         actual_sell_signals = find_sell_signals(df, rsi_overbought, sell_exit_slider)
@@ -1682,12 +1586,9 @@ def main():
         st.header("🔍 데이터 확인")
         
         cache_dir = project_root / "data" / "cache"
-        metadata_file = cache_dir / "metadata.json"
+        metadata = DataCache(str(cache_dir)).info()
         
-        if metadata_file.exists():
-            with open(metadata_file, 'r') as f:
-                metadata = json.load(f)
-            
+        if metadata:
             if ticker in metadata:
                 cache_info = metadata[ticker]
                 cached_at = cache_info.get('cached_at', 'N/A')
@@ -24,8 +24,10 @@ project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
 from src.data.cache import DataCache
-from src.data.fetcher import CoinFetcher, validate_data
+from src.data.loader import load_resampled
 from src.features.technical import TechnicalIndicators
+from src.features.cache import IndicatorCache
+from src.signals import confirm_prices, rsi_buy_signals, rsi_peak_short_signals, rsi_sell_signals
 from src.utils.helpers import load_config
 
 # 페이지 설정
@@ -42,29 +44,20 @@ def load_data(ticker: str):
     config = load_config()
     
     cache = DataCache(
-        cache_dir=str(project_root / "data" / "cache_4h"),
-        max_age_hours=1
+        cache_dir=str(project_root / "data" / "cache_1h"),
+        interval='1h',
+        grace_minutes=config.get('data', {}).get('cache_grace_minutes', 5)
     )
     
-    cache_key = f"{ticker}_4h"
-    df = cache.get(cache_key)
-    if df is None:
-        fetcher = CoinFetcher([ticker])
-        data = fetcher.fetch(period='2y', interval='4h')
-        if ticker in data:
-            df = data[ticker]
-            df, _ = validate_data(df, ticker)
-            cache.set(cache_key, df)
+    df = load_resampled(ticker, '4h', cache, period='2y',
+                        gap_method=config.get('data', {}).get('gap_repair'))
     
     if df is not None:
-        ti = TechnicalIndicators(config.get('indicators', {}))
-        df = ti.calculate_all(df)
-        
         # 이동평균선 (MA100/200 - 하락장 방어 최적화)
-        df['MA100'] = df['Close'].rolling(window=100).mean()
-        df['MA200'] = df['Close'].rolling(window=200).mean()
-        df['golden_cross'] = df['MA100'] > df['MA200']
-        df['dead_cross'] = df['MA100'] < df['MA200']
+        indicators = {**config.get('indicators', {}), 'golden_cross': {'short': 100, 'long': 200}}
+        ti = TechnicalIndicators(indicators,
+                                 cache=IndicatorCache(str(project_root / "data" / "cache_indicators")))
+        df = ti.calculate(df, ti.COLUMNS + ['MA100', 'MA200', 'golden_cross', 'dead_cross'])
     
     return df
 
@@ -73,47 +66,9 @@ def find_long_signals(df: pd.DataFrame, rsi_oversold: float = 35, rsi_exit: floa
     """
     롱 진입 시그널 찾기
     조건: RSI < rsi_oversold 후 → RSI >= rsi_exit 탈출 + 골든크로스
+    골든크로스로 거른 탈출에서도 대기 해제 (다음 과매도부터 다시 대기)
     """
-    signals = []
-    
-    in_oversold = False
-    last_signal_date = None
-    last_signal_price = None
-    last_signal_rsi = None
-    
-    for idx in range(len(df)):
-        rsi = df['rsi'].iloc[idx]
-        
-        if pd.isna(rsi):
-            continue
-        
-        golden_cross_ok = True
-        if use_golden_cross and 'golden_cross' in df.columns:
-            gc = df['golden_cross'].iloc[idx]
-            golden_cross_ok = gc if not pd.isna(gc) else False
-        
-        if rsi < rsi_oversold:
-            in_oversold = True
-            last_signal_date = df.index[idx]
-            last_signal_price = df['Close'].iloc[idx]
-            last_signal_rsi = rsi
-        else:
-            if in_oversold and rsi >= rsi_exit and last_signal_date is not None:
-                if golden_cross_ok:
-                    signals.append({
-                        'type': 'long',
-                        'signal_date': last_signal_date,
-                        'signal_price': last_signal_price,
-                        'signal_rsi': last_signal_rsi,
-                        'confirm_date': df.index[idx],
-                        'confirm_price': df['Close'].iloc[idx],
-                        'confirm_rsi': rsi,
-                        'golden_cross': golden_cross_ok
-                    })
-                in_oversold = False
-                last_signal_date = None
-    
-    return signals
+    return rsi_buy_signals(df, rsi_oversold, rsi_exit, use_golden_cross, reset_on_reject=True, kind='long')
 
 
 def find_long_exit_signals(df: pd.DataFrame, rsi_overbought: float = 80, rsi_exit: float = 55):
@@ -121,36 +76,7 @@ def find_long_exit_signals(df: pd.DataFrame, rsi_overbought: float = 80, rsi_exi
     롱 청산 시그널 찾기 (익절용)
     조건: RSI > rsi_overbought 후 → RSI <= rsi_exit 탈출
     """
-    signals = []
-    
-    in_overbought = False
-    last_signal_date = None
-    last_signal_price = None
-    
-    for idx in range(len(df)):
-        rsi = df['rsi'].iloc[idx]
-        
-        if pd.isna(rsi):
-            continue
-        
-        if rsi > rsi_overbought:
-            in_overbought = True
-            last_signal_date = df.index[idx]
-            last_signal_price = df['Close'].iloc[idx]
-        else:
-            if in_overbought and rsi <= rsi_exit and last_signal_date is not None:
-                signals.append({
-                    'type': 'long_exit',
-                    'signal_date': last_signal_date,
-                    'signal_price': last_signal_price,
-                    'confirm_date': df.index[idx],
-                    'confirm_price': df['Close'].iloc[idx],
-                    'confirm_rsi': rsi
-                })
-                in_overbought = False
-                last_signal_date = None
-    
-    return signals
+    return rsi_sell_signals(df, rsi_overbought, rsi_exit, kind='long_exit')
 
 
 def find_short_signals(df: pd.DataFrame, rsi_peak: float = 78, rsi_entry: float = 65, lookback: int = 24, dc_rsi_threshold: float = 55):
@@ -163,55 +89,7 @@ def find_short_signals(df: pd.DataFrame, rsi_peak: float = 78, rsi_entry: float
     데드크로스(하락장):
         RSI > dc_rsi_threshold → RSI <= dc_rsi_threshold 하향
     """
-    signals = []
-    
-    for idx in range(lookback, len(df)):
-        curr_rsi = df['rsi'].iloc[idx]
-        prev_rsi = df['rsi'].iloc[idx-1]
-        
-        if pd.isna(curr_rsi) or pd.isna(prev_rsi):
-            continue
-        
-        is_gc = df['golden_cross'].iloc[idx] if 'golden_cross' in df.columns else True
-        is_dc = df['dead_cross'].iloc[idx] if 'dead_cross' in df.columns else False
-        
-        # 골든크로스: RSI peak 전략
-        if is_gc:
-            recent_rsi = df['rsi'].iloc[idx-lookback:idx]
-            had_peak = any(recent_rsi > rsi_peak)
-            
-            if had_peak and prev_rsi > rsi_entry and curr_rsi <= rsi_entry:
-                peak_idx = None
-                for j in range(idx-1, max(idx-lookback, 0)-1, -1):
-                    if df['rsi'].iloc[j] > rsi_peak:
-                        peak_idx = j
-                        break
-                
-                if peak_idx is not None:
-                    signals.append({
-                        'type': 'short',
-                        'signal_date': df.index[peak_idx],
-                        'signal_price': df['Close'].iloc[peak_idx],
-                        'signal_rsi': df['rsi'].iloc[peak_idx],
-                        'confirm_date': df.index[idx],
-                        'confirm_price': df['Close'].iloc[idx],
-                        'confirm_rsi': curr_rsi
-                    })
-        
-        # 데드크로스: RSI threshold 하향 전략 (하락장 방어)
-        elif is_dc:
-            if prev_rsi > dc_rsi_threshold and curr_rsi <= dc_rsi_threshold:
-                signals.append({
-                    'type': 'short',
-                    'signal_date': df.index[idx],
-                    'signal_price': df['Close'].iloc[idx],
-                    'signal_rsi': prev_rsi,
-                    'confirm_date': df.index[idx],
-                    'confirm_price': df['Close'].iloc[idx],
-                    'confirm_rsi': curr_rsi
-                })
-    
-    return signals
+    return rsi_peak_short_signals(df, rsi_peak, rsi_entry, lookback, dc_rsi_threshold)
 
 
 def find_short_exit_signals(df: pd.DataFrame, rsi_oversold: float = 35, rsi_exit: float = 40):
@@ -219,36 +97,7 @@ def find_short_exit_signals(df: pd.DataFrame, rsi_oversold: float = 35, rsi_exit
     숏 청산 시그널 찾기 (익절용)
     조건: RSI < rsi_oversold 후 → RSI >= rsi_exit 탈출
     """
-    signals = []
-    
-    in_oversold = False
-    last_signal_date = None
-    last_signal_price = None
-    
-    for idx in range(len(df)):
-        rsi = df['rsi'].iloc[idx]
-        
-        if pd.isna(rsi):
-            continue
-        
-        if rsi < rsi_oversold:
-            in_oversold = True
-            last_signal_date = df.index[idx]
-            last_signal_price = df['Close'].iloc[idx]
-        else:
-            if in_oversold and rsi >= rsi_exit and last_signal_date is not None:
-                signals.append({
-                    'type': 'short_exit',
-                    'signal_date': last_signal_date,
-                    'signal_price': last_signal_price,
-                    'confirm_date': df.index[idx],
-                    'confirm_price': df['Close'].iloc[idx],
-                    'confirm_rsi': rsi
-                })
-                in_oversold = False
-                last_signal_date = None
-    
-    return signals
+    return rsi_buy_signals(df, rsi_oversold, rsi_exit, kind='short_exit')
 
 
 def simulate_dual_trades(df: pd.DataFrame, 
@@ -264,11 +113,11 @@ def simulate_dual_trades(df: pd.DataFrame,
     - 롱: 물타기 무제한, 수익시만 익절, 손절 -25%
     - 숏: 물타기 short_max_entries-1회, 수익시만 익절, 손절 -15%, 최대 보유 42봉(7일)
     """
-    # 시그널 날짜별 인덱싱
-    long_entry_dates = {s['confirm_date']: s for s in long_signals}
-    long_exit_dates = {s['confirm_date']: s for s in long_exit_signals}
-    short_entry_dates = {s['confirm_date']: s for s in short_signals}
-    short_exit_dates = {s['confirm_date']: s for s in short_exit_signals}
+    # 시그널 봉별 확인 가격 (시그널 없는 봉은 NaN)
+    long_entry_prices = confirm_prices(long_signals, df.index)
+    long_exit_prices = confirm_prices(long_exit_signals, df.index)
+    short_entry_prices = confirm_prices(short_signals, df.index)
+    short_exit_prices = confirm_prices(short_exit_signals, df.index)
     
     trades = []
     
@@ -303,14 +152,14 @@ def simulate_dual_trades(df: pd.DataFrame,
                 exit_reason = "손절"
             
             # 익절 체크 (수익일 때만)
-            elif current_position == 'long' and current_date in long_exit_dates:
+            elif current_position == 'long' and not np.isnan(long_exit_prices[idx]):
                 if current_return > 0:
                     exit_reason = "익절"
-                    exit_price = long_exit_dates[current_date]['confirm_price']
+                    exit_price = long_exit_prices[idx]
             
-            elif current_position == 'short' and current_date in short_exit_dates:
+            elif current_position == 'short' and not np.isnan(short_exit_prices[idx]):
                 # 숏 익절: 현재 가격 기준으로 수익 체크
-                exit_price_candidate = short_exit_dates[current_date]['confirm_price']
+                exit_price_candidate = short_exit_prices[idx]
                 candidate_return = -((exit_price_candidate / avg_price - 1) * 100)
                 if candidate_return > 0:
                     exit_reason = "익절"
@@ -350,37 +199,37 @@ def simulate_dual_trades(df: pd.DataFrame,
         # 포지션이 없을 때만 새 포지션 진입
         if current_position is None:
             # 롱 진입 체크
-            if current_date in long_entry_dates:
+            if not np.isnan(long_entry_prices[idx]):
                 current_position = 'long'
                 positions.append({
                     'date': current_date,
-                    'price': long_entry_dates[current_date]['confirm_price']
+                    'price': long_entry_prices[idx]
                 })
                 entry_bar_idx = idx
             
             # 숏 진입 체크
-            elif current_date in short_entry_dates:
+            elif not np.isnan(short_entry_prices[idx]):
                 current_position = 'short'
                 positions.append({
                     'date': current_date,
-                    'price': short_entry_dates[current_date]['confirm_price']
+                    'price': short_entry_prices[idx]
                 })
                 entry_bar_idx = idx
         
         # ===== 물타기 체크 =====
-        elif current_position == 'long' and current_date in long_entry_dates:
+        elif current_position == 'long' and not np.isnan(long_entry_prices[idx]):
             # 롱 물타기 (무제한)
             positions.append({
                 'date': current_date,
-                'price': long_entry_dates[current_date]['confirm_price']
+                'price': long_entry_prices[idx]
             })
         
-        elif current_position == 'short' and current_date in short_entry_dates:
+        elif current_position == 'short' and not np.isnan(short_entry_prices[idx]):
             # 숏 물타기 (short_max_entries까지)
             if len(positions) < short_max_entries:
                 positions.append({
                     'date': current_date,
-                    'price': short_entry_dates[current_date]['confirm_price']
+                    'price': short_entry_prices[idx]
                 })
     
     # 현재 보유 중인 포지션 정보
@@ -2,11 +2,11 @@
 대시보드 로직 그대로 복사해서 디버깅
 """
 
-import pandas as pd
 import yfinance as yf
 import sys
 sys.path.insert(0, '.')
 from src.features.technical import TechnicalIndicators
+from src.signals import rsi_peak_short_signal_set, rsi_peak_short_signals
 from src.utils.helpers import load_config
 
 # 4시간봉 데이터 (대시보드와 동일)
@@ -21,11 +21,7 @@ df = df.resample('4h').agg({
 }).dropna()
 
 ti = TechnicalIndicators(load_config().get('indicators', {}))
-df = ti.calculate_all(df)
-df['MA40'] = df['Close'].rolling(window=40).mean()
-df['MA200'] = df['Close'].rolling(window=200).mean()
-df['golden_cross'] = df['MA40'] > df['MA200']
-df['dead_cross'] = df['MA40'] < df['MA200']
+df = ti.calculate(df, ['rsi', 'MA40', 'MA200', 'golden_cross', 'dead_cross'])
 
 print('=' * 80)
 print('🔍 대시보드 로직 디버깅')
@@ -48,52 +44,17 @@ DC_RSI_THRESHOLD = 65
 
 # ===== 기존 숏 시그널 (GC/DC 구분 없음) =====
 def find_short_signals_original(df):
-    signals = []
-    for idx in range(SHORT_LOOKBACK, len(df)):
-        recent_rsi = df['rsi'].iloc[idx-SHORT_LOOKBACK:idx]
-        had_peak = any(recent_rsi > SHORT_RSI_PEAK)
-        if not had_peak:
-            continue
-        curr_rsi = df['rsi'].iloc[idx]
-        prev_rsi = df['rsi'].iloc[idx-1]
-        if pd.isna(curr_rsi) or pd.isna(prev_rsi):
-            continue
-        if prev_rsi > SHORT_RSI_ENTRY and curr_rsi <= SHORT_RSI_ENTRY:
-            signals.append({'confirm_date': df.index[idx], 'confirm_price': df['Close'].iloc[idx]})
-    return signals
+    return rsi_peak_short_signals(df, SHORT_RSI_PEAK, SHORT_RSI_ENTRY, SHORT_LOOKBACK)
 
 
 # ===== 새로운 숏 시그널 (GC/DC 구분) =====
 def find_short_signals_new(df):
-    signals = []
-    gc_signals = []
-    dc_signals = []
-    
-    for idx in range(SHORT_LOOKBACK, len(df)):
-        curr_rsi = df['rsi'].iloc[idx]
-        prev_rsi = df['rsi'].iloc[idx-1]
-        
-        if pd.isna(curr_rsi) or pd.isna(prev_rsi):
-            continue
-        
-        is_golden = df['golden_cross'].iloc[idx]
-        is_dead = df['dead_cross'].iloc[idx]
-        
-        # 골든크로스: RSI peak 전략
-        if is_golden:
-            recent_rsi = df['rsi'].iloc[idx-SHORT_LOOKBACK:idx]
-            had_peak = any(recent_rsi > SHORT_RSI_PEAK)
-            if had_peak and prev_rsi > SHORT_RSI_ENTRY and curr_rsi <= SHORT_RSI_ENTRY:
-                signals.append({'confirm_date': df.index[idx], 'confirm_price': df['Close'].iloc[idx], 'type': 'GC'})
-                gc_signals.append(df.index[idx])
-        
-        # 데드크로스: RSI 하향 전략
-        elif is_dead:
-            if prev_rsi > DC_RSI_THRESHOLD and curr_rsi <= DC_RSI_THRESHOLD:
-                signals.append({'confirm_date': df.index[idx], 'confirm_price': df['Close'].iloc[idx], 'type': 'DC'})
-                dc_signals.append(df.index[idx])
-    
-    return signals, gc_signals, dc_signals
+    # 골든크로스: RSI peak 전략, 데드크로스: RSI 하향 전략
+    signals = rsi_peak_short_signal_set(df, SHORT_RSI_PEAK, SHORT_RSI_ENTRY, SHORT_LOOKBACK,
+                                        dc_rsi_threshold=DC_RSI_THRESHOLD)
+    in_gc = df['golden_cross'].to_numpy(dtype=bool)[signals.confirm_idx]
+    dates = signals.confirm_dates
+    return signals.to_records(), list(dates[in_gc]), list(dates[~in_gc])
 
 
 # 시그널 비교
@@ -6,19 +6,17 @@ ETH 최종 전략 상세 성과 분석
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+import sys
+sys.path.insert(0, '.')
+
+from src.features.rsi import RSI
+from src.signals import rsi_buy_signals, rsi_sell_signals
 
 # 데이터 로드
 df = pd.read_csv('data/eth_4h_5y.csv', index_col='Date', parse_dates=True)
 
 # 기술 지표
-def calculate_rsi(series, period=14):
-    delta = series.diff()
-    gain = delta.where(delta > 0, 0).rolling(window=period).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-    rs = gain / loss
-    return 100 - (100 / (1 + rs))
-
-df['rsi'] = calculate_rsi(df['Close'])
+df['rsi'] = RSI(14).calculate(df['Close'])
 exp1 = df['Close'].ewm(span=12, adjust=False).mean()
 exp2 = df['Close'].ewm(span=26, adjust=False).mean()
 df['MACD'] = exp1 - exp2
@@ -38,31 +36,10 @@ HEDGE_PROFIT = 5
 HEDGE_STOP = -10
 
 def find_signals(df_period):
-    buy_signals, sell_signals = [], []
-    in_oversold, in_overbought = False, False
-    last_buy, last_sell = None, None
-    
-    for idx in range(len(df_period)):
-        rsi = df_period['rsi'].iloc[idx]
-        if pd.isna(rsi):
-            continue
-        
-        if rsi < RSI_BUY:
-            in_oversold = True
-            last_buy = df_period.index[idx]
-        elif in_oversold and rsi >= RSI_BUY_EXIT and last_buy:
-            buy_signals.append({'date': df_period.index[idx], 'price': df_period['Close'].iloc[idx]})
-            in_oversold = False
-            last_buy = None
-        
-        if rsi > RSI_SELL:
-            in_overbought = True
-            last_sell = df_period.index[idx]
-        elif in_overbought and rsi <= RSI_SELL_EXIT and last_sell:
-            sell_signals.append({'date': df_period.index[idx], 'price': df_period['Close'].iloc[idx]})
-            in_overbought = False
-            last_sell = None
-    
+    buy_signals = [{'date': s['confirm_date'], 'price': s['confirm_price']}
+                   for s in rsi_buy_signals(df_period, RSI_BUY, RSI_BUY_EXIT)]
+    sell_signals = [{'date': s['confirm_date'], 'price': s['confirm_price']}
+                    for s in rsi_sell_signals(df_period, RSI_SELL, RSI_SELL_EXIT)]
     return buy_signals, sell_signals
 
 def simulate_detailed(df_period, buy_signals, sell_signals):
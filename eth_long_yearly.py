@@ -3,19 +3,17 @@ ETH 롱 파라미터 최적화 - 상위 3개 연도별 분석
 """
 import pandas as pd
 import numpy as np
+import sys
+sys.path.insert(0, '.')
+
+from src.features.rsi import RSI
+from src.signals import rsi_buy_signals, rsi_sell_signals
 
 # 데이터 로드
 df = pd.read_csv('data/eth_4h_5y.csv', index_col='Date', parse_dates=True)
 
 # 기술 지표
-def calculate_rsi(series, period=14):
-    delta = series.diff()
-    gain = delta.where(delta > 0, 0).rolling(window=period).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-    rs = gain / loss
-    return 100 - (100 / (1 + rs))
-
-df['rsi'] = calculate_rsi(df['Close'])
+df['rsi'] = RSI(14).calculate(df['Close'])
 exp1 = df['Close'].ewm(span=12, adjust=False).mean()
 exp2 = df['Close'].ewm(span=26, adjust=False).mean()
 df['MACD'] = exp1 - exp2
@@ -37,31 +35,10 @@ param_sets = [
 ]
 
 def find_signals(df_year, rsi_buy, rsi_buy_exit, rsi_sell, rsi_sell_exit):
-    buy_signals, sell_signals = [], []
-    in_oversold, in_overbought = False, False
-    last_buy, last_sell = None, None
-    
-    for idx in range(len(df_year)):
-        rsi = df_year['rsi'].iloc[idx]
-        if pd.isna(rsi):
-            continue
-        
-        if rsi < rsi_buy:
-            in_oversold = True
-            last_buy = df_year.index[idx]
-        elif in_oversold and rsi >= rsi_buy_exit and last_buy:
-            buy_signals.append({'date': df_year.index[idx], 'price': df_year['Close'].iloc[idx]})
-            in_oversold = False
-            last_buy = None
-        
-        if rsi > rsi_sell:
-            in_overbought = True
-            last_sell = df_year.index[idx]
-        elif in_overbought and rsi <= rsi_sell_exit and last_sell:
-            sell_signals.append({'date': df_year.index[idx], 'price': df_year['Close'].iloc[idx]})
-            in_overbought = False
-            last_sell = None
-    
+    buy_signals = [{'date': s['confirm_date'], 'price': s['confirm_price']}
+                   for s in rsi_buy_signals(df_year, rsi_buy, rsi_buy_exit)]
+    sell_signals = [{'date': s['confirm_date'], 'price': s['confirm_price']}
+                    for s in rsi_sell_signals(df_year, rsi_sell, rsi_sell_exit)]
     return buy_signals, sell_signals
 
 def simulate(df_year, buy_signals, sell_signals, use_hedge=True):
@@ -4,19 +4,17 @@ ETH 연도별 성과 분석
 """
 import pandas as pd
 import numpy as np
+import sys
+sys.path.insert(0, '.')
+
+from src.features.rsi import RSI
+from src.signals import rsi_buy_signals, rsi_sell_signals
 
 # 데이터 로드
 df = pd.read_csv('data/eth_4h_5y.csv', index_col='Date', parse_dates=True)
 
 # 기술 지표 계산
-def calculate_rsi(series, period=14):
-    delta = series.diff()
-    gain = delta.where(delta > 0, 0).rolling(window=period).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-    rs = gain / loss
-    return 100 - (100 / (1 + rs))
-
-df['rsi'] = calculate_rsi(df['Close'])
+df['rsi'] = RSI(14).calculate(df['Close'])
 exp1 = df['Close'].ewm(span=12, adjust=False).mean()
 exp2 = df['Close'].ewm(span=26, adjust=False).mean()
 df['MACD'] = exp1 - exp2
@@ -35,33 +33,10 @@ HEDGE_PROFIT = 5
 HEDGE_STOP = -10
 
 def find_signals(df):
-    buy_signals, sell_signals = [], []
-    in_oversold, in_overbought = False, False
-    last_buy_date, last_sell_date = None, None
-    
-    for idx in range(len(df)):
-        rsi = df['rsi'].iloc[idx]
-        if pd.isna(rsi):
-            continue
-        
-        # 매수
-        if rsi < RSI_BUY:
-            in_oversold = True
-            last_buy_date = df.index[idx]
-        elif in_oversold and rsi >= RSI_BUY_EXIT and last_buy_date:
-            buy_signals.append({'date': df.index[idx], 'price': df['Close'].iloc[idx]})
-            in_oversold = False
-            last_buy_date = None
-        
-        # 매도
-        if rsi > RSI_SELL:
-            in_overbought = True
-            last_sell_date = df.index[idx]
-        elif in_overbought and rsi <= RSI_SELL_EXIT and last_sell_date:
-            sell_signals.append({'date': df.index[idx], 'price': df['Close'].iloc[idx]})
-            in_overbought = False
-            last_sell_date = None
-    
+    buy_signals = [{'date': s['confirm_date'], 'price': s['confirm_price']}
+                   for s in rsi_buy_signals(df, RSI_BUY, RSI_BUY_EXIT)]
+    sell_signals = [{'date': s['confirm_date'], 'price': s['confirm_price']}
+                    for s in rsi_sell_signals(df, RSI_SELL, RSI_SELL_EXIT)]
     return buy_signals, sell_signals
 
 def simulate_year(df_year, use_hedge=False):
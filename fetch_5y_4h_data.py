@@ -8,10 +8,12 @@ sys.path.insert(0, '.')
 import ccxt
 import pandas as pd
 import numpy as np
-from datetime import datetime
-import time
 import os
 
+from src.data.backfill import Backfiller
+from src.data.store import OHLCVStore
+from src.features.rsi import RSI
+
 # 대시보드 함수 import
 from dashboard_4h_dual import (
     find_long_signals,
@@ -26,81 +28,30 @@ print("📊 5년치 BTC 4시간봉 데이터 수집 및 전략 테스트")
 print("=" * 100)
 
 
-def fetch_all_4h_data(start_year=2020):
-    """OKX에서 4시간봉 데이터 전체 수집"""
+def fetch_all_4h_data(start_year=2020, symbol='BTC/USDT'):
+    """OKX에서 4시간봉 데이터 전체 수집 (페이지마다 저장소에 기록, 중단 시 이어받기)"""
     exchange = ccxt.okx()
     exchange.load_markets()
     
-    symbol = 'BTC/USDT'
     timeframe = '4h'
-    
-    # 시작일 설정
-    start_date = f'{start_year}-01-01T00:00:00Z'
-    since = exchange.parse8601(start_date)
+    start_date = f'{start_year}-01-01'
     
     print(f"\n📅 수집 시작: {start_date}")
     print(f"🔄 {symbol} {timeframe} 데이터 수집 중...")
     
-    all_candles = []
-    request_count = 0
-    
-    while True:
-        try:
-            candles = exchange.fetch_ohlcv(symbol, timeframe, since=since, limit=300)
-            
-            if not candles:
-                break
-            
-            all_candles.extend(candles)
-            request_count += 1
-            
-            # 진행 상황 출력
-            last_date = datetime.fromtimestamp(candles[-1][0] / 1000)
-            print(f"   요청 {request_count}: {len(candles)}개 캔들 (~ {last_date.strftime('%Y-%m-%d')})")
-            
-            # 마지막 캔들이 현재와 가까우면 종료
-            if candles[-1][0] >= exchange.milliseconds() - 4 * 60 * 60 * 1000:
-                break
-            
-            # 다음 요청을 위한 시작점 업데이트
-            since = candles[-1][0] + 1
-            
-            # Rate limit 방지
-            time.sleep(0.3)
-            
-        except Exception as e:
-            print(f"   ⚠️ 오류 발생: {e}")
-            time.sleep(1)
-            continue
-    
-    print(f"\n✅ 총 {len(all_candles)}개 캔들 수집 완료!")
-    
-    # DataFrame 변환
-    df = pd.DataFrame(all_candles, columns=['timestamp', 'Open', 'High', 'Low', 'Close', 'Volume'])
-    df['Date'] = pd.to_datetime(df['timestamp'], unit='ms')
-    df.set_index('Date', inplace=True)
-    df.drop('timestamp', axis=1, inplace=True)
-    
-    # 중복 제거
-    df = df[~df.index.duplicated(keep='first')]
-    df.sort_index(inplace=True)
+    backfiller = Backfiller(exchange, OHLCVStore())
+    backfiller.backfill(symbol, timeframe, start=start_date)
+    
+    df = backfiller.load(symbol, timeframe, start=start_date)
+    print(f"\n✅ 총 {len(df)}개 캔들 수집 완료!")
     
     return df
 
 
 def add_technical_indicators(df):
     """기술적 지표 추가 (대시보드와 동일)"""
-    # RSI 계산
-    delta = df['Close'].diff()
-    gain = delta.where(delta > 0, 0)
-    loss = (-delta).where(delta < 0, 0)
-    
-    avg_gain = gain.rolling(window=14, min_periods=1).mean()
-    avg_loss = loss.rolling(window=14, min_periods=1).mean()
-    
-    rs = avg_gain / avg_loss
-    df['rsi'] = 100 - (100 / (1 + rs))
-    df['rsi'] = df['rsi'].fillna(50)
+    # RSI 계산 (워밍업 구간은 있는 봉만으로 평균, 남은 NaN은 50)
+    df['rsi'] = RSI(14, warmup='expanding', fill_value=50).calculate(df['Close'])
     
     # MA 계산 (대시보드와 동일: MA100, MA200)
     df['MA100'] = df['Close'].rolling(window=100).mean()
@@ -4,11 +4,11 @@
 - 대시보드와 동일한 계산 방식
 """
 
-import pandas as pd
 import sys
 sys.path.insert(0, '.')
 from src.data.cache import DataCache
 from src.features.technical import TechnicalIndicators
+from src.signals import rsi_buy_signals, rsi_sell_signals, rsi_peak_short_signals
 from src.utils.helpers import load_config
 
 # 일봉 데이터 로드
@@ -16,7 +16,7 @@ cache = DataCache(cache_dir='data/cache', max_age_hours=24)
 df = cache.get('BTC-USD_1d')
 
 ti = TechnicalIndicators(load_config().get('indicators', {}))
-df = ti.calculate_all(df)
+df = ti.calculate(df, ['rsi'])  # MA는 전략별 기간으로 아래에서 계산
 
 print('=' * 80)
 print('📊 일봉 5년 데이터 최종 비교')
@@ -51,83 +51,19 @@ def run_simulation(df, ma_short, ma_long, use_dc_short=False, label=""):
     df['dead_cross'] = df[f'MA{ma_short}'] < df[f'MA{ma_long}']
     
     # 롱 시그널
-    long_signals = []
-    in_oversold = False
-    last_date = None
-    
-    for idx in range(len(df)):
-        rsi = df['rsi'].iloc[idx]
-        gc = df['golden_cross'].iloc[idx]
-        if pd.isna(rsi) or pd.isna(gc):
-            continue
-        if rsi < LONG_RSI_OVERSOLD:
-            in_oversold = True
-            last_date = df.index[idx]
-        else:
-            if in_oversold and rsi >= LONG_RSI_EXIT and last_date and gc:
-                long_signals.append({'confirm_date': df.index[idx], 'confirm_price': df['Close'].iloc[idx]})
-                in_oversold = False
-                last_date = None
+    long_signals = rsi_buy_signals(df, LONG_RSI_OVERSOLD, LONG_RSI_EXIT, use_golden_cross=True,
+                                   missing_filter='skip')
     
     # 롱 청산 시그널
-    long_exit_signals = []
-    in_ob = False
-    last_date = None
-    for idx in range(len(df)):
-        rsi = df['rsi'].iloc[idx]
-        if pd.isna(rsi):
-            continue
-        if rsi > LONG_RSI_OVERBOUGHT:
-            in_ob = True
-            last_date = df.index[idx]
-        else:
-            if in_ob and rsi <= LONG_RSI_SELL and last_date:
-                long_exit_signals.append({'confirm_date': df.index[idx], 'confirm_price': df['Close'].iloc[idx]})
-                in_ob = False
-                last_date = None
+    long_exit_signals = rsi_sell_signals(df, LONG_RSI_OVERBOUGHT, LONG_RSI_SELL)
     
     # 숏 시그널
-    short_signals = []
-    for idx in range(SHORT_LOOKBACK, len(df)):
-        curr_rsi = df['rsi'].iloc[idx]
-        prev_rsi = df['rsi'].iloc[idx-1]
-        is_golden = df['golden_cross'].iloc[idx]
-        is_dead = df['dead_cross'].iloc[idx]
-        
-        if pd.isna(curr_rsi) or pd.isna(prev_rsi) or pd.isna(is_golden):
-            continue
-        
-        if use_dc_short:
-            if is_golden:
-                recent_rsi = df['rsi'].iloc[idx-SHORT_LOOKBACK:idx]
-                had_peak = any(recent_rsi > SHORT_RSI_PEAK)
-                if had_peak and prev_rsi > SHORT_RSI_ENTRY and curr_rsi <= SHORT_RSI_ENTRY:
-                    short_signals.append({'confirm_date': df.index[idx], 'confirm_price': df['Close'].iloc[idx], 'type': 'GC'})
-            elif is_dead:
-                if prev_rsi > DC_RSI_THRESHOLD and curr_rsi <= DC_RSI_THRESHOLD:
-                    short_signals.append({'confirm_date': df.index[idx], 'confirm_price': df['Close'].iloc[idx], 'type': 'DC'})
-        else:
-            recent_rsi = df['rsi'].iloc[idx-SHORT_LOOKBACK:idx]
-            had_peak = any(recent_rsi > SHORT_RSI_PEAK)
-            if had_peak and prev_rsi > SHORT_RSI_ENTRY and curr_rsi <= SHORT_RSI_ENTRY:
-                short_signals.append({'confirm_date': df.index[idx], 'confirm_price': df['Close'].iloc[idx], 'type': 'orig'})
+    # 개선 전략: GC는 RSI peak 후 하락, DC는 RSI threshold 하향 / 기존 전략: GC/DC 무관, RSI peak만
+    short_signals = rsi_peak_short_signals(df, SHORT_RSI_PEAK, SHORT_RSI_ENTRY, SHORT_LOOKBACK,
+                                           dc_rsi_threshold=DC_RSI_THRESHOLD if use_dc_short else None)
     
     # 숏 청산 시그널
-    short_exit_signals = []
-    in_os = False
-    last_date = None
-    for idx in range(len(df)):
-        rsi = df['rsi'].iloc[idx]
-        if pd.isna(rsi):
-            continue
-        if rsi < LONG_RSI_OVERSOLD:
-            in_os = True
-            last_date = df.index[idx]
-        else:
-            if in_os and rsi >= SHORT_RSI_EXIT and last_date:
-                short_exit_signals.append({'confirm_date': df.index[idx], 'confirm_price': df['Close'].iloc[idx]})
-                in_os = False
-                last_date = None
+    short_exit_signals = rsi_buy_signals(df, LONG_RSI_OVERSOLD, SHORT_RSI_EXIT)
     
     # 시뮬레이션
     le = {s['confirm_date']: s for s in long_signals}
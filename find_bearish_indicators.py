@@ -7,6 +7,8 @@ sys.path.insert(0, '.')
 import pandas as pd
 import numpy as np
 
+from src.features.technical import TechnicalIndicators, trim_warmup
+from src.features.rsi import RSI
 from dashboard_4h import (
     find_buy_signals,
     find_sell_signals,
@@ -27,22 +29,20 @@ USE_GOLDEN_CROSS = False
 
 # 데이터 로드
 df = pd.read_csv("data/btc_4h_5y.csv", index_col=0, parse_dates=True)
-df = df.dropna()
+df = trim_warmup(df)  # MA 워밍업 구간 제외 (복사 없이 슬라이스)
 print(f"데이터: {df.index[0]} ~ {df.index[-1]} ({len(df)}봉)\n")
 
 # ===== 다양한 지표 계산 =====
 print("📈 지표 계산 중...")
 
-# 기본 MA
-for period in [20, 50, 100, 200]:
-    df[f'MA{period}'] = df['Close'].rolling(period).mean()
+# 기본 MA (누적합 한 번으로 전체 기간 계산)
+MA_PERIODS = [20, 50, 100, 200]
+ma_matrix = TechnicalIndicators.sma_matrix(df['Close'], MA_PERIODS)
+for j, period in enumerate(MA_PERIODS):
+    df[f'MA{period}'] = ma_matrix[:, j]
 
 # RSI
-delta = df['Close'].diff()
-gain = delta.where(delta > 0, 0).rolling(14).mean()
-loss = (-delta.where(delta < 0, 0)).rolling(14).mean()
-rs = gain / loss
-df['RSI'] = 100 - (100 / (1 + rs))
+df['RSI'] = RSI(14).calculate(df['Close'])
 
 # MACD
 exp12 = df['Close'].ewm(span=12).mean()
@@ -67,8 +67,10 @@ df['ATR'] = tr.rolling(14).mean()
 df['ATR_pct'] = df['ATR'] / df['Close'] * 100
 
 # 최근 고점 대비 하락률
-for lookback in [30, 60, 90, 120]:
-    df[f'high_{lookback}'] = df['High'].rolling(lookback).max()
+LOOKBACKS = [30, 60, 90, 120]
+high_matrix = TechnicalIndicators.rolling_max_matrix(df['High'], LOOKBACKS)
+for j, lookback in enumerate(LOOKBACKS):
+    df[f'high_{lookback}'] = high_matrix[:, j]
     df[f'drawdown_{lookback}'] = (df['Close'] - df[f'high_{lookback}']) / df[f'high_{lookback}'] * 100
 
 # N일 연속 하락
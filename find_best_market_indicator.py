@@ -17,6 +17,8 @@ import numpy as np
 
 # 대시보드 함수 import
 from dashboard_4h import find_buy_signals, find_sell_signals, simulate_trades
+from src.features.extremes import rolling_max, rolling_min
+from src.features.timeframe import add_higher_timeframe
 
 print("=" * 120)
 print("🔬 상승장/하락장 판별 방법 체계적 테스트")
@@ -57,10 +59,10 @@ def add_indicators(df):
     df['return_100'] = (df['Close'] / df['Close'].shift(100) - 1) * 100
     
     # 고점/저점 대비 위치
-    df['high_20'] = df['High'].rolling(window=20).max()
-    df['low_20'] = df['Low'].rolling(window=20).min()
-    df['high_50'] = df['High'].rolling(window=50).max()
-    df['low_50'] = df['Low'].rolling(window=50).min()
+    df['high_20'] = rolling_max(df['High'], 20)
+    df['low_20'] = rolling_min(df['Low'], 20)
+    df['high_50'] = rolling_max(df['High'], 50)
+    df['low_50'] = rolling_min(df['Low'], 50)
     
     # 고점 대비 하락률
     df['drawdown_20'] = (df['Close'] / df['high_20'] - 1) * 100
@@ -70,6 +72,14 @@ def add_indicators(df):
     df['rsi_avg_10'] = df['rsi'].rolling(window=10).mean()
     df['rsi_avg_20'] = df['rsi'].rolling(window=20).mean()
     
+    # 상위 봉 추세 (4시간봉에서 일봉/주봉 파생, 마감된 봉 값만 사용)
+    df = add_higher_timeframe(df, '1d', lambda d: {
+        'MA200': d['Close'].rolling(window=200).mean(),
+    })
+    df = add_higher_timeframe(df, '1w', lambda d: {
+        'MA20_slope': d['Close'].rolling(window=20).mean().pct_change() * 100,
+    })
+    
     return df
 
 
@@ -124,6 +134,14 @@ def is_bull_drawdown_very_small(row):
     """고점 대비 -5% 이내면 상승장"""
     return row['drawdown_50'] > -5 if pd.notna(row['drawdown_50']) else None
 
+def is_bull_price_above_daily_ma200(row):
+    """일봉 MA200 (약 200일) 위면 상승장"""
+    return row['Close'] > row['1d_MA200'] if pd.notna(row['1d_MA200']) else None
+
+def is_bull_weekly_ma20_slope_positive(row):
+    """마지막으로 마감된 주봉 MA20이 오르고 있으면 상승장"""
+    return row['1w_MA20_slope'] > 0 if pd.notna(row['1w_MA20_slope']) else None
+
 def is_bull_combo_1(row):
     """복합: 가격 > MA200 AND MA50 기울기 양수"""
     if pd.isna(row['MA200']) or pd.isna(row['MA50_slope']):
@@ -160,6 +178,8 @@ INDICATORS = [
     ("RSI 평균(20) > 50", is_bull_rsi_avg_above_50),
     ("고점대비 -10% 이내", is_bull_drawdown_small),
     ("고점대비 -5% 이내", is_bull_drawdown_very_small),
+    ("가격 > 일봉 MA200", is_bull_price_above_daily_ma200),
+    ("주봉 MA20 기울기 양수", is_bull_weekly_ma20_slope_positive),
     ("복합: 가격>MA200 + MA50기울기↑", is_bull_combo_1),
     ("복합: GC + RSI>50", is_bull_combo_2),
     ("복합: 가격>MA100 + 50봉수익↑", is_bull_combo_3),
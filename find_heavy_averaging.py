@@ -7,6 +7,7 @@ sys.path.insert(0, '.')
 
 import pandas as pd
 
+from src.features.technical import trim_warmup
 from dashboard_4h import (
     find_buy_signals,
     find_sell_signals,
@@ -28,7 +29,7 @@ USE_GOLDEN_CROSS = False
 # 데이터 로드
 print("\n📊 데이터 로드...")
 df = pd.read_csv("data/btc_4h_5y.csv", index_col=0, parse_dates=True)
-df = df.dropna()
+df = trim_warmup(df)  # MA 워밍업 구간 제외 (복사 없이 슬라이스)
 print(f"   기간: {df.index[0]} ~ {df.index[-1]} ({len(df)}봉)")
 
 # 시그널 및 시뮬레이션
@@ -15,52 +15,32 @@ from tqdm import tqdm
 from src.data.cache import DataCache
 from src.data.fetcher import CoinFetcher, validate_data
 from src.features.technical import TechnicalIndicators
+from src.signals import (confirm_prices, rsi_buy_signal_set, rsi_sell_signal_set,
+                         rsi_buy_signal_sets, rsi_sell_signal_sets)
 
 
 def find_buy_signals(df, rsi_oversold, rsi_exit):
-    signals = []
-    in_oversold = False
-    
-    for i in range(len(df)):
-        row = df.iloc[i]
-        current_rsi = row.get('rsi', 50)
-        
-        if current_rsi < rsi_oversold and not in_oversold:
-            in_oversold = True
-        elif in_oversold and current_rsi >= rsi_exit:
-            signals.append({
-                'confirm_date': df.index[i],
-                'confirm_price': row['Close']
-            })
-            in_oversold = False
-    
-    return signals
+    return rsi_buy_signal_set(df, rsi_oversold, rsi_exit, anchor='first')
 
 
 def find_sell_signals(df, rsi_overbought, rsi_exit):
-    signals = []
-    in_overbought = False
-    
-    for i in range(len(df)):
-        row = df.iloc[i]
-        current_rsi = row.get('rsi', 50)
-        
-        if current_rsi > rsi_overbought and not in_overbought:
-            in_overbought = True
-        elif in_overbought and current_rsi <= rsi_exit:
-            signals.append({
-                'confirm_date': df.index[i],
-                'confirm_price': row['Close']
-            })
-            in_overbought = False
-    
-    return signals
+    return rsi_sell_signal_set(df, rsi_overbought, rsi_exit, anchor='first')
+
+
+def find_buy_signal_grid(df, pairs):
+    """find_buy_signals를 (rsi_oversold, rsi_exit) 조합 전체에 한 번에 ({조합: 시그널})"""
+    return rsi_buy_signal_sets(df, pairs, anchor='first')
+
+
+def find_sell_signal_grid(df, pairs):
+    """find_sell_signals를 (rsi_overbought, rsi_exit) 조합 전체에 한 번에"""
+    return rsi_sell_signal_sets(df, pairs, anchor='first')
 
 
 def simulate_new_strategy(df, buy_signals, sell_signals, stop_loss=-25):
     """새 전략: 수익일 때만 매도"""
-    all_buy_dates = {bs['confirm_date']: bs for bs in buy_signals}
-    all_sell_dates = {ss['confirm_date']: ss for ss in sell_signals}
+    buy_prices = confirm_prices(buy_signals, df.index)
+    sell_prices = confirm_prices(sell_signals, df.index)
     
     trades = []
     positions = []
@@ -78,8 +58,8 @@ def simulate_new_strategy(df, buy_signals, sell_signals, stop_loss=-25):
             
             if current_return <= stop_loss:
                 exit_reason = "손절"
-            elif current_date in all_sell_dates:
-                sell_price = all_sell_dates[current_date]['confirm_price']
+            elif not np.isnan(sell_prices[idx]):
+                sell_price = sell_prices[idx]
                 sell_return = (sell_price / avg_price - 1) * 100
                 if sell_return > 0:
                     exit_reason = "익절"
@@ -90,10 +70,10 @@ def simulate_new_strategy(df, buy_signals, sell_signals, stop_loss=-25):
                 trades.append({'return': final_return})
                 positions = []
         
-        if current_date in all_buy_dates:
+        if not np.isnan(buy_prices[idx]):
             positions.append({
                 'date': current_date,
-                'price': all_buy_dates[current_date]['confirm_price']
+                'price': buy_prices[idx]
             })
     
     return trades, len(positions)
@@ -129,7 +109,7 @@ def main():
         df_4h, _ = validate_data(df_4h, ticker)
         cache_4h.set(f'{ticker}_4h', df_4h)
     
-    df_4h = ti.calculate_all(df_4h)
+    df_4h = ti.calculate(df_4h, ['rsi'])
     print(f"   기간: {df_4h.index[0].strftime('%Y-%m-%d')} ~ {df_4h.index[-1].strftime('%Y-%m-%d')}")
     
     # 일봉 5년 로드
@@ -144,7 +124,7 @@ def main():
         df_1d, _ = validate_data(df_1d, ticker)
         cache_1d.set(f'{ticker}_1d', df_1d)
     
-    df_1d = ti.calculate_all(df_1d)
+    df_1d = ti.calculate(df_1d, ['rsi'])
     print(f"   기간: {df_1d.index[0].strftime('%Y-%m-%d')} ~ {df_1d.index[-1].strftime('%Y-%m-%d')}")
     print()
     
@@ -162,6 +142,14 @@ def main():
     results = []
     combinations = list(product(oversold_range, buy_exit_range, overbought_range, sell_exit_range))
     
+    # 시그널은 임계값 쌍에만 의존 - 루프에서 쓰는 쌍 전체를 미리 한 번에 계산
+    buy_pairs = [(o, e) for o, e in product(oversold_range, buy_exit_range) if e > o]
+    sell_pairs = [(o, e) for o, e in product(overbought_range, sell_exit_range) if e < o]
+    buy_grid_4h = find_buy_signal_grid(df_4h, buy_pairs)
+    sell_grid_4h = find_sell_signal_grid(df_4h, sell_pairs)
+    buy_grid_1d = find_buy_signal_grid(df_1d, buy_pairs)
+    sell_grid_1d = find_sell_signal_grid(df_1d, sell_pairs)
+    
     for oversold, buy_exit, overbought, sell_exit in tqdm(combinations, desc="최적화"):
         if buy_exit <= oversold:
             continue
@@ -169,14 +157,14 @@ def main():
             continue
         
         # 4시간봉 테스트
-        buy_4h = find_buy_signals(df_4h, oversold, buy_exit)
-        sell_4h = find_sell_signals(df_4h, overbought, sell_exit)
+        buy_4h = buy_grid_4h[(oversold, buy_exit)]
+        sell_4h = sell_grid_4h[(overbought, sell_exit)]
         trades_4h, pos_4h = simulate_new_strategy(df_4h, buy_4h, sell_4h)
         return_4h = calc_return(trades_4h)
         
         # 일봉 테스트
-        buy_1d = find_buy_signals(df_1d, oversold, buy_exit)
-        sell_1d = find_sell_signals(df_1d, overbought, sell_exit)
+        buy_1d = buy_grid_1d[(oversold, buy_exit)]
+        sell_1d = sell_grid_1d[(overbought, sell_exit)]
         trades_1d, pos_1d = simulate_new_strategy(df_1d, buy_1d, sell_1d)
         return_1d = calc_return(trades_1d)
         
@@ -2,20 +2,19 @@
 데드크로스 숏 RSI 임계값 최적화 (일봉 5년)
 """
 
-import pandas as pd
 import sys
 sys.path.insert(0, '.')
 from src.data.cache import DataCache
 from src.features.technical import TechnicalIndicators
+from src.signals import cross_below
 from src.utils.helpers import load_config
 
 cache = DataCache(cache_dir='data/cache', max_age_hours=24)
 df = cache.get('BTC-USD_1d')
 ti = TechnicalIndicators(load_config().get('indicators', {}))
-df = ti.calculate_all(df)
-df['MA40'] = df['Close'].rolling(window=40).mean()
-df['MA200'] = df['Close'].rolling(window=200).mean()
-df['dead_cross'] = df['MA40'] < df['MA200']
+COLUMNS = ['rsi', 'MA40', 'MA200', 'dead_cross']
+df = ti.calculate(df, COLUMNS)
+WARMUP = ti.lookback(COLUMNS) + 1  # 전 봉 RSI까지 유효한 첫 봉
 
 print('=' * 80)
 print('🔍 데드크로스 숏 RSI 임계값 최적화 (일봉 5년)')
@@ -24,19 +23,16 @@ print('=' * 80)
 # RSI 임계값 테스트
 rsi_thresholds = [40, 42, 45, 48, 50, 52, 55, 58, 60, 62, 65]
 
+rsi = df['rsi'].to_numpy(dtype=float)
+dead = df['dead_cross'].to_numpy(dtype=bool)
+close = df['Close'].to_numpy()
+
 results = []
 for rsi_th in rsi_thresholds:
-    signals = []
-    for idx in range(200, len(df)):
-        is_dead = df['dead_cross'].iloc[idx]
-        rsi = df['rsi'].iloc[idx]
-        prev_rsi = df['rsi'].iloc[idx-1]
-        
-        if pd.isna(rsi) or pd.isna(prev_rsi):
-            continue
-        
-        if is_dead and prev_rsi > rsi_th and rsi <= rsi_th:
-            signals.append({'date': df.index[idx], 'price': df['Close'].iloc[idx], 'idx': idx})
+    # 데드크로스 봉에서 RSI가 rsi_th를 하향 돌파
+    entry = cross_below(rsi, rsi_th)
+    entry = entry[(entry >= WARMUP) & dead[entry]]
+    signals = [{'date': df.index[idx], 'price': close[idx], 'idx': idx} for idx in entry]
     
     # 시뮬레이션 (14일 보유, -15% 손절, profit_only)
     trades = []
@@ -15,8 +15,11 @@ project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
 from src.data.cache import DataCache
-from src.data.fetcher import CoinFetcher, validate_data
+from src.data.loader import load_resampled
 from src.features.technical import TechnicalIndicators
+from src.features.cache import IndicatorCache
+from src.signals import (confirm_prices, rsi_buy_signal_set, rsi_peak_short_signal_set,
+                         rsi_peak_short_signal_sets, rsi_sell_signal_set)
 from src.utils.helpers import load_config
 
 
@@ -25,28 +28,19 @@ def load_data(ticker: str):
     config = load_config()
     
     cache = DataCache(
-        cache_dir=str(project_root / "data" / "cache_4h"),
-        max_age_hours=1
+        cache_dir=str(project_root / "data" / "cache_1h"),
+        interval='1h',
+        grace_minutes=config.get('data', {}).get('cache_grace_minutes', 5)
     )
     
-    cache_key = f"{ticker}_4h"
-    df = cache.get(cache_key)
-    if df is None:
-        fetcher = CoinFetcher([ticker])
-        data = fetcher.fetch(period='2y', interval='4h')
-        if ticker in data:
-            df = data[ticker]
-            df, _ = validate_data(df, ticker)
-            cache.set(cache_key, df)
+    df = load_resampled(ticker, '4h', cache, period='2y',
+                        gap_method=config.get('data', {}).get('gap_repair'))
     
     if df is not None:
-        ti = TechnicalIndicators(config.get('indicators', {}))
-        df = ti.calculate_all(df)
-        
-        # 이동평균선
-        df['MA40'] = df['Close'].rolling(window=40).mean()
-        df['MA200'] = df['Close'].rolling(window=200).mean()
-        df['golden_cross'] = df['MA40'] > df['MA200']
+        ti = TechnicalIndicators(config.get('indicators', {}),
+                                 cache=IndicatorCache(str(project_root / "data" / "cache_indicators")))
+        # 기본 지표 + 이동평균선
+        df = ti.calculate(df, ti.COLUMNS + ['MA40', 'MA200', 'golden_cross'])
     
     return df
 
@@ -55,152 +49,22 @@ def load_data(ticker: str):
 
 def find_long_signals(df: pd.DataFrame, rsi_oversold: float = 35, rsi_exit: float = 40, use_golden_cross: bool = True):
     """롱 진입 시그널 (대시보드와 동일)"""
-    signals = []
-    
-    in_oversold = False
-    last_signal_date = None
-    last_signal_price = None
-    last_signal_rsi = None
-    
-    for idx in range(len(df)):
-        rsi = df['rsi'].iloc[idx]
-        
-        if pd.isna(rsi):
-            continue
-        
-        golden_cross_ok = True
-        if use_golden_cross and 'golden_cross' in df.columns:
-            gc = df['golden_cross'].iloc[idx]
-            golden_cross_ok = gc if not pd.isna(gc) else False
-        
-        if rsi < rsi_oversold:
-            in_oversold = True
-            last_signal_date = df.index[idx]
-            last_signal_price = df['Close'].iloc[idx]
-            last_signal_rsi = rsi
-        else:
-            if in_oversold and rsi >= rsi_exit and last_signal_date is not None:
-                if golden_cross_ok:
-                    signals.append({
-                        'type': 'long',
-                        'signal_date': last_signal_date,
-                        'signal_price': last_signal_price,
-                        'signal_rsi': last_signal_rsi,
-                        'confirm_date': df.index[idx],
-                        'confirm_price': df['Close'].iloc[idx],
-                        'confirm_rsi': rsi,
-                        'golden_cross': golden_cross_ok
-                    })
-                in_oversold = False
-                last_signal_date = None
-    
-    return signals
+    return rsi_buy_signal_set(df, rsi_oversold, rsi_exit, use_golden_cross, reset_on_reject=True, kind='long')
 
 
 def find_long_exit_signals(df: pd.DataFrame, rsi_overbought: float = 80, rsi_exit: float = 55):
     """롱 청산 시그널 (대시보드와 동일)"""
-    signals = []
-    
-    in_overbought = False
-    last_signal_date = None
-    last_signal_price = None
-    
-    for idx in range(len(df)):
-        rsi = df['rsi'].iloc[idx]
-        
-        if pd.isna(rsi):
-            continue
-        
-        if rsi > rsi_overbought:
-            in_overbought = True
-            last_signal_date = df.index[idx]
-            last_signal_price = df['Close'].iloc[idx]
-        else:
-            if in_overbought and rsi <= rsi_exit and last_signal_date is not None:
-                signals.append({
-                    'type': 'long_exit',
-                    'signal_date': last_signal_date,
-                    'signal_price': last_signal_price,
-                    'confirm_date': df.index[idx],
-                    'confirm_price': df['Close'].iloc[idx],
-                    'confirm_rsi': rsi
-                })
-                in_overbought = False
-                last_signal_date = None
-    
-    return signals
+    return rsi_sell_signal_set(df, rsi_overbought, rsi_exit, kind='long_exit')
 
 
 def find_short_signals(df: pd.DataFrame, rsi_peak: float = 80, rsi_exit: float = 70, lookback: int = 30):
     """숏 진입 시그널 (대시보드와 동일)"""
-    signals = []
-    
-    for idx in range(lookback, len(df)):
-        recent_rsi = df['rsi'].iloc[idx-lookback:idx]
-        had_peak = any(recent_rsi > rsi_peak)
-        
-        if not had_peak:
-            continue
-        
-        curr_rsi = df['rsi'].iloc[idx]
-        prev_rsi = df['rsi'].iloc[idx-1]
-        
-        if pd.isna(curr_rsi) or pd.isna(prev_rsi):
-            continue
-        
-        if prev_rsi > rsi_exit and curr_rsi <= rsi_exit:
-            peak_idx = None
-            for j in range(idx-1, max(idx-lookback, 0)-1, -1):
-                if df['rsi'].iloc[j] > rsi_peak:
-                    peak_idx = j
-                    break
-            
-            if peak_idx is not None:
-                signals.append({
-                    'type': 'short',
-                    'signal_date': df.index[peak_idx],
-                    'signal_price': df['Close'].iloc[peak_idx],
-                    'signal_rsi': df['rsi'].iloc[peak_idx],
-                    'confirm_date': df.index[idx],
-                    'confirm_price': df['Close'].iloc[idx],
-                    'confirm_rsi': curr_rsi
-                })
-    
-    return signals
+    return rsi_peak_short_signal_set(df, rsi_peak, rsi_exit, lookback)
 
 
 def find_short_exit_signals(df: pd.DataFrame, rsi_oversold: float = 35, rsi_exit: float = 40):
     """숏 청산 시그널 (대시보드와 동일)"""
-    signals = []
-    
-    in_oversold = False
-    last_signal_date = None
-    last_signal_price = None
-    
-    for idx in range(len(df)):
-        rsi = df['rsi'].iloc[idx]
-        
-        if pd.isna(rsi):
-            continue
-        
-        if rsi < rsi_oversold:
-            in_oversold = True
-            last_signal_date = df.index[idx]
-            last_signal_price = df['Close'].iloc[idx]
-        else:
-            if in_oversold and rsi >= rsi_exit and last_signal_date is not None:
-                signals.append({
-                    'type': 'short_exit',
-                    'signal_date': last_signal_date,
-                    'signal_price': last_signal_price,
-                    'confirm_date': df.index[idx],
-                    'confirm_price': df['Close'].iloc[idx],
-                    'confirm_rsi': rsi
-                })
-                in_oversold = False
-                last_signal_date = None
-    
-    return signals
+    return rsi_buy_signal_set(df, rsi_oversold, rsi_exit, kind='short_exit')
 
 
 def simulate_dual_trades(df: pd.DataFrame, 
@@ -216,10 +80,10 @@ def simulate_dual_trades(df: pd.DataFrame,
     - 롱: 물타기 무제한, 수익시만 익절, 손절 long_stop_loss
     - 숏: 물타기 short_max_entries-1회까지, 수익시만 익절, 손절 short_stop_loss, 최대 보유 short_max_hold봉
     """
-    long_entry_dates = {s['confirm_date']: s for s in long_signals}
-    long_exit_dates = {s['confirm_date']: s for s in long_exit_signals}
-    short_entry_dates = {s['confirm_date']: s for s in short_signals}
-    short_exit_dates = {s['confirm_date']: s for s in short_exit_signals}
+    long_entry_prices = confirm_prices(long_signals, df.index)
+    long_exit_prices = confirm_prices(long_exit_signals, df.index)
+    short_entry_prices = confirm_prices(short_signals, df.index)
+    short_exit_prices = confirm_prices(short_exit_signals, df.index)
     
     trades = []
     
@@ -251,13 +115,13 @@ def simulate_dual_trades(df: pd.DataFrame,
                 exit_reason = "손절"
             
             # 익절 체크
-            elif current_position == 'long' and current_date in long_exit_dates:
+            elif current_position == 'long' and not np.isnan(long_exit_prices[idx]):
                 if current_return > 0:
                     exit_reason = "익절"
-                    exit_price = long_exit_dates[current_date]['confirm_price']
+                    exit_price = long_exit_prices[idx]
             
-            elif current_position == 'short' and current_date in short_exit_dates:
-                exit_price_candidate = short_exit_dates[current_date]['confirm_price']
+            elif current_position == 'short' and not np.isnan(short_exit_prices[idx]):
+                exit_price_candidate = short_exit_prices[idx]
                 candidate_return = -((exit_price_candidate / avg_price - 1) * 100)
                 if candidate_return > 0:
                     exit_reason = "익절"
@@ -294,36 +158,36 @@ def simulate_dual_trades(df: pd.DataFrame,
         
         # ===== 신규 진입 체크 =====
         if current_position is None:
-            if current_date in long_entry_dates:
+            if not np.isnan(long_entry_prices[idx]):
                 current_position = 'long'
                 positions.append({
                     'date': current_date,
-                    'price': long_entry_dates[current_date]['confirm_price']
+                    'price': long_entry_prices[idx]
                 })
                 entry_bar_idx = idx
             
-            elif current_date in short_entry_dates:
+            elif not np.isnan(short_entry_prices[idx]):
                 current_position = 'short'
                 positions.append({
                     'date': current_date,
-                    'price': short_entry_dates[current_date]['confirm_price']
+                    'price': short_entry_prices[idx]
                 })
                 entry_bar_idx = idx
         
         # ===== 물타기 체크 =====
-        elif current_position == 'long' and current_date in long_entry_dates:
+        elif current_position == 'long' and not np.isnan(long_entry_prices[idx]):
             # 롱 물타기 (무제한)
             positions.append({
                 'date': current_date,
-                'price': long_entry_dates[current_date]['confirm_price']
+                'price': long_entry_prices[idx]
             })
         
-        elif current_position == 'short' and current_date in short_entry_dates:
+        elif current_position == 'short' and not np.isnan(short_entry_prices[idx]):
             # 숏 물타기 (short_max_entries까지)
             if len(positions) < short_max_entries:
                 positions.append({
                     'date': current_date,
-                    'price': short_entry_dates[current_date]['confirm_price']
+                    'price': short_entry_prices[idx]
                 })
     
     return trades
@@ -416,6 +280,12 @@ def optimize_dual_strategy(df: pd.DataFrame,
     
     print(f"총 {len(combinations)}개 조합 테스트 중...")
     
+    # 숏 진입 시그널은 (rsi_peak, rsi_entry, lookback)에만 의존 - 서로 다른 조합만 미리 일괄 계산
+    short_signal_sets = rsi_peak_short_signal_sets(df, {
+        (params['rsi_peak'], params['rsi_entry'], params['lookback'])
+        for params in (dict(zip(param_keys, combo)) for combo in combinations)
+    })
+    
     results = []
     
     for i, combo in enumerate(combinations):
@@ -425,12 +295,7 @@ def optimize_dual_strategy(df: pd.DataFrame,
             progress_callback(i, len(combinations))
         
         # 숏 시그널 생성
-        short_signals = find_short_signals(
-            df,
-            params['rsi_peak'],
-            params['rsi_entry'],
-            params['lookback']
-        )
+        short_signals = short_signal_sets[(params['rsi_peak'], params['rsi_entry'], params['lookback'])]
         short_exit_signals = find_short_exit_signals(
             df,
             long_params['rsi_oversold'],  # 숏 청산도 롱 과매도 기준 사용
@@ -7,6 +7,11 @@ import pandas as pd
 import numpy as np
 from itertools import product
 import time
+import sys
+sys.path.insert(0, '.')
+
+from src.features.rsi import RSI
+from src.signals import rsi_buy_signals, rsi_sell_signals
 
 # 데이터 로드
 df = pd.read_csv('data/eth_4h_5y.csv', index_col='Date', parse_dates=True)
@@ -17,14 +22,7 @@ print(f'데이터: {df.index[0].strftime("%Y-%m-%d")} ~ {df.index[-1].strftime("
 print()
 
 # 기술 지표 계산
-def calculate_rsi(series, period=14):
-    delta = series.diff()
-    gain = delta.where(delta > 0, 0).rolling(window=period).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-    rs = gain / loss
-    return 100 - (100 / (1 + rs))
-
-df['rsi'] = calculate_rsi(df['Close'])
+df['rsi'] = RSI(14).calculate(df['Close'])
 exp1 = df['Close'].ewm(span=12, adjust=False).mean()
 exp2 = df['Close'].ewm(span=26, adjust=False).mean()
 df['MACD'] = exp1 - exp2
@@ -41,44 +39,12 @@ HEDGE_PROFIT = 5
 HEDGE_STOP = -10
 
 def find_buy_signals(df, rsi_buy, rsi_buy_exit):
-    buy_signals = []
-    in_oversold = False
-    last_date = None
-    
-    for idx in range(len(df)):
-        rsi = df['rsi'].iloc[idx]
-        if pd.isna(rsi):
-            continue
-        
-        if rsi < rsi_buy:
-            in_oversold = True
-            last_date = df.index[idx]
-        elif in_oversold and rsi >= rsi_buy_exit and last_date:
-            buy_signals.append({'date': df.index[idx], 'price': df['Close'].iloc[idx]})
-            in_oversold = False
-            last_date = None
-    
-    return buy_signals
+    return [{'date': s['confirm_date'], 'price': s['confirm_price']}
+            for s in rsi_buy_signals(df, rsi_buy, rsi_buy_exit)]
 
 def find_sell_signals(df, rsi_sell, rsi_sell_exit):
-    sell_signals = []
-    in_overbought = False
-    last_date = None
-    
-    for idx in range(len(df)):
-        rsi = df['rsi'].iloc[idx]
-        if pd.isna(rsi):
-            continue
-        
-        if rsi > rsi_sell:
-            in_overbought = True
-            last_date = df.index[idx]
-        elif in_overbought and rsi <= rsi_sell_exit and last_date:
-            sell_signals.append({'date': df.index[idx], 'price': df['Close'].iloc[idx]})
-            in_overbought = False
-            last_date = None
-    
-    return sell_signals
+    return [{'date': s['confirm_date'], 'price': s['confirm_price']}
+            for s in rsi_sell_signals(df, rsi_sell, rsi_sell_exit)]
 
 def simulate_trades(df, buy_signals, sell_signals, use_hedge=True):
     buy_dates = {s['date']: s for s in buy_signals}
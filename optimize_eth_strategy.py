@@ -7,6 +7,11 @@ import pandas as pd
 import numpy as np
 from itertools import product
 import time
+import sys
+sys.path.insert(0, '.')
+
+from src.features.rsi import RSI
+from src.signals import confirm_prices, rsi_buy_signal_set, rsi_sell_signal_set
 
 # 데이터 로드
 df = pd.read_csv('data/eth_4h_5y.csv', index_col='Date', parse_dates=True)
@@ -17,14 +22,7 @@ print(f'데이터: {df.index[0].strftime("%Y-%m-%d")} ~ {df.index[-1].strftime("
 print()
 
 # 기술 지표 계산
-def calculate_rsi(series, period=14):
-    delta = series.diff()
-    gain = delta.where(delta > 0, 0).rolling(window=period).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-    rs = gain / loss
-    return 100 - (100 / (1 + rs))
-
-df['rsi'] = calculate_rsi(df['Close'])
+df['rsi'] = RSI(14).calculate(df['Close'])
 df['MA40'] = df['Close'].rolling(window=40).mean()
 df['MA200'] = df['Close'].rolling(window=200).mean()
 df['golden_cross'] = df['MA40'] > df['MA200']
@@ -45,60 +43,18 @@ CAPITAL_PER_ENTRY = 1000
 
 # 시그널 생성 (한번만)
 def find_buy_signals(df):
-    buy_signals = []
-    in_oversold = False
-    last_signal_date = None
-    
-    for idx in range(len(df)):
-        rsi = df['rsi'].iloc[idx]
-        if pd.isna(rsi):
-            continue
-        
-        if rsi < RSI_BUY:
-            in_oversold = True
-            last_signal_date = df.index[idx]
-        else:
-            if in_oversold and rsi >= RSI_BUY_EXIT and last_signal_date is not None:
-                buy_signals.append({
-                    'confirm_date': df.index[idx],
-                    'confirm_price': df['Close'].iloc[idx]
-                })
-                in_oversold = False
-                last_signal_date = None
-    
-    return buy_signals
+    return rsi_buy_signal_set(df, RSI_BUY, RSI_BUY_EXIT)
 
 def find_sell_signals(df):
-    sell_signals = []
-    in_overbought = False
-    last_signal_date = None
-    
-    for idx in range(len(df)):
-        rsi = df['rsi'].iloc[idx]
-        if pd.isna(rsi):
-            continue
-        
-        if rsi > RSI_SELL:
-            in_overbought = True
-            last_signal_date = df.index[idx]
-        else:
-            if in_overbought and rsi <= RSI_SELL_EXIT and last_signal_date is not None:
-                sell_signals.append({
-                    'confirm_date': df.index[idx],
-                    'confirm_price': df['Close'].iloc[idx]
-                })
-                in_overbought = False
-                last_signal_date = None
-    
-    return sell_signals
+    return rsi_sell_signal_set(df, RSI_SELL, RSI_SELL_EXIT)
 
 # 시뮬레이션 함수
 def simulate_trades(df, buy_signals, sell_signals, use_hedge=False,
                    hedge_threshold=2, hedge_upgrade_interval=3,
                    hedge_ratio=1.0, hedge_profit=8, hedge_stop=-15):
     
-    all_buy_dates = {bs['confirm_date']: bs for bs in buy_signals}
-    all_sell_dates = {ss['confirm_date']: ss for ss in sell_signals}
+    buy_prices = confirm_prices(buy_signals, df.index)
+    sell_prices = confirm_prices(sell_signals, df.index)
     
     positions = []
     trades = []
@@ -148,8 +104,8 @@ def simulate_trades(df, buy_signals, sell_signals, use_hedge=False,
             if current_return <= STOP_LOSS:
                 exit_reason = "손절"
                 exit_price = avg_price * (1 + STOP_LOSS / 100)
-            elif current_date in all_sell_dates:
-                sell_price = all_sell_dates[current_date]['confirm_price']
+            elif not np.isnan(sell_prices[idx]):
+                sell_price = sell_prices[idx]
                 sell_return = (sell_price / avg_price - 1) * 100
                 if sell_return > 0:
                     exit_reason = "익절"
@@ -178,10 +134,10 @@ def simulate_trades(df, buy_signals, sell_signals, use_hedge=False,
                 positions = []
         
         # 매수 처리
-        if current_date in all_buy_dates:
+        if not np.isnan(buy_prices[idx]):
             positions.append({
                 'date': current_date,
-                'price': all_buy_dates[current_date]['confirm_price']
+                'price': buy_prices[idx]
             })
             
             num_buys = len(positions)
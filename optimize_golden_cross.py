@@ -11,6 +11,8 @@ import numpy as np
 from datetime import datetime, timedelta
 from tqdm import tqdm
 
+from src.features.rsi import RSI
+
 def get_data(interval='1d'):
     """데이터 가져오기"""
     ticker = 'BTC-USD'
@@ -31,11 +33,7 @@ def get_data(interval='1d'):
 def calculate_indicators(df, short_ma, long_ma):
     """기술 지표 계산"""
     # RSI
-    delta = df['Close'].diff()
-    gain = delta.where(delta > 0, 0).rolling(window=14).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-    rs = gain / loss
-    df['rsi'] = 100 - (100 / (1 + rs))
+    df['rsi'] = RSI(14).calculate(df['Close'])
     
     # 이동평균
     df['MA_short'] = df['Close'].rolling(window=short_ma).mean()
@@ -9,15 +9,12 @@ import sys
 sys.path.insert(0, '.')
 
 from dashboard_4h import find_buy_signals, find_sell_signals, simulate_trades
+from src.features.rsi import RSI
 
 def add_indicators(df):
     """지표 추가"""
     df = df.copy()
-    delta = df['Close'].diff()
-    gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-    rs = gain / loss
-    df['rsi'] = 100 - (100 / (1 + rs))
+    df['rsi'] = RSI(14).calculate(df['Close'])
     df['MA40'] = df['Close'].rolling(window=40).mean()
     df['MA200'] = df['Close'].rolling(window=200).mean()
     df['golden_cross'] = df['MA40'] > df['MA200']
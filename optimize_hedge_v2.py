@@ -9,6 +9,9 @@ import pandas as pd
 import numpy as np
 from itertools import product
 
+from src.data.arrays import OHLCVArrays
+from src.features.technical import TechnicalIndicators, trim_warmup
+from src.features.rsi import RSI
 from dashboard_4h import (
     find_buy_signals,
     find_sell_signals,
@@ -28,21 +31,21 @@ STOP_LOSS = -25
 USE_GOLDEN_CROSS = False
 
 # 데이터 로드
-df = pd.read_csv("data/btc_4h_5y.csv", index_col=0, parse_dates=True)
-df = df.dropna()
+# 메모리 맵 배열로 로드 (첫 실행 시 CSV에서 생성, 이후 파싱 없음)
+df = OHLCVArrays.from_csv("data/btc_4h_5y.csv").to_frame()
+df = trim_warmup(df)  # MA 워밍업 구간 제외 (복사 없이 슬라이스)
 print(f"데이터: {df.index[0]} ~ {df.index[-1]} ({len(df)}봉)\n")
 
 # 지표 계산
 print("📈 지표 계산 중...")
 
-for period in [20, 50, 100, 200]:
-    df[f'MA{period}'] = df['Close'].rolling(period).mean()
+# 이동평균 스윕: 누적합 한 번으로 전체 기간 계산
+MA_PERIODS = [20, 50, 100, 200]
+ma_matrix = TechnicalIndicators.sma_matrix(df['Close'], MA_PERIODS)
+for j, period in enumerate(MA_PERIODS):
+    df[f'MA{period}'] = ma_matrix[:, j]
 
-delta = df['Close'].diff()
-gain = delta.where(delta > 0, 0).rolling(14).mean()
-loss = (-delta.where(delta < 0, 0)).rolling(14).mean()
-rs = gain / loss
-df['RSI'] = 100 - (100 / (1 + rs))
+df['RSI'] = RSI(14).calculate(df['Close'])
 
 exp12 = df['Close'].ewm(span=12).mean()
 exp26 = df['Close'].ewm(span=26).mean()
@@ -51,8 +54,10 @@ df['MACD_signal'] = df['MACD'].ewm(span=9).mean()
 df['MACD_hist'] = df['MACD'] - df['MACD_signal']
 
 # 다양한 lookback으로 고점대비 하락률
-for lookback in [30, 45, 60, 90, 120]:
-    df[f'high_{lookback}'] = df['High'].rolling(lookback).max()
+LOOKBACKS = [30, 45, 60, 90, 120]
+high_matrix = TechnicalIndicators.rolling_max_matrix(df['High'], LOOKBACKS)
+for j, lookback in enumerate(LOOKBACKS):
+    df[f'high_{lookback}'] = high_matrix[:, j]
     df[f'drawdown_{lookback}'] = (df['Close'] - df[f'high_{lookback}']) / df[f'high_{lookback}'] * 100
 
 df['RSI_MA'] = df['RSI'].rolling(14).mean()
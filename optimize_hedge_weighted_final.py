@@ -8,6 +8,9 @@ sys.path.insert(0, '.')
 import pandas as pd
 import numpy as np
 
+from src.data.arrays import OHLCVArrays
+from src.features.technical import TechnicalIndicators, trim_warmup
+from src.features.rsi import RSI
 from dashboard_4h import (
     find_buy_signals,
     find_sell_signals,
@@ -24,18 +27,18 @@ USE_GOLDEN_CROSS = False
 CAPITAL_PER_ENTRY = 1000
 
 # 데이터 로드
-df = pd.read_csv("data/btc_4h_5y.csv", index_col=0, parse_dates=True)
-df = df.dropna()
+# 메모리 맵 배열로 로드 (첫 실행 시 CSV에서 생성, 이후 파싱 없음)
+df = OHLCVArrays.from_csv("data/btc_4h_5y.csv").to_frame()
+df = trim_warmup(df)  # MA 워밍업 구간 제외 (복사 없이 슬라이스)
 
 # 지표 계산
-for period in [10, 20, 30, 50, 100]:
-    df[f'MA{period}'] = df['Close'].rolling(period).mean()
-
-delta = df['Close'].diff()
-gain = delta.where(delta > 0, 0).rolling(14).mean()
-loss = (-delta.where(delta < 0, 0)).rolling(14).mean()
-rs = gain / loss
-df['RSI'] = 100 - (100 / (1 + rs))
+# 이동평균 스윕: 누적합 한 번으로 전체 기간 계산
+MA_PERIODS = [10, 20, 30, 50, 100]
+ma_matrix = TechnicalIndicators.sma_matrix(df['Close'], MA_PERIODS)
+for j, period in enumerate(MA_PERIODS):
+    df[f'MA{period}'] = ma_matrix[:, j]
+
+df['RSI'] = RSI(14).calculate(df['Close'])
 
 exp12 = df['Close'].ewm(span=12).mean()
 exp26 = df['Close'].ewm(span=26).mean()
@@ -14,52 +14,32 @@ from tqdm import tqdm
 from src.data.cache import DataCache
 from src.data.fetcher import CoinFetcher, validate_data
 from src.features.technical import TechnicalIndicators
+from src.signals import (confirm_prices, rsi_buy_signal_set, rsi_sell_signal_set,
+                         rsi_buy_signal_sets, rsi_sell_signal_sets)
 
 
 def find_buy_signals(df, rsi_oversold, rsi_exit):
-    signals = []
-    in_oversold = False
-    
-    for i in range(len(df)):
-        row = df.iloc[i]
-        current_rsi = row.get('rsi', 50)
-        
-        if current_rsi < rsi_oversold and not in_oversold:
-            in_oversold = True
-        elif in_oversold and current_rsi >= rsi_exit:
-            signals.append({
-                'confirm_date': df.index[i],
-                'confirm_price': row['Close']
-            })
-            in_oversold = False
-    
-    return signals
+    return rsi_buy_signal_set(df, rsi_oversold, rsi_exit, anchor='first')
 
 
 def find_sell_signals(df, rsi_overbought, rsi_exit):
-    signals = []
-    in_overbought = False
-    
-    for i in range(len(df)):
-        row = df.iloc[i]
-        current_rsi = row.get('rsi', 50)
-        
-        if current_rsi > rsi_overbought and not in_overbought:
-            in_overbought = True
-        elif in_overbought and current_rsi <= rsi_exit:
-            signals.append({
-                'confirm_date': df.index[i],
-                'confirm_price': row['Close']
-            })
-            in_overbought = False
-    
-    return signals
+    return rsi_sell_signal_set(df, rsi_overbought, rsi_exit, anchor='first')
+
+
+def find_buy_signal_grid(df, pairs):
+    """find_buy_signals를 (rsi_oversold, rsi_exit) 조합 전체에 한 번에 ({조합: 시그널})"""
+    return rsi_buy_signal_sets(df, pairs, anchor='first')
+
+
+def find_sell_signal_grid(df, pairs):
+    """find_sell_signals를 (rsi_overbought, rsi_exit) 조합 전체에 한 번에"""
+    return rsi_sell_signal_sets(df, pairs, anchor='first')
 
 
 def simulate_new_strategy(df, buy_signals, sell_signals, stop_loss=-25):
     """새 전략: 수익일 때만 매도"""
-    all_buy_dates = {bs['confirm_date']: bs for bs in buy_signals}
-    all_sell_dates = {ss['confirm_date']: ss for ss in sell_signals}
+    buy_prices = confirm_prices(buy_signals, df.index)
+    sell_prices = confirm_prices(sell_signals, df.index)
     
     trades = []
     positions = []
@@ -82,8 +62,8 @@ def simulate_new_strategy(df, buy_signals, sell_signals, stop_loss=-25):
             if current_return <= stop_loss:
                 exit_reason = "손절"
             # RSI 매도 + 수익일 때만
-            elif current_date in all_sell_dates:
-                sell_price = all_sell_dates[current_date]['confirm_price']
+            elif not np.isnan(sell_prices[idx]):
+                sell_price = sell_prices[idx]
                 sell_return = (sell_price / avg_price - 1) * 100
                 if sell_return > 0:
                     exit_reason = "익절"
@@ -97,10 +77,10 @@ def simulate_new_strategy(df, buy_signals, sell_signals, stop_loss=-25):
                 })
                 positions = []
         
-        if current_date in all_buy_dates:
+        if not np.isnan(buy_prices[idx]):
             positions.append({
                 'date': current_date,
-                'price': all_buy_dates[current_date]['confirm_price']
+                'price': buy_prices[idx]
             })
     
     # 현재 보유 중인 포지션 수도 반환
@@ -153,7 +133,7 @@ def main():
         cache.set(f'{ticker}_1d', df)
     
     ti = TechnicalIndicators()
-    df = ti.calculate_all(df)
+    df = ti.calculate(df, ['rsi'])  # RSI만 사용
     
     print(f"   데이터: {df.index[0].strftime('%Y-%m-%d')} ~ {df.index[-1].strftime('%Y-%m-%d')}")
     print()
@@ -172,14 +152,20 @@ def main():
     results = []
     combinations = list(product(oversold_range, buy_exit_range, overbought_range, sell_exit_range))
     
+    # 시그널은 임계값 쌍에만 의존 - 루프에서 쓰는 쌍 전체를 미리 한 번에 계산
+    buy_pairs = [(o, e) for o, e in product(oversold_range, buy_exit_range) if e > o]
+    sell_pairs = [(o, e) for o, e in product(overbought_range, sell_exit_range) if e < o]
+    buy_grid = find_buy_signal_grid(df, buy_pairs)
+    sell_grid = find_sell_signal_grid(df, sell_pairs)
+    
     for oversold, buy_exit, overbought, sell_exit in tqdm(combinations, desc="최적화"):
         if buy_exit <= oversold:
             continue
         if sell_exit >= overbought:
             continue
         
-        buy_signals = find_buy_signals(df, oversold, buy_exit)
-        sell_signals = find_sell_signals(df, overbought, sell_exit)
+        buy_signals = buy_grid[(oversold, buy_exit)]
+        sell_signals = sell_grid[(overbought, sell_exit)]
         trades, current_pos, max_pos = simulate_new_strategy(df, buy_signals, sell_signals, stop_loss=-25)
         metrics = calculate_metrics(trades, current_pos, max_pos)
         
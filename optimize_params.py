@@ -15,80 +15,36 @@ from tqdm import tqdm
 from src.data.cache import DataCache
 from src.data.fetcher import CoinFetcher, validate_data
 from src.features.technical import TechnicalIndicators
+from src.signals import (confirm_prices, rsi_buy_signal_set, rsi_sell_signal_set,
+                         rsi_buy_signal_sets, rsi_sell_signal_sets)
 
 
 def find_buy_signals(df: pd.DataFrame, rsi_oversold: int, rsi_exit: int) -> list:
     """매수 시그널 찾기 (confirm_date 기준)"""
-    signals = []
-    in_oversold = False
-    signal_start = None
-    signal_price = None
-    signal_rsi = None
-    
-    for i in range(len(df)):
-        row = df.iloc[i]
-        current_rsi = row.get('rsi', 50)
-        
-        if current_rsi < rsi_oversold and not in_oversold:
-            in_oversold = True
-            signal_start = df.index[i]
-            signal_price = row['Close']
-            signal_rsi = current_rsi
-        elif in_oversold and current_rsi >= rsi_exit:
-            # 실제 매수 시점!
-            signals.append({
-                'signal_date': signal_start,
-                'signal_price': signal_price,
-                'signal_rsi': signal_rsi,
-                'confirm_date': df.index[i],
-                'confirm_price': row['Close'],
-                'confirm_rsi': current_rsi
-            })
-            in_oversold = False
-            signal_start = None
-    
-    return signals
+    return rsi_buy_signal_set(df, rsi_oversold, rsi_exit, anchor='first')
 
 
 def find_sell_signals(df: pd.DataFrame, rsi_overbought: int, rsi_exit: int) -> list:
     """매도 시그널 찾기 (confirm_date 기준)"""
-    signals = []
-    in_overbought = False
-    signal_start = None
-    signal_price = None
-    signal_rsi = None
-    
-    for i in range(len(df)):
-        row = df.iloc[i]
-        current_rsi = row.get('rsi', 50)
-        
-        if current_rsi > rsi_overbought and not in_overbought:
-            in_overbought = True
-            signal_start = df.index[i]
-            signal_price = row['Close']
-            signal_rsi = current_rsi
-        elif in_overbought and current_rsi <= rsi_exit:
-            # 실제 매도 시점!
-            signals.append({
-                'signal_date': signal_start,
-                'signal_price': signal_price,
-                'signal_rsi': signal_rsi,
-                'confirm_date': df.index[i],
-                'confirm_price': row['Close'],
-                'confirm_rsi': current_rsi
-            })
-            in_overbought = False
-            signal_start = None
-    
-    return signals
+    return rsi_sell_signal_set(df, rsi_overbought, rsi_exit, anchor='first')
+
+
+def find_buy_signal_grid(df: pd.DataFrame, pairs) -> dict:
+    """find_buy_signals를 (rsi_oversold, rsi_exit) 조합 전체에 한 번에 ({조합: 시그널})"""
+    return rsi_buy_signal_sets(df, pairs, anchor='first')
+
+
+def find_sell_signal_grid(df: pd.DataFrame, pairs) -> dict:
+    """find_sell_signals를 (rsi_overbought, rsi_exit) 조합 전체에 한 번에"""
+    return rsi_sell_signal_sets(df, pairs, anchor='first')
 
 
 def simulate_trades(df: pd.DataFrame, buy_signals: list, sell_signals: list, stop_loss: float = -25):
     """
     물타기 전략 시뮬레이션 (confirm_date/confirm_price 기준)
     """
-    all_buy_dates = {bs['confirm_date']: bs for bs in buy_signals}
-    all_sell_dates = {ss['confirm_date']: ss for ss in sell_signals}
+    buy_prices = confirm_prices(buy_signals, df.index)
+    sell_prices = confirm_prices(sell_signals, df.index)
     
     trades = []
     positions = []
@@ -104,9 +60,9 @@ def simulate_trades(df: pd.DataFrame, buy_signals: list, sell_signals: list, sto
             exit_reason = None
             exit_price = current_price
             
-            if current_date in all_sell_dates:
+            if not np.isnan(sell_prices[idx]):
                 exit_reason = "RSI 매도"
-                exit_price = all_sell_dates[current_date]['confirm_price']
+                exit_price = sell_prices[idx]
             elif current_return <= stop_loss:
                 exit_reason = "손절"
             
@@ -123,10 +79,10 @@ def simulate_trades(df: pd.DataFrame, buy_signals: list, sell_signals: list, sto
                 })
                 positions = []
         
-        if current_date in all_buy_dates:
+        if not np.isnan(buy_prices[idx]):
             positions.append({
                 'date': current_date,
-                'price': all_buy_dates[current_date]['confirm_price']
+                'price': buy_prices[idx]
             })
     
     return trades
@@ -180,7 +136,7 @@ def main():
     
     # 기술 지표 계산
     ti = TechnicalIndicators()
-    df = ti.calculate_all(df)
+    df = ti.calculate(df, ['rsi'])  # RSI만 사용
     
     print(f"   데이터 기간: {df.index[0].strftime('%Y-%m-%d')} ~ {df.index[-1].strftime('%Y-%m-%d')}")
     print(f"   데이터 포인트: {len(df):,}개")
@@ -211,6 +167,12 @@ def main():
         stop_loss_range
     ))
     
+    # 시그널은 임계값 쌍에만 의존 - 루프에서 쓰는 쌍 전체를 미리 한 번에 계산
+    buy_pairs = [(o, e) for o, e in product(oversold_range, buy_exit_range) if e > o]
+    sell_pairs = [(o, e) for o, e in product(overbought_range, sell_exit_range) if e < o]
+    buy_grid = find_buy_signal_grid(df, buy_pairs)
+    sell_grid = find_sell_signal_grid(df, sell_pairs)
+    
     for oversold, buy_exit, overbought, sell_exit, stop_loss in tqdm(combinations, desc="최적화 진행"):
         # 매수 탈출이 과매도보다 커야 함
         if buy_exit <= oversold:
@@ -219,8 +181,8 @@ def main():
         if sell_exit >= overbought:
             continue
         
-        buy_signals = find_buy_signals(df, oversold, buy_exit)
-        sell_signals = find_sell_signals(df, overbought, sell_exit)
+        buy_signals = buy_grid[(oversold, buy_exit)]
+        sell_signals = sell_grid[(overbought, sell_exit)]
         trades = simulate_trades(df, buy_signals, sell_signals, stop_loss=stop_loss)
         metrics = calculate_metrics(trades)
         
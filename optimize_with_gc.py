@@ -10,8 +10,13 @@ import yfinance as yf
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+from itertools import product
 from tqdm import tqdm
 
+from src.features.rsi import RSI
+from src.signals import (confirm_prices, rsi_buy_signal_set, rsi_sell_signal_set,
+                         rsi_buy_signal_sets, rsi_sell_signal_sets)
+
 def get_data(interval='1d'):
     """데이터 가져오기"""
     ticker = 'BTC-USD'
@@ -32,11 +37,7 @@ def get_data(interval='1d'):
 def calculate_indicators(df):
     """기술 지표 계산"""
     # RSI
-    delta = df['Close'].diff()
-    gain = delta.where(delta > 0, 0).rolling(window=14).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-    rs = gain / loss
-    df['rsi'] = 100 - (100 / (1 + rs))
+    df['rsi'] = RSI(14).calculate(df['Close'])
     
     # 골든크로스
     df['MA40'] = df['Close'].rolling(window=40).mean()
@@ -47,59 +48,26 @@ def calculate_indicators(df):
 
 def find_buy_signals(df, rsi_oversold, rsi_exit):
     """매수 시그널 (골든크로스 필터 적용)"""
-    signals = []
-    in_oversold = False
-    last_date = None
-    last_price = None
-    
-    for idx in range(len(df)):
-        rsi = df['rsi'].iloc[idx]
-        gc = df['golden_cross'].iloc[idx]
-        
-        if pd.isna(rsi) or pd.isna(gc):
-            continue
-        
-        if rsi < rsi_oversold:
-            in_oversold = True
-            last_date = df.index[idx]
-            last_price = df['Close'].iloc[idx]
-        elif in_oversold and rsi >= rsi_exit:
-            # 골든크로스 상태에서만 매수
-            if gc:
-                signals.append({
-                    'confirm_date': df.index[idx],
-                    'confirm_price': df['Close'].iloc[idx]
-                })
-            in_oversold = False
-    
-    return signals
+    return rsi_buy_signal_set(df, rsi_oversold, rsi_exit, use_golden_cross=True,
+                              reset_on_reject=True, missing_filter='skip')
 
 def find_sell_signals(df, rsi_overbought, rsi_exit):
     """매도 시그널"""
-    signals = []
-    in_overbought = False
-    
-    for idx in range(len(df)):
-        rsi = df['rsi'].iloc[idx]
-        
-        if pd.isna(rsi):
-            continue
-        
-        if rsi > rsi_overbought:
-            in_overbought = True
-        elif in_overbought and rsi <= rsi_exit:
-            signals.append({
-                'confirm_date': df.index[idx],
-                'confirm_price': df['Close'].iloc[idx]
-            })
-            in_overbought = False
-    
-    return signals
+    return rsi_sell_signal_set(df, rsi_overbought, rsi_exit)
+
+def find_buy_signal_grid(df, pairs):
+    """find_buy_signals를 (rsi_oversold, rsi_exit) 조합 전체에 한 번에 ({조합: 시그널})"""
+    return rsi_buy_signal_sets(df, pairs, use_golden_cross=True,
+                               reset_on_reject=True, missing_filter='skip')
+
+def find_sell_signal_grid(df, pairs):
+    """find_sell_signals를 (rsi_overbought, rsi_exit) 조합 전체에 한 번에"""
+    return rsi_sell_signal_sets(df, pairs)
 
 def simulate_new_strategy(df, buy_signals, sell_signals, stop_loss=-25):
     """시뮬레이션 (수익일 때만 익절)"""
-    all_buy_dates = {bs['confirm_date']: bs for bs in buy_signals}
-    all_sell_dates = {ss['confirm_date']: ss for ss in sell_signals}
+    buy_prices = confirm_prices(buy_signals, df.index)
+    sell_prices = confirm_prices(sell_signals, df.index)
     
     trades = []
     positions = []
@@ -120,8 +88,8 @@ def simulate_new_strategy(df, buy_signals, sell_signals, stop_loss=-25):
             if current_return <= stop_loss:
                 exit_reason = "손절"
             # 익절 (수익일 때만)
-            elif current_date in all_sell_dates:
-                sell_price = all_sell_dates[current_date]['confirm_price']
+            elif not np.isnan(sell_prices[idx]):
+                sell_price = sell_prices[idx]
                 sell_return = (sell_price / avg_price - 1) * 100
                 if sell_return > 0:
                     exit_reason = "익절"
@@ -136,10 +104,10 @@ def simulate_new_strategy(df, buy_signals, sell_signals, stop_loss=-25):
                 })
                 positions = []
         
-        if current_date in all_buy_dates:
+        if not np.isnan(buy_prices[idx]):
             positions.append({
                 'date': current_date,
-                'price': all_buy_dates[current_date]['confirm_price']
+                'price': buy_prices[idx]
             })
             max_positions = max(max_positions, len(positions))
     
@@ -183,6 +151,14 @@ def main():
     
     results = []
     
+    # 시그널은 임계값 쌍에만 의존 - 루프에서 쓰는 쌍 전체를 미리 한 번에 계산
+    buy_pairs = [(o, e) for o, e in product(rsi_oversolds, rsi_buy_exits) if e > o]
+    sell_pairs = [(o, e) for o, e in product(rsi_overboughts, rsi_sell_exits) if e < o]
+    buy_grid_1d = find_buy_signal_grid(df_1d, buy_pairs)
+    sell_grid_1d = find_sell_signal_grid(df_1d, sell_pairs)
+    buy_grid_4h = find_buy_signal_grid(df_4h, buy_pairs)
+    sell_grid_4h = find_sell_signal_grid(df_4h, sell_pairs)
+    
     with tqdm(total=total, desc="테스트 중") as pbar:
         for oversold in rsi_oversolds:
             for buy_exit in rsi_buy_exits:
@@ -198,13 +174,13 @@ def main():
                         
                         for stop_loss in stop_losses:
                             # 일봉 테스트
-                            buy_1d = find_buy_signals(df_1d, oversold, buy_exit)
-                            sell_1d = find_sell_signals(df_1d, overbought, sell_exit)
+                            buy_1d = buy_grid_1d[(oversold, buy_exit)]
+                            sell_1d = sell_grid_1d[(overbought, sell_exit)]
                             trades_1d, pos_1d, max_1d = simulate_new_strategy(df_1d, buy_1d, sell_1d, stop_loss)
                             
                             # 4시간봉 테스트
-                            buy_4h = find_buy_signals(df_4h, oversold, buy_exit)
-                            sell_4h = find_sell_signals(df_4h, overbought, sell_exit)
+                            buy_4h = buy_grid_4h[(oversold, buy_exit)]
+                            sell_4h = sell_grid_4h[(overbought, sell_exit)]
                             trades_4h, pos_4h, max_4h = simulate_new_strategy(df_4h, buy_4h, sell_4h, stop_loss)
                             
                             # 수익률 계산
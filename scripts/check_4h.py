@@ -7,8 +7,10 @@ import sys
 sys.path.insert(0, '.')
 
 from src.data.cache import DataCache
-from src.data.fetcher import CoinFetcher, validate_data
+from src.data.loader import load_resampled
 from src.features.technical import TechnicalIndicators
+from src.features.cache import IndicatorCache
+from src.signals import rsi_buy_signal_set, rsi_sell_signal_set
 from datetime import datetime
 import os
 import pandas as pd
@@ -17,24 +19,12 @@ def main():
     ticker = 'BTC-USD'
     
     # 데이터 로드 (4시간봉, 2년)
-    cache = DataCache(cache_dir='data/cache_4h', max_age_hours=4)
-    df = cache.get(f'{ticker}_4h')
-    
-    if df is None:
-        fetcher = CoinFetcher([ticker])
-        data = fetcher.fetch(period='2y', interval='4h')
-        df = data[ticker]
-        df, _ = validate_data(df, ticker)
-        cache.set(f'{ticker}_4h', df)
+    cache = DataCache(cache_dir='data/cache_1h', interval='1h')
+    df = load_resampled(ticker, '4h', cache, period='2y')
     
     # 기술 지표 계산
-    ti = TechnicalIndicators()
-    df = ti.calculate_all(df)
-    
-    # 골든크로스용 이동평균선 추가
-    df['MA40'] = df['Close'].rolling(window=40).mean()
-    df['MA200'] = df['Close'].rolling(window=200).mean()
-    df['golden_cross'] = df['MA40'] > df['MA200']
+    ti = TechnicalIndicators(cache=IndicatorCache('data/cache_indicators'))
+    df = ti.calculate(df, ['rsi', 'MA40', 'MA200', 'golden_cross'])
     
     # 최신 데이터
     latest = df.iloc[-1]
@@ -53,10 +43,6 @@ def main():
     low_price = latest['Low']
     close_price = latest['Close']
     
-    # 시그널 체크
-    buy_signal = False
-    sell_signal = False
-    
     # RSI 기준 (최적화된 값)
     rsi_oversold_threshold = 35
     rsi_buy_exit_threshold = 40
@@ -69,35 +55,13 @@ def main():
     recent_df = df.iloc[-lookback:]
     
     # 매수 시그널 확인 (RSI 과매도 후 탈출) - 골든크로스 필터 OFF (5년 테스트 결과 OFF가 +146% 더 좋음)
-    in_oversold = False
-    for i in range(len(recent_df) - 1):
-        rsi = recent_df['rsi'].iloc[i]
-        
-        if rsi < rsi_oversold_threshold:
-            in_oversold = True
-        elif in_oversold and rsi >= rsi_buy_exit_threshold:
-            # 가장 최근 4시간봉이 탈출 시점인지 확인
-            if i == len(recent_df) - 2:
-                buy_signal = True
-            in_oversold = False
-    
-    # 현재 봉에서 탈출 확인
-    if in_oversold and current_rsi >= rsi_buy_exit_threshold:
-        buy_signal = True
+    # 직전 봉 또는 현재 봉에서 탈출이 확인됐으면 시그널
+    buys = rsi_buy_signal_set(recent_df, rsi_oversold_threshold, rsi_buy_exit_threshold)
+    buy_signal = bool((buys.confirm_idx >= len(recent_df) - 2).any())
     
     # 매도 시그널 확인 (RSI 과매수 후 하락) - 골든크로스 무관
-    in_overbought = False
-    for i in range(len(recent_df) - 1):
-        rsi = recent_df['rsi'].iloc[i]
-        if rsi > rsi_overbought_threshold:
-            in_overbought = True
-        elif in_overbought and rsi <= rsi_sell_exit_threshold:
-            if i == len(recent_df) - 2:
-                sell_signal = True
-            in_overbought = False
-    
-    if in_overbought and current_rsi <= rsi_sell_exit_threshold:
-        sell_signal = True
+    sells = rsi_sell_signal_set(recent_df, rsi_overbought_threshold, rsi_sell_exit_threshold)
+    sell_signal = bool((sells.confirm_idx >= len(recent_df) - 2).any())
     
     # 결과 출력
     print('=' * 50)
@@ -10,70 +10,21 @@ import sys
 sys.path.insert(0, '.')
 
 from src.data.cache import DataCache
-from src.data.fetcher import CoinFetcher, validate_data
+from src.data.loader import load_resampled
 from src.features.technical import TechnicalIndicators
+from src.features.cache import IndicatorCache
+from src.signals import confirm_prices, rsi_buy_signals, rsi_sell_signals
 from datetime import datetime, timedelta
 import os
-import pandas as pd
+import numpy as np
 
 # 대시보드와 동일한 시그널 함수
 def find_buy_signals(df, rsi_oversold=35, rsi_exit=40, use_golden_cross=False):
-    buy_signals = []
-    in_oversold = False
-    last_signal_date = None
-    last_signal_price = None
-    
-    for idx in range(len(df)):
-        rsi = df['rsi'].iloc[idx]
-        if pd.isna(rsi):
-            continue
-        
-        golden_cross_ok = True
-        if use_golden_cross and 'golden_cross' in df.columns:
-            gc = df['golden_cross'].iloc[idx]
-            golden_cross_ok = gc if not pd.isna(gc) else False
-        
-        if rsi < rsi_oversold:
-            in_oversold = True
-            last_signal_date = df.index[idx]
-            last_signal_price = df['Close'].iloc[idx]
-        else:
-            if in_oversold and rsi >= rsi_exit and last_signal_date is not None:
-                if golden_cross_ok:
-                    buy_signals.append({
-                        'signal_date': last_signal_date,
-                        'confirm_date': df.index[idx],
-                        'confirm_price': df['Close'].iloc[idx]
-                    })
-                    in_oversold = False
-                    last_signal_date = None
-    
-    return buy_signals
+    return rsi_buy_signals(df, rsi_oversold, rsi_exit, use_golden_cross)
+
 
 def find_sell_signals(df, rsi_overbought=80, rsi_exit=55):
-    sell_signals = []
-    in_overbought = False
-    last_signal_date = None
-    
-    for idx in range(len(df)):
-        rsi = df['rsi'].iloc[idx]
-        if pd.isna(rsi):
-            continue
-        
-        if rsi > rsi_overbought:
-            in_overbought = True
-            last_signal_date = df.index[idx]
-        else:
-            if in_overbought and rsi <= rsi_exit and last_signal_date is not None:
-                sell_signals.append({
-                    'signal_date': last_signal_date,
-                    'confirm_date': df.index[idx],
-                    'confirm_price': df['Close'].iloc[idx]
-                })
-                in_overbought = False
-                last_signal_date = None
-    
-    return sell_signals
+    return rsi_sell_signals(df, rsi_overbought, rsi_exit)
 
 
 def simulate_trades(df, buy_signals, sell_signals, stop_loss=-25, 
@@ -83,8 +34,8 @@ def simulate_trades(df, buy_signals, sell_signals, stop_loss=-25,
     대시보드와 완전히 동일한 시뮬레이션 함수
     추가: 각 날짜별 발생한 액션 리스트 반환
     """
-    all_buy_dates = {bs['confirm_date']: bs for bs in buy_signals}
-    all_sell_dates = {ss['confirm_date']: ss for ss in sell_signals}
+    buy_prices = confirm_prices(buy_signals, df.index)
+    sell_prices = confirm_prices(sell_signals, df.index)
     
     trades = []
     positions = []
@@ -154,8 +105,8 @@ def simulate_trades(df, buy_signals, sell_signals, stop_loss=-25,
             
             if current_return <= stop_loss:
                 exit_reason = "손절"
-            elif current_date in all_sell_dates:
-                sell_price = all_sell_dates[current_date]['confirm_price']
+            elif not np.isnan(sell_prices[idx]):
+                sell_price = sell_prices[idx]
                 sell_return = (sell_price / avg_price - 1) * 100
                 if sell_return > 0:
                     exit_reason = "익절"
@@ -201,10 +152,10 @@ def simulate_trades(df, buy_signals, sell_signals, stop_loss=-25,
                 positions = []
         
         # ===== 매수 처리 =====
-        if current_date in all_buy_dates:
+        if not np.isnan(buy_prices[idx]):
             positions.append({
                 'date': current_date,
-                'price': all_buy_dates[current_date]['confirm_price']
+                'price': buy_prices[idx]
             })
             
             num_buys = len(positions)
@@ -259,10 +210,10 @@ def simulate_trades(df, buy_signals, sell_signals, stop_loss=-25,
                     today_actions.append(f"⚪ 헷징 조건 도달했지만 MACD≥0 ({macd_val:.0f})이라 미발동")
         
         # ===== 매도 시그널 보류 체크 =====
-        if current_date in all_sell_dates and positions:
+        if not np.isnan(sell_prices[idx]) and positions:
             total_quantity = sum(1 / p['price'] for p in positions)
             avg_price = len(positions) / total_quantity
-            sell_price = all_sell_dates[current_date]['confirm_price']
+            sell_price = sell_prices[idx]
             sell_return = (sell_price / avg_price - 1) * 100
             
             if sell_return <= 0:
@@ -278,29 +229,14 @@ def main():
     ticker = 'BTC-USD'
     
     # 데이터 로드 (4시간봉, 2년)
-    cache = DataCache(cache_dir='data/cache_4h', max_age_hours=4)
-    df = cache.get(f'{ticker}_4h')
-    
-    if df is None:
-        fetcher = CoinFetcher([ticker])
-        data = fetcher.fetch(period='2y', interval='4h')
-        df = data[ticker]
-        df, _ = validate_data(df, ticker)
-        cache.set(f'{ticker}_4h', df)
+    cache = DataCache(cache_dir='data/cache_1h', interval='1h')
+    df = load_resampled(ticker, '4h', cache, period='2y')
     
     # 기술 지표 계산
-    ti = TechnicalIndicators()
-    df = ti.calculate_all(df)
-    
-    # 추가 지표
-    df['MA40'] = df['Close'].rolling(window=40).mean()
-    df['MA200'] = df['Close'].rolling(window=200).mean()
-    df['golden_cross'] = df['MA40'] > df['MA200']
-    
-    # MACD
-    exp1 = df['Close'].ewm(span=12, adjust=False).mean()
-    exp2 = df['Close'].ewm(span=26, adjust=False).mean()
-    df['MACD'] = exp1 - exp2
+    ti = TechnicalIndicators(cache=IndicatorCache('data/cache_indicators'))
+    # 'macd' = EMA12 - EMA26 (adjust=False) - 헷징 판단용 MACD와 같은 노드
+    df = ti.calculate(df, ti.COLUMNS + ['MA40', 'MA200', 'golden_cross'])
+    df['MACD'] = df['macd']
     
     # 최신 데이터
     latest = df.iloc[-1]
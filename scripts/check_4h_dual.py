@@ -8,8 +8,10 @@ import sys
 sys.path.insert(0, '.')
 
 from src.data.cache import DataCache
-from src.data.fetcher import CoinFetcher, validate_data
+from src.data.loader import load_resampled
 from src.features.technical import TechnicalIndicators
+from src.features.cache import IndicatorCache
+from src.signals import rsi_buy_signal_set, rsi_sell_signal_set, rsi_peak_short_signal_set
 from datetime import datetime
 import os
 import pandas as pd
@@ -32,25 +34,14 @@ def main():
     ticker = 'BTC-USD'
     
     # 데이터 로드 (4시간봉, 2년)
-    cache = DataCache(cache_dir='data/cache_4h', max_age_hours=4)
-    df = cache.get(f'{ticker}_4h')
-    
-    if df is None:
-        fetcher = CoinFetcher([ticker])
-        data = fetcher.fetch(period='2y', interval='4h')
-        df = data[ticker]
-        df, _ = validate_data(df, ticker)
-        cache.set(f'{ticker}_4h', df)
+    cache = DataCache(cache_dir='data/cache_1h', interval='1h')
+    df = load_resampled(ticker, '4h', cache, period='2y')
     
     # 기술 지표 계산
-    ti = TechnicalIndicators()
-    df = ti.calculate_all(df)
-    
     # MA100/200 (하락장 방어 최적화)
-    df['MA100'] = df['Close'].rolling(window=100).mean()
-    df['MA200'] = df['Close'].rolling(window=200).mean()
-    df['golden_cross'] = df['MA100'] > df['MA200']
-    df['dead_cross'] = df['MA100'] < df['MA200']
+    ti = TechnicalIndicators({'golden_cross': {'short': 100, 'long': 200}},
+                             cache=IndicatorCache('data/cache_indicators'))
+    df = ti.calculate(df, ['rsi', 'MA100', 'MA200', 'golden_cross', 'dead_cross'])
     
     # 최신 데이터
     latest = df.iloc[-1]
@@ -60,7 +51,6 @@ def main():
     
     # 추세 상태
     current_gc = latest['golden_cross'] if not pd.isna(latest['golden_cross']) else False
-    current_dc = latest['dead_cross'] if not pd.isna(latest['dead_cross']) else False
     ma100 = latest['MA100']
     ma200 = latest['MA200']
     
@@ -70,75 +60,29 @@ def main():
     low_price = latest['Low']
     close_price = latest['Close']
     
-    # 시그널 체크
-    long_entry_signal = False
-    long_exit_signal = False
-    short_entry_signal = False
-    short_exit_signal = False
-    
-    # 최근 데이터
+    # 최근 데이터 (직전 봉 또는 현재 봉에서 확인된 시그널만 본다)
     lookback = min(SHORT_LOOKBACK + 5, len(df))
     recent_df = df.iloc[-lookback:]
     
+    def confirmed_now(signals) -> bool:
+        return bool((signals.confirm_idx >= len(signals.index) - 2).any())
+    
     # ===== 롱 진입 시그널 (RSI 과매도 탈출 + 골든크로스) =====
-    in_oversold = False
-    for i in range(len(recent_df) - 1):
-        rsi = recent_df['rsi'].iloc[i]
-        gc = recent_df['golden_cross'].iloc[i]
-        
-        if rsi < LONG_RSI_OVERSOLD:
-            in_oversold = True
-        elif in_oversold and rsi >= LONG_RSI_EXIT:
-            if i == len(recent_df) - 2 and gc:
-                long_entry_signal = True
-            in_oversold = False
-    
-    if in_oversold and current_rsi >= LONG_RSI_EXIT and current_gc:
-        long_entry_signal = True
+    # 골든크로스가 아닌 봉의 탈출도 과매도 대기는 해제
+    long_entry_signal = confirmed_now(rsi_buy_signal_set(recent_df, LONG_RSI_OVERSOLD, LONG_RSI_EXIT,
+                                                         use_golden_cross=True, reset_on_reject=True))
     
     # ===== 롱 청산 시그널 (RSI 과매수 후 하락) =====
-    in_overbought = False
-    for i in range(len(recent_df) - 1):
-        rsi = recent_df['rsi'].iloc[i]
-        if rsi > LONG_RSI_OVERBOUGHT:
-            in_overbought = True
-        elif in_overbought and rsi <= LONG_RSI_SELL:
-            if i == len(recent_df) - 2:
-                long_exit_signal = True
-            in_overbought = False
-    
-    if in_overbought and current_rsi <= LONG_RSI_SELL:
-        long_exit_signal = True
+    long_exit_signal = confirmed_now(rsi_sell_signal_set(recent_df, LONG_RSI_OVERBOUGHT, LONG_RSI_SELL))
     
     # ===== 숏 진입 시그널 =====
-    # GC: RSI peak 후 하향
-    if current_gc:
-        recent_rsi = df['rsi'].iloc[-SHORT_LOOKBACK-1:-1]
-        had_peak = any(recent_rsi > SHORT_RSI_PEAK)
-        prev_rsi = df['rsi'].iloc[-2]
-        
-        if had_peak and prev_rsi > SHORT_RSI_ENTRY and current_rsi <= SHORT_RSI_ENTRY:
-            short_entry_signal = True
-    
-    # DC: RSI threshold 하향 (하락장 방어)
-    elif current_dc:
-        prev_rsi = df['rsi'].iloc[-2]
-        if prev_rsi > DC_RSI_THRESHOLD and current_rsi <= DC_RSI_THRESHOLD:
-            short_entry_signal = True
+    # GC: RSI peak 후 하향, DC: RSI threshold 하향 (하락장 방어) - 현재 봉에서 확인된 것만
+    shorts = rsi_peak_short_signal_set(df, SHORT_RSI_PEAK, SHORT_RSI_ENTRY, SHORT_LOOKBACK,
+                                       dc_rsi_threshold=DC_RSI_THRESHOLD)
+    short_entry_signal = bool(len(shorts)) and shorts.confirm_idx[-1] == len(df) - 1
     
     # ===== 숏 청산 시그널 (RSI 과매도 후 탈출) =====
-    in_oversold_short = False
-    for i in range(len(recent_df) - 1):
-        rsi = recent_df['rsi'].iloc[i]
-        if rsi < LONG_RSI_OVERSOLD:
-            in_oversold_short = True
-        elif in_oversold_short and rsi >= SHORT_RSI_EXIT:
-            if i == len(recent_df) - 2:
-                short_exit_signal = True
-            in_oversold_short = False
-    
-    if in_oversold_short and current_rsi >= SHORT_RSI_EXIT:
-        short_exit_signal = True
+    short_exit_signal = confirmed_now(rsi_buy_signal_set(recent_df, LONG_RSI_OVERSOLD, SHORT_RSI_EXIT))
     
     # 추세 상태 문자열
     trend_status = "🟢 상승장 (GC)" if current_gc else "🔴 하락장 (DC)"
@@ -1,3 +1,6 @@
 from .fetcher import CoinFetcher, validate_data
 from .cache import DataCache
-from .validator import DataValidator, ValidationReport
+from .validator import DataValidator, ValidationReport, GapReport
+from .loader import load_ohlcv, load_resampled, load_window
+from .resample import Resampler, resample_ohlcv
+from .compact import compact_frame, expand_frame
@@ -0,0 +1,153 @@
+"""메모리 맵 OHLCV 컬럼 배열 모듈"""
+
+import os
+import json
+import uuid
+import shutil
+import time
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Optional, List
+
+from .compact import compact_frame
+
+# save()의 디렉토리 교체와 겹친 열기/저장 재시도
+_OPEN_RETRIES = 5
+_RETRY_DELAY = 0.05
+
+
+class OHLCVArrays:
+    """
+    컬럼별 .npy 파일 + int64 타임스탬프 인덱스를 읽기 전용 메모리 맵으로 여는 클래스
+    
+    디렉토리 구조:
+        {path}/meta.json   컬럼 목록, 행 수
+        {path}/index.npy   int64 (epoch ns)
+        {path}/{컬럼}.npy  컬럼 값
+    
+    여러 프로세스가 같은 파일을 열면 OS 페이지 캐시를 공유하므로
+    파싱 비용과 프로세스별 메모리 복제가 없다.
+    """
+    
+    def __init__(self, path: str):
+        """
+        Args:
+            path: save()로 만든 디렉토리 경로
+        """
+        self.path = Path(path)
+        
+        for attempt in range(_OPEN_RETRIES):
+            try:
+                with open(self.path / "meta.json", "r") as f:
+                    meta = json.load(f)
+                
+                self.columns = meta["columns"]
+                self.index = np.load(self.path / "index.npy", mmap_mode='r')
+                self._arrays = {c: np.load(self.path / f"{c}.npy", mmap_mode='r') for c in self.columns}
+                break
+            except FileNotFoundError:
+                # save()가 디렉토리를 교체하는 중 (rename 두 번 사이) → 잠깐 뒤 다시
+                if attempt == _OPEN_RETRIES - 1:
+                    raise
+                time.sleep(_RETRY_DELAY)
+    
+    def __len__(self) -> int:
+        return len(self.index)
+    
+    def __getitem__(self, column: str) -> np.ndarray:
+        return self._arrays[column]
+    
+    def __contains__(self, column: str) -> bool:
+        return column in self._arrays
+    
+    @property
+    def dates(self) -> pd.DatetimeIndex:
+        """타임스탬프 인덱스"""
+        return pd.DatetimeIndex(self.index.view('datetime64[ns]'), name="Date")
+    
+    def to_frame(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """메모리 맵을 그대로 참조하는 DataFrame (복사 없음, 읽기 전용)"""
+        columns = columns or self.columns
+        return pd.DataFrame({c: self._arrays[c] for c in columns}, index=self.dates, copy=False)
+    
+    @staticmethod
+    def save(df: pd.DataFrame, path: str) -> None:
+        """
+        DataFrame을 컬럼별 .npy로 저장
+        
+        숫자/불리언 컬럼만 저장한다. 임시 디렉토리에 다 쓴 뒤 기존 디렉토리를 옆으로 옮기고
+        rename으로 교체하므로 다른 프로세스가 읽는 중에 덮어써도 반쯤 쓰인 파일을 보지 않는다.
+        이미 연 메모리 맵은 옮겨진 파일을 계속 참조한다.
+        임시 디렉토리 이름은 호출마다 고유해서 같은 path를 동시에 저장해도 서로 지우지 않는다.
+        """
+        path = Path(path)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}-{uuid.uuid4().hex[:8]}.tmp")
+        tmp_path.mkdir(parents=True)
+        
+        index = pd.DatetimeIndex(df.index).as_unit('ns')
+        np.save(tmp_path / "index.npy", index.asi8)
+        
+        columns = []
+        for c in df.columns:
+            values = df[c].to_numpy()
+            if values.dtype.kind not in "biuf":
+                print(f"⚠️ {c}: 숫자형이 아니라 제외 ({values.dtype})")
+                continue
+            np.save(tmp_path / f"{c}.npy", np.ascontiguousarray(values))
+            columns.append(c)
+        
+        with open(tmp_path / "meta.json", "w") as f:
+            json.dump({"columns": columns, "rows": len(df)}, f, indent=2)
+        
+        # 기존 디렉토리는 지우지 않고 옆으로 옮긴 뒤 새 디렉토리를 넣고 나서 삭제한다
+        # (path가 없거나 반쯤 지워진 상태로 보이는 구간은 rename 두 번 사이뿐)
+        old_path = None
+        if path.exists():
+            old_path = tmp_path.with_suffix(".old")
+            try:
+                path.rename(old_path)
+            except FileNotFoundError:
+                old_path = None  # 다른 프로세스가 먼저 옮김
+        try:
+            for attempt in range(_OPEN_RETRIES):
+                try:
+                    tmp_path.rename(path)
+                    break
+                except OSError:
+                    if (path / "meta.json").exists():
+                        # 다른 프로세스가 먼저 같은 내용을 저장함 → 그쪽 결과를 쓴다
+                        shutil.rmtree(tmp_path, ignore_errors=True)
+                        break
+                    # 다른 프로세스가 교체 중 (기존 디렉토리를 옮긴 직후) → 잠깐 뒤 다시
+                    if attempt == _OPEN_RETRIES - 1:
+                        shutil.rmtree(tmp_path, ignore_errors=True)
+                        raise
+                    time.sleep(_RETRY_DELAY)
+        finally:
+            if old_path is not None:
+                shutil.rmtree(old_path, ignore_errors=True)
+    
+    @classmethod
+    def from_csv(cls, csv_path: str, path: str = None, compact: bool = False) -> "OHLCVArrays":
+        """
+        CSV에 대응하는 배열 디렉토리를 열기 (없거나 CSV가 더 새로우면 다시 생성)
+        
+        Args:
+            csv_path: 원본 CSV (예: data/btc_4h_5y.csv)
+            path: 배열 디렉토리 (기본값: data/arrays/{CSV 이름}, compact면 {CSV 이름}_compact)
+            compact: True면 compact_frame 표현 (float32 + 1바이트 bool)으로 저장
+        """
+        csv_path = Path(csv_path)
+        stem = f"{csv_path.stem}_compact" if compact else csv_path.stem
+        path = Path(path) if path else csv_path.parent / "arrays" / stem
+        meta_file = path / "meta.json"
+        
+        if not meta_file.exists() or meta_file.stat().st_mtime < csv_path.stat().st_mtime:
+            df = pd.read_csv(csv_path, index_col=0, parse_dates=True)
+            if compact:
+                df = compact_frame(df)
+            cls.save(df, path)
+            print(f"✅ {csv_path} → {path} ({len(df)}봉)")
+        
+        return cls(path)
@@ -0,0 +1,172 @@
+"""거래소 OHLCV 백필 모듈 (페이지 단위 저장 + 재개)"""
+
+import time
+import threading
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from .store import OHLCVStore
+from ..utils.helpers import INTERVAL_SECONDS
+
+
+class RateLimiter:
+    """
+    적응형 요청 간격 조절기
+    
+    성공하면 간격을 조금씩 줄이고(decrease 배), 실패하면 크게 늘린다(increase 배).
+    여러 스레드가 같은 거래소를 호출할 때 하나를 공유한다.
+    """
+    
+    def __init__(self, initial: float = 0.3, min_interval: float = 0.05,
+                 max_interval: float = 10.0, decrease: float = 0.9, increase: float = 2.0):
+        """
+        Args:
+            initial: 시작 요청 간격 (초)
+            min_interval: 최소 간격
+            max_interval: 최대 간격
+            decrease: 성공 시 곱할 값
+            increase: 실패 시 곱할 값
+        """
+        self.interval = initial
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.decrease = decrease
+        self.increase = increase
+        self._next_time = 0.0
+        self._lock = threading.Lock()
+    
+    def wait(self) -> None:
+        """다음 요청 가능 시각까지 대기"""
+        with self._lock:
+            now = time.monotonic()
+            wait_time = max(0.0, self._next_time - now)
+            self._next_time = max(now, self._next_time) + self.interval
+        if wait_time > 0:
+            time.sleep(wait_time)
+    
+    def success(self) -> None:
+        with self._lock:
+            self.interval = max(self.min_interval, self.interval * self.decrease)
+    
+    def failure(self) -> None:
+        with self._lock:
+            self.interval = min(self.max_interval, self.interval * self.increase)
+
+
+class Backfiller:
+    """
+    ccxt 호환 거래소에서 OHLCV를 페이지 단위로 받아 OHLCVStore에 바로 저장
+    
+    - 받은 페이지는 즉시 저장되므로 중간에 죽어도 다음 실행 때 마지막 저장 봉 이후부터 재개
+    - 아직 마감되지 않은 봉은 저장하지 않음 (재개 시 누락/중복 없음)
+    - exchange는 fetch_ohlcv(symbol, timeframe, since=, limit=)만 있으면 됨 (가짜 거래소로 테스트 가능)
+    """
+    
+    def __init__(self, exchange, store: OHLCVStore = None, page_limit: int = 300,
+                 max_retries: int = 5, rate_limiter: RateLimiter = None, max_workers: int = 4):
+        """
+        Args:
+            exchange: ccxt 거래소 객체 (또는 같은 인터페이스의 가짜 객체)
+            store: 저장소 (기본값: data/store)
+            page_limit: 요청당 캔들 수
+            max_retries: 연속 실패 허용 횟수 (넘으면 해당 작업 중단, 다음 실행 때 재개)
+            rate_limiter: 요청 간격 조절기 (기본값: 새로 생성)
+            max_workers: run_many 동시 작업 수
+        """
+        self.exchange = exchange
+        self.store = store or OHLCVStore()
+        self.page_limit = page_limit
+        self.max_retries = max_retries
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.max_workers = max_workers
+    
+    @staticmethod
+    def _to_frame(candles: list) -> pd.DataFrame:
+        """ccxt 캔들 리스트 → DataFrame"""
+        df = pd.DataFrame(candles, columns=['timestamp', 'Open', 'High', 'Low', 'Close', 'Volume'])
+        df['Date'] = pd.to_datetime(df['timestamp'], unit='ms')
+        df = df.set_index('Date').drop('timestamp', axis=1)
+        return df[~df.index.duplicated(keep='last')].sort_index()
+    
+    def backfill(self, symbol: str, timeframe: str = '4h', start: str = '2020-01-01') -> int:
+        """
+        단일 심볼/타임프레임 백필
+        
+        Args:
+            symbol: 거래소 심볼 (예: 'BTC/USDT')
+            timeframe: 봉 간격 (1h, 4h, 1d)
+            start: 저장된 데이터가 없을 때 시작 시각
+        
+        Returns:
+            이번 실행에서 저장한 봉 수
+        """
+        tf_ms = INTERVAL_SECONDS[timeframe] * 1000
+        
+        last = self.store.last_timestamp(symbol, timeframe)
+        if last is not None:
+            since = int(last.value // 10**6) + tf_ms
+            print(f"🔁 {symbol} {timeframe}: {last} 이후부터 재개")
+        else:
+            since = int(pd.Timestamp(start).value // 10**6)
+            print(f"📅 {symbol} {timeframe}: {start}부터 수집 시작")
+        
+        written = 0
+        requests = 0
+        failures = 0
+        
+        while True:
+            self.rate_limiter.wait()
+            try:
+                candles = self.exchange.fetch_ohlcv(symbol, timeframe, since=since, limit=self.page_limit)
+            except Exception as e:
+                self.rate_limiter.failure()
+                failures += 1
+                if failures > self.max_retries:
+                    print(f"   ❌ {symbol} {timeframe}: {failures}회 연속 실패로 중단 ({e}) - 다음 실행 때 재개")
+                    break
+                print(f"   ⚠️ {symbol} {timeframe} 오류: {e} (간격 {self.rate_limiter.interval:.2f}초)")
+                continue
+            
+            self.rate_limiter.success()
+            failures = 0
+            requests += 1
+            
+            if not candles:
+                break
+            
+            # 마감된 봉만 저장
+            now_ms = int(time.time() * 1000)
+            closed = [c for c in candles if c[0] + tf_ms <= now_ms]
+            if closed:
+                df = self._to_frame(closed)
+                self.store.write(symbol, timeframe, df)
+                written += len(df)
+                print(f"   {symbol} {timeframe} 요청 {requests}: {len(closed)}개 저장 (~ {df.index[-1].strftime('%Y-%m-%d %H:%M')})")
+            
+            if len(closed) < len(candles) or candles[-1][0] + tf_ms >= now_ms:
+                break
+            
+            since = candles[-1][0] + tf_ms
+        
+        # 페이지마다 생긴 part 파일을 연도별로 병합
+        if written:
+            self.store.compact(symbol, timeframe)
+        
+        print(f"✅ {symbol} {timeframe}: {written}개 봉 저장")
+        return written
+    
+    def run_many(self, jobs: List[Tuple[str, str]], start: str = '2020-01-01') -> Dict[Tuple[str, str], int]:
+        """
+        여러 (심볼, 타임프레임) 동시 백필 (rate limiter는 공유)
+        
+        Returns:
+            {(symbol, timeframe): 저장한 봉 수}
+        """
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(jobs))) as pool:
+            counts = list(pool.map(lambda job: self.backfill(job[0], job[1], start), jobs))
+        return dict(zip(jobs, counts))
+    
+    def load(self, symbol: str, timeframe: str = '4h', **kwargs) -> Optional[pd.DataFrame]:
+        """저장된 데이터 읽기 (OHLCVStore.read 인자 그대로 전달)"""
+        return self.store.read(symbol, timeframe, **kwargs)
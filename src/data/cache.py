@@ -4,22 +4,37 @@ import pandas as pd
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Optional, Dict
-import json
+
+from .metadata import MetadataIndex
+from ..utils.helpers import next_bar_boundary, INTERVAL_SECONDS
 
 
 class DataCache:
     """데이터 캐싱 클래스"""
     
-    def __init__(self, cache_dir: str = "data/cache", max_age_hours: int = 1):
+    def __init__(self, cache_dir: str = "data/cache", max_age_hours: int = 1,
+                 max_tail_files: int = 24, interval: Optional[str] = None,
+                 grace_minutes: float = 5):
         """
         Args:
             cache_dir: 캐시 디렉토리 경로
             max_age_hours: 캐시 유효 시간 (코인은 24시간 거래라 1시간으로 짧게)
+            max_tail_files: tail 파일이 이 개수를 넘으면 본 파일로 병합(compaction)
+            interval: 봉 간격 (1h, 4h, 1d). 지정하면 max_age_hours 대신
+                      다음 봉 마감 시각 + grace_minutes 까지 유효
+            grace_minutes: 봉 마감 후 데이터 반영까지 기다리는 시간
         """
+        if interval is not None and interval not in INTERVAL_SECONDS:
+            raise ValueError(f"지원하지 않는 interval: {interval}")
+        
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.max_age = timedelta(hours=max_age_hours)
-        self.metadata_file = self.cache_dir / "metadata.json"
+        self.interval = interval
+        self.grace = timedelta(minutes=grace_minutes)
+        self.max_tail_files = max_tail_files
+        self.metadata_file = self.cache_dir / "metadata.json"  # 이전 형식 (처음 열 때 가져옴)
+        self.index = MetadataIndex(self.cache_dir / "metadata.db", legacy_json=self.metadata_file)
     
     def _get_cache_path(self, ticker: str) -> Path:
         """캐시 파일 경로 반환"""
@@ -27,17 +42,15 @@ class DataCache:
         safe_ticker = ticker.replace('-', '_')
         return self.cache_dir / f"{safe_ticker}.parquet"
     
-    def _load_metadata(self) -> Dict:
-        """메타데이터 로드"""
-        if self.metadata_file.exists():
-            with open(self.metadata_file, "r") as f:
-                return json.load(f)
-        return {}
+    def _get_tail_path(self, ticker: str, start: pd.Timestamp) -> Path:
+        """tail 파일 경로 반환 (첫 봉 시각 기준 이름 → 같은 시각부터 다시 받으면 덮어씀)"""
+        safe_ticker = ticker.replace('-', '_')
+        return self.cache_dir / f"{safe_ticker}.tail-{start.strftime('%Y%m%d%H%M%S')}.parquet"
     
-    def _save_metadata(self, metadata: Dict) -> None:
-        """메타데이터 저장"""
-        with open(self.metadata_file, "w") as f:
-            json.dump(metadata, f, indent=2, default=str)
+    def _get_tail_paths(self, ticker: str) -> list:
+        """tail 파일 목록 (시간순)"""
+        safe_ticker = ticker.replace('-', '_')
+        return sorted(self.cache_dir.glob(f"{safe_ticker}.tail-*.parquet"))
     
     def is_valid(self, ticker: str) -> bool:
         """캐시가 유효한지 확인"""
@@ -46,26 +59,64 @@ class DataCache:
         if not cache_path.exists():
             return False
         
-        metadata = self._load_metadata()
-        if ticker not in metadata:
+        entry = self.index.get(ticker)
+        if entry is None:
             return False
         
-        cached_time = datetime.fromisoformat(metadata[ticker]["cached_at"])
-        if datetime.now() - cached_time > self.max_age:
-            return False
+        cached_time = datetime.fromisoformat(entry["cached_at"])
+        return datetime.now() < self._expires_at(cached_time)
+    
+    def _expires_at(self, cached_time: datetime) -> datetime:
+        """캐시 만료 시각 계산"""
+        if self.interval is None:
+            return cached_time + self.max_age
         
-        return True
+        # 봉 경계 기준: 저장 직후 다음 봉이 마감될 때까지는 새 데이터가 없음
+        # 마감 직후 grace 안에 받은 데이터는 방금 마감된 봉이 빠졌을 수 있으므로 그 grace 끝에 만료
+        # (04:02 저장 → 04:05 만료, 04:06 저장 → 08:05 만료)
+        return next_bar_boundary(cached_time - self.grace, self.interval) + self.grace
+    
+    def expires_at(self, ticker: str) -> Optional[datetime]:
+        """캐시 만료 예정 시각 (캐시 없으면 None)"""
+        entry = self.index.get(ticker)
+        if entry is None:
+            return None
+        return self._expires_at(datetime.fromisoformat(entry["cached_at"]))
+    
+    def _read(self, ticker: str) -> pd.DataFrame:
+        """본 파일 + tail 파일 병합 (같은 시각은 나중에 받은 봉 우선)"""
+        frames = [pd.read_parquet(self._get_cache_path(ticker))]
+        frames += [pd.read_parquet(p) for p in self._get_tail_paths(ticker)]
+        
+        if len(frames) == 1:
+            return frames[0]
+        
+        df = pd.concat(frames)
+        df = df[~df.index.duplicated(keep='last')]
+        return df.sort_index()
+    
+    def _update_metadata(self, ticker: str, df: pd.DataFrame) -> None:
+        """메타데이터 갱신"""
+        self.index.put(ticker, df, cached_at=datetime.now().isoformat())
     
     def get(self, ticker: str) -> Optional[pd.DataFrame]:
         """캐시에서 데이터 가져오기"""
         if not self.is_valid(ticker):
             return None
         
-        cache_path = self._get_cache_path(ticker)
+        try:
+            return self._read(ticker)
+        except Exception as e:
+            print(f"⚠️ {ticker} 캐시 로드 실패: {e}")
+            return None
+    
+    def get_stale(self, ticker: str) -> Optional[pd.DataFrame]:
+        """유효 시간과 무관하게 저장된 데이터 가져오기 (증분 업데이트용)"""
+        if not self._get_cache_path(ticker).exists():
+            return None
         
         try:
-            df = pd.read_parquet(cache_path)
-            return df
+            return self._read(ticker)
         except Exception as e:
             print(f"⚠️ {ticker} 캐시 로드 실패: {e}")
             return None
@@ -77,36 +128,76 @@ class DataCache:
         try:
             df.to_parquet(cache_path)
             
-            metadata = self._load_metadata()
-            metadata[ticker] = {
-                "cached_at": datetime.now().isoformat(),
-                "rows": len(df),
-                "start_date": str(df.index[0].date()) if len(df) > 0 else None,
-                "end_date": str(df.index[-1].date()) if len(df) > 0 else None
-            }
-            self._save_metadata(metadata)
+            # 전체 저장이므로 기존 tail은 무효
+            for p in self._get_tail_paths(ticker):
+                p.unlink()
+            
+            self._update_metadata(ticker, df)
             
         except Exception as e:
             print(f"⚠️ {ticker} 캐시 저장 실패: {e}")
     
+    def append(self, ticker: str, new_df: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """
+        새로 받은 봉만 tail 파일로 추가 저장
+        
+        본 parquet는 다시 쓰지 않고 마지막 캐시 봉 이후(마지막 봉 포함 - 진행 중이던
+        봉이 확정값으로 바뀌므로)만 별도 파일로 저장한다.
+        tail이 max_tail_files개를 넘으면 본 파일로 병합한다.
+        
+        Args:
+            ticker: 캐시 키
+            new_df: 마지막 캐시 봉 시각 이후로 받은 데이터
+        
+        Returns:
+            병합된 전체 DataFrame (기존 캐시가 없으면 new_df 그대로 저장 후 반환)
+        """
+        cached = self.get_stale(ticker)
+        if cached is None or len(cached) == 0:
+            self.set(ticker, new_df)
+            return new_df
+        
+        tail = new_df[new_df.index >= cached.index[-1]]
+        
+        try:
+            if len(tail) > 0:
+                tail.to_parquet(self._get_tail_path(ticker, tail.index[0]))
+            
+            df = pd.concat([cached, tail])
+            df = df[~df.index.duplicated(keep='last')].sort_index()
+            
+            if len(self._get_tail_paths(ticker)) > self.max_tail_files:
+                self.set(ticker, df)
+            else:
+                self._update_metadata(ticker, df)
+            
+            return df
+            
+        except Exception as e:
+            print(f"⚠️ {ticker} 캐시 추가 저장 실패: {e}")
+            return cached
+    
     def clear(self, ticker: str = None) -> None:
         """캐시 삭제"""
         if ticker:
             cache_path = self._get_cache_path(ticker)
             if cache_path.exists():
                 cache_path.unlink()
+            for p in self._get_tail_paths(ticker):
+                p.unlink()
             
-            metadata = self._load_metadata()
-            if ticker in metadata:
-                del metadata[ticker]
-                self._save_metadata(metadata)
+            self.index.delete(ticker)
         else:
             for f in self.cache_dir.glob("*.parquet"):
                 f.unlink()
-            if self.metadata_file.exists():
-                self.metadata_file.unlink()
+            self.index.clear()
     
     def info(self) -> Dict:
-        """캐시 정보 반환"""
-        return self._load_metadata()
+        """캐시 정보 반환 {key: {cached_at, rows, start_date, end_date, start_ts, end_ts, content_hash}}"""
+        return self.index.all()
+    
+    def content_hash(self, ticker: str) -> Optional[str]:
+        """저장된 데이터의 내용 해시 (다른 캐시의 키로 사용)"""
+        entry = self.index.get(ticker)
+        return entry["content_hash"] if entry else None
 
@@ -0,0 +1,106 @@
+"""
+OHLCV/지표 프레임 압축 표현 모듈 (float32 + 1바이트 불리언 + int64 epoch)
+
+- 실수 컬럼: float32로 바꿔도 값이 rtol 안에서 그대로면 float32 (가격 7자리 유효숫자,
+  기본 rtol은 float32 반올림 상한이라 표현 범위를 벗어난 컬럼만 float64로 남는다)
+- 불리언 컬럼: CSV에서 object로 읽힌 True/False/NaN도 1바이트 bool (NaN은 False,
+  find_buy_signals의 `gc if not pd.isna(gc) else False`와 같은 해석)
+- 시각: DatetimeIndex (int64 epoch ns, OHLCVArrays index.npy와 같은 표현)
+- 파라미터 스윕 불리언 행렬은 pack_bits로 비트마스크 (봉당 1비트)
+
+지표 계산은 float32 가격을 받아도 내부에서 float64로 계산한다 (rolling/ewm/RSI 엔진).
+시그널/거래 결과가 바뀌지 않는지는 verify_compact_precision.py로 확인한다.
+"""
+
+import warnings
+import numpy as np
+import pandas as pd
+from typing import Iterable, Optional
+
+# float32 반올림(최근접) 상대 오차의 상한 2^-24 ≈ 6e-8.
+# 정상 범위 값은 항상 이 안이므로 기본값으로 거부되는 건 float32로 표현할 수 없는 컬럼뿐이다
+# (|x| > 3.4e38 → inf, |x| < 1.2e-38 → 비정규화/0). 2^24보다 큰 정수(Volume)의 끝자리 손실은 허용.
+# RSI가 임계값 바로 옆인 봉의 판단은 원소별 오차로 보장할 수 없으므로 (가격 오차가 봉간 변화량으로
+# 나뉘어 커짐) verify_compact_precision.py가 시그널/거래 비교로 확인한다. 더 엄격하게는 rtol/keep 사용.
+FLOAT32_RTOL = 2.0 ** -24
+
+
+def bool_values(values) -> Optional[np.ndarray]:
+    """
+    True/False(/NaN)만 있는 컬럼이면 bool 배열, 아니면 None
+    
+    NaN은 False로 본다.
+    """
+    values = np.asarray(values)
+    if values.dtype == bool:
+        return values
+    if values.dtype != object:
+        return None
+    filled = np.array([False if v is None or (isinstance(v, float) and np.isnan(v)) else v
+                       for v in values], dtype=object)
+    if not all(isinstance(v, (bool, np.bool_)) for v in filled):
+        return None
+    return filled.astype(bool)
+
+
+def float32_safe(values, rtol: float = FLOAT32_RTOL) -> bool:
+    """float32로 바꿔도 모든 값이 rtol 안에서 같은지 (NaN 위치 포함)"""
+    x = np.asarray(values, dtype=np.float64)
+    with np.errstate(over='ignore', invalid='ignore'):
+        y = x.astype(np.float32).astype(np.float64)
+        same = np.isclose(y, x, rtol=rtol, atol=0.0, equal_nan=True)
+    return bool(same.all())
+
+
+def compact_frame(df: pd.DataFrame, rtol: float = FLOAT32_RTOL, keep: Iterable[str] = ()) -> pd.DataFrame:
+    """
+    압축 표현 DataFrame (새 프레임, 원본은 그대로)
+    
+    Args:
+        df: OHLCV/지표 DataFrame
+        rtol: float32 허용 상대 오차
+        keep: float64로 둘 컬럼
+    
+    Returns:
+        실수 → float32(가능한 컬럼만), 불리언 → bool 인 DataFrame
+    """
+    keep = set(keep)
+    out = {}
+    for c in df.columns:
+        values = df[c].to_numpy()
+        flags = bool_values(values)
+        if flags is not None:
+            out[c] = flags
+        elif values.dtype == np.float64 and c not in keep:
+            if float32_safe(values, rtol):
+                out[c] = values.astype(np.float32)
+            else:
+                warnings.warn(f"{c}: float32 오차가 rtol({rtol})을 넘어 float64 유지", stacklevel=2)
+                out[c] = values
+        else:
+            out[c] = values
+    return pd.DataFrame(out, index=pd.DatetimeIndex(df.index).as_unit('ns'), copy=False)
+
+
+def expand_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """compact_frame 결과를 float64로 되돌리기 (불리언/정수는 그대로)"""
+    return df.astype({c: np.float64 for c in df.columns if df[c].dtype == np.float32})
+
+
+def frame_nbytes(df: pd.DataFrame) -> int:
+    """인덱스 포함 실제 메모리 (object 컬럼은 원소까지)"""
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+def pack_bits(mask: np.ndarray) -> np.ndarray:
+    """
+    불리언 배열/행렬을 비트마스크로 (봉 축 = 0축, 8봉당 1바이트)
+    
+    (봉 수 × 파라미터 수) 시그널 행렬도 열별로 같은 모양을 유지한다.
+    """
+    return np.packbits(np.asarray(mask, dtype=bool), axis=0, bitorder='little')
+
+
+def unpack_bits(packed: np.ndarray, rows: int) -> np.ndarray:
+    """pack_bits 되돌리기 (rows = 원래 봉 수)"""
+    return np.unpackbits(packed, axis=0, count=rows, bitorder='little').astype(bool)
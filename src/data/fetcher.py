@@ -2,64 +2,141 @@
 
 import yfinance as yf
 import pandas as pd
-from typing import Dict, Optional
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, Optional, Callable
 from datetime import datetime
 
 
+def yfinance_history(ticker: str, **kwargs) -> pd.DataFrame:
+    """기본 history provider (yfinance)"""
+    return yf.Ticker(ticker).history(**kwargs)
+
+
 class CoinFetcher:
     """yfinance를 사용한 코인 데이터 fetcher"""
     
-    def __init__(self, tickers: list):
+    def __init__(self, tickers: list, history_provider: Callable = None,
+                 max_workers: int = 4, timeout: float = 30,
+                 retries: int = 2, backoff: float = 1.0):
         """
         Args:
             tickers: 코인 티커 리스트 (예: ['BTC-USD', 'ETH-USD'])
+            history_provider: (ticker, **kwargs) -> DataFrame 함수
+                              (기본값: yfinance, 테스트 시 stub으로 교체)
+            max_workers: 동시 다운로드 스레드 수 (concurrent 모드)
+            timeout: 티커별 요청 타임아웃 (초). provider에 넘기고, concurrent 모드에서는
+                     재시도를 포함한 티커 예산(ticker_budget)을 넘긴 티커를 실패로 처리
+            retries: 실패 시 재시도 횟수
+            backoff: 재시도 대기 시간 (초, 매 재시도마다 2배)
         """
         self.tickers = tickers
+        self.history_provider = history_provider or yfinance_history
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
     
-    def fetch(self, period: str = "5y", interval: str = "1d") -> Dict[str, pd.DataFrame]:
+    def fetch(self, period: str = "5y", interval: str = "1d",
+              start: Optional[datetime] = None,
+              concurrent: bool = False) -> Dict[str, pd.DataFrame]:
         """
         코인 데이터 가져오기
         
         Args:
             period: 데이터 기간 (1y, 2y, 5y, 10y, max)
             interval: 봉 간격 (1h, 4h, 1d 등)
+            start: 지정하면 period 대신 이 시각부터 가져옴 (증분 업데이트용)
+            concurrent: True면 티커들을 스레드 풀에서 동시에 다운로드
         
         Returns:
             {ticker: DataFrame} 형태의 딕셔너리
         """
-        result = {}
+        if concurrent and len(self.tickers) > 1:
+            frames = self._download_concurrent(period, interval, start)
+        else:
+            frames = [self._download(t, period, interval, start) for t in self.tickers]
         
-        for ticker in self.tickers:
-            interval_name = "일봉" if interval == "1d" else f"{interval}봉"
-            print(f"📥 {ticker} {interval_name} 데이터 다운로드 중...")
-            
+        return {t: df for t, df in zip(self.tickers, frames) if df is not None}
+    
+    @property
+    def ticker_budget(self) -> float:
+        """티커 하나에 허용하는 최대 시간 (초): 시도마다 timeout + 재시도 백오프 대기"""
+        return self.timeout * (self.retries + 1) + self.backoff * (2 ** self.retries - 1)
+    
+    def _download_concurrent(self, period: str, interval: str,
+                             start: Optional[datetime]) -> list:
+        """
+        스레드 풀 동시 다운로드
+        
+        provider가 timeout을 지키지 않고 멈춰도 fetch가 같이 멈추지 않도록
+        티커 예산 × 대기열 순번만큼만 기다린다. 시간 안에 끝나지 않은 티커는
+        취소(아직 시작 전)하거나 결과를 버리고 실패(None)로 처리한다.
+        """
+        workers = min(self.max_workers, len(self.tickers))
+        rounds = math.ceil(len(self.tickers) / workers)
+        pool = ThreadPoolExecutor(max_workers=workers)
+        futures = [pool.submit(self._download, t, period, interval, start) for t in self.tickers]
+        try:
+            wait(futures, timeout=self.ticker_budget * rounds)
+            frames = []
+            for ticker, future in zip(self.tickers, futures):
+                if future.done():
+                    frames.append(future.result())
+                else:
+                    future.cancel()
+                    print(f"❌ {ticker} 다운로드 시간 초과 ({self.ticker_budget:.1f}초) - 제외")
+                    frames.append(None)
+        finally:
+            # 멈춘 스레드를 기다리지 않는다 (끝나면 결과는 버려짐)
+            pool.shutdown(wait=False, cancel_futures=True)
+        return frames
+    
+    def _download(self, ticker: str, period: str, interval: str,
+                  start: Optional[datetime]) -> Optional[pd.DataFrame]:
+        """단일 티커 다운로드 (재시도 + 백오프)"""
+        interval_name = "일봉" if interval == "1d" else f"{interval}봉"
+        print(f"📥 {ticker} {interval_name} 데이터 다운로드 중...")
+        
+        if start is not None:
+            kwargs = {'start': start, 'interval': interval}
+        else:
+            kwargs = {'period': period, 'interval': interval}
+        
+        for attempt in range(self.retries + 1):
             try:
-                # yfinance로 데이터 가져오기
-                coin = yf.Ticker(ticker)
-                df = coin.history(period=period, interval=interval)
-                
-                if df.empty:
-                    print(f"⚠️ {ticker}: 데이터 없음")
-                    continue
-                
-                # 컬럼명 정리
-                df = df[['Open', 'High', 'Low', 'Close', 'Volume']]
-                
-                # 인덱스를 datetime으로 확실히 변환
-                df.index = pd.to_datetime(df.index)
-                if df.index.tz is not None:
-                    df.index = df.index.tz_localize(None)  # timezone 제거
-                
-                unit = "개" if interval != "1d" else "일"
-                print(f"✅ {ticker}: {len(df)}{unit} 데이터 로드 완료 ({interval_name})")
-                print(f"   📅 {df.index[0]} ~ {df.index[-1]}")
-                
-                result[ticker] = df
-                
+                df = self.history_provider(ticker, timeout=self.timeout, **kwargs)
+                break
             except Exception as e:
-                print(f"❌ {ticker} 다운로드 실패: {e}")
+                if attempt == self.retries:
+                    print(f"❌ {ticker} 다운로드 실패: {e}")
+                    return None
+                wait = self.backoff * (2 ** attempt)
+                print(f"⚠️ {ticker} 다운로드 실패 ({e}) - {wait:.1f}초 후 재시도")
+                time.sleep(wait)
+        
+        if df.empty:
+            print(f"⚠️ {ticker}: 데이터 없음")
+            return None
+        
+        try:
+            # 컬럼명 정리
+            df = df[['Open', 'High', 'Low', 'Close', 'Volume']]
+            
+            # 인덱스를 datetime으로 확실히 변환
+            df.index = pd.to_datetime(df.index)
+            if df.index.tz is not None:
+                df.index = df.index.tz_localize(None)  # timezone 제거
+        except Exception as e:
+            print(f"❌ {ticker} 데이터 변환 실패: {e}")
+            return None
+        
+        unit = "개" if interval != "1d" else "일"
+        print(f"✅ {ticker}: {len(df)}{unit} 데이터 로드 완료 ({interval_name})")
+        print(f"   📅 {df.index[0]} ~ {df.index[-1]}")
         
-        return result
+        return df
     
     def fetch_single(self, ticker: str, period: str = "5y") -> Optional[pd.DataFrame]:
         """단일 코인 데이터 가져오기"""
@@ -0,0 +1,154 @@
+"""캐시 + 다운로드 통합 로더"""
+
+import pandas as pd
+from typing import List, Optional
+
+from .cache import DataCache
+from .fetcher import CoinFetcher, validate_data
+from .resample import Resampler
+from .store import OHLCVStore
+from .validator import DataValidator
+from ..utils.helpers import INTERVAL_SECONDS
+
+
+def _repair(df: Optional[pd.DataFrame], interval: str, gap_method: Optional[str]) -> Optional[pd.DataFrame]:
+    """gap_method가 있으면 봉 격자 복구 (저장본은 그대로, GapReport는 df.attrs['gap_report'])"""
+    if gap_method is None or df is None or len(df) == 0:
+        return df
+    repaired, report = DataValidator.repair_gaps(df, interval, method=gap_method)
+    repaired.attrs['gap_report'] = report
+    return repaired
+
+
+def load_ohlcv(ticker: str, cache: DataCache, cache_key: str = None,
+               period: str = "5y", interval: str = "1d",
+               incremental: bool = True, gap_method: Optional[str] = None) -> Optional[pd.DataFrame]:
+    """
+    캐시 우선으로 OHLCV 데이터 로드
+    
+    캐시가 만료됐어도 저장된 데이터가 있으면 마지막 봉 이후만 받아서 이어붙인다.
+    저장된 데이터가 없을 때만 period 전체를 다운로드한다.
+    
+    Args:
+        ticker: 코인 티커 (예: 'BTC-USD')
+        cache: 사용할 DataCache
+        cache_key: 캐시 키 (기본값: ticker)
+        period: 전체 다운로드 시 기간
+        interval: 봉 간격
+        incremental: False면 만료 시 항상 전체 다운로드
+        gap_method: 누락 봉 처리 - 'flat'(직전 종가로 채움) / 'mask'(NaN + is_gap 표시) /
+                    None(그대로). DataValidator.repair_gaps 참고
+    
+    Returns:
+        DataFrame (실패 시 None)
+    """
+    df = _load_ohlcv(ticker, cache, cache_key or ticker, period, interval, incremental)
+    return _repair(df, interval, gap_method)
+
+
+def _load_ohlcv(ticker: str, cache: DataCache, cache_key: str, period: str, interval: str,
+                incremental: bool) -> Optional[pd.DataFrame]:
+    df = cache.get(cache_key)
+    if df is not None:
+        return df
+    
+    fetcher = CoinFetcher([ticker])
+    
+    if incremental:
+        cached = cache.get_stale(cache_key)
+        if cached is not None and len(cached) > 0:
+            data = fetcher.fetch(interval=interval, start=cached.index[-1])
+            if ticker not in data:
+                # 다운로드 실패 시 기존 데이터라도 사용
+                return cached
+            
+            tail, _ = validate_data(data[ticker], ticker)
+            return cache.append(cache_key, tail)
+    
+    data = fetcher.fetch(period=period, interval=interval)
+    if ticker not in data:
+        return None
+    
+    df, _ = validate_data(data[ticker], ticker)
+    cache.set(cache_key, df)
+    return df
+
+
+def load_resampled(ticker: str, interval: str, base_cache: DataCache,
+                   base_interval: str = "1h", period: str = "2y",
+                   resampler: Resampler = None,
+                   history: Optional[pd.DataFrame] = None,
+                   gap_method: Optional[str] = None) -> Optional[pd.DataFrame]:
+    """
+    기본 봉(base_interval) 하나만 받아 저장하고 interval 봉은 거기서 파생
+    
+    4시간봉/일봉 대시보드가 같은 1시간봉 캐시를 공유하므로 다운로드가 한 번만 일어나고
+    두 해상도의 가격이 서로 어긋나지 않는다.
+    
+    Args:
+        ticker: 코인 티커 (예: 'BTC-USD')
+        interval: 만들 봉 간격 (4h, 1d)
+        base_cache: 기본 봉 캐시 (interval=base_interval로 만든 DataCache)
+        base_interval: 저장할 가장 작은 봉 간격
+        period: 기본 봉 전체 다운로드 기간 (yfinance 1시간봉은 최대 2년)
+        resampler: 파생 봉 캐시 (기본값: data/cache_resampled)
+        history: 기본 봉 기간보다 오래된 구간을 채울 interval 봉 데이터
+                 (예: 5년 일봉 - 겹치는 구간은 파생 봉 우선)
+        gap_method: interval 봉 누락 처리 (load_ohlcv와 동일, history 구간 포함)
+    
+    Returns:
+        DataFrame (실패 시 history 또는 None)
+    """
+    base_key = f"{ticker}_{base_interval}"
+    base = load_ohlcv(ticker, base_cache, base_key, period=period, interval=base_interval)
+    if base is None or len(base) == 0:
+        return _repair(history, interval, gap_method)
+    
+    resampler = resampler or Resampler()
+    df = resampler.resample(base_key, base, interval, source_hash=base_cache.content_hash(base_key))
+    
+    if history is not None and len(df) > 0:
+        older = history[history.index < df.index[0]][df.columns]
+        df = pd.concat([older, df])
+    
+    return _repair(df, interval, gap_method)
+
+
+def load_window(store: OHLCVStore, ticker: str, interval: str, start, end=None,
+                lookback: int = 0, columns: Optional[List[str]] = None) -> Optional[pd.DataFrame]:
+    """
+    [start, end] 구간 + 그 앞 lookback봉만 읽기 (지표 워밍업용)
+    
+    lookback은 TechnicalIndicators.lookback(columns) 값을 넘기고, 계산 후
+    TechnicalIndicators.calculate_window(df, columns, start, end)로 앞부분을 잘라낸다.
+    빠진 봉(거래소 점검 등)이 있으면 읽는 범위를 넓혀 정확히 lookback봉을 맞춘다.
+    
+    Args:
+        store: OHLCVStore
+        ticker: 티커
+        interval: 봉 간격
+        start: 구간 시작 시각 (포함)
+        end: 구간 끝 시각 (포함, None이면 끝까지)
+        lookback: start 앞에 붙일 봉 수
+        columns: 읽을 컬럼 (None이면 전체)
+    
+    Returns:
+        DataFrame (데이터 없으면 None, 저장된 봉이 모자라면 있는 만큼)
+    """
+    start = pd.Timestamp(start)
+    years = store.years(ticker, interval)
+    if not years:
+        return None
+    
+    step = pd.Timedelta(seconds=INTERVAL_SECONDS[interval])
+    first_stored = pd.Timestamp(year=years[0], month=1, day=1)
+    span = lookback
+    while True:
+        read_from = start - step * span
+        df = store.read(ticker, interval, start=read_from, end=end, columns=columns)
+        if df is None:
+            return None
+        head = int(df.index.searchsorted(start))
+        if head >= lookback or read_from <= first_stored:
+            return df.iloc[max(head - lookback, 0):]
+        span *= 2
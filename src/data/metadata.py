@@ -0,0 +1,146 @@
+"""캐시 메타데이터 인덱스 모듈 (SQLite)"""
+
+import json
+import hashlib
+import sqlite3
+import pandas as pd
+from datetime import datetime
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional, Dict
+
+
+COLUMNS = ["cached_at", "rows", "start_date", "end_date", "start_ts", "end_ts", "content_hash"]
+
+
+def content_hash(df: pd.DataFrame) -> str:
+    """DataFrame 내용 해시 (인덱스 + 값, 컬럼명 포함) - 다른 캐시의 키로 사용"""
+    h = hashlib.sha1()
+    h.update(",".join(map(str, df.columns)).encode())
+    h.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+class MetadataIndex:
+    """
+    키별 캐시 메타데이터를 SQLite에 저장하는 인덱스
+    
+    - 키 단위 조회/갱신 (전체 파일 재작성 없음)
+    - WAL 모드 + busy timeout → 대시보드 여러 세션, 최적화 스크립트가 동시에 써도 안전
+    - 기존 metadata.json이 있으면 처음 열 때 한 번 가져옴
+    """
+    
+    def __init__(self, db_path: str, legacy_json: Optional[str] = None, timeout: float = 30):
+        """
+        Args:
+            db_path: SQLite 파일 경로
+            legacy_json: 가져올 기존 metadata.json 경로
+            timeout: 잠금 대기 시간 (초)
+        """
+        self.db_path = Path(db_path)
+        self.timeout = timeout
+        
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS entries (
+                    key TEXT PRIMARY KEY,
+                    cached_at TEXT NOT NULL,
+                    rows INTEGER,
+                    start_date TEXT,
+                    end_date TEXT,
+                    start_ts TEXT,
+                    end_ts TEXT,
+                    content_hash TEXT
+                )
+            """)
+        
+        if legacy_json and Path(legacy_json).exists():
+            self._import_json(Path(legacy_json))
+    
+    @contextmanager
+    def _connect(self):
+        """연결 생성 (호출마다 새 연결 → 스레드/프로세스 간 공유 없음, 끝나면 commit 후 닫음)"""
+        conn = sqlite3.connect(self.db_path, timeout=self.timeout)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+    
+    def _import_json(self, json_path: Path) -> None:
+        """
+        기존 metadata.json 가져오기 (이미 있는 키는 유지)
+        
+        cached_at이 없거나 ISO 형식이 아닌 항목은 건너뛴다 (메타데이터 없는 캐시 → 다음 조회 때 다시 받음).
+        """
+        try:
+            with open(json_path, "r") as f:
+                legacy = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ {json_path} 읽기 실패: {e}")
+            return
+        
+        rows, skipped = [], []
+        for key, entry in legacy.items():
+            cached_at = entry.get("cached_at") if isinstance(entry, dict) else None
+            try:
+                datetime.fromisoformat(cached_at)
+            except (TypeError, ValueError):
+                skipped.append(key)
+                continue
+            rows.append((key, cached_at, entry.get("rows"), entry.get("start_date"), entry.get("end_date")))
+        
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO entries (key, cached_at, rows, start_date, end_date) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+        if skipped:
+            print(f"⚠️ {json_path}: cached_at이 없거나 잘못된 항목 {len(skipped)}개 건너뜀 ({', '.join(skipped)})")
+        try:
+            json_path.rename(json_path.with_suffix(".json.migrated"))
+        except OSError:
+            pass  # 다른 프로세스가 먼저 옮김
+    
+    def get(self, key: str) -> Optional[Dict]:
+        """키 메타데이터 조회"""
+        with self._connect() as conn:
+            row = conn.execute(
+                f"SELECT {', '.join(COLUMNS)} FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+        return dict(zip(COLUMNS, row)) if row else None
+    
+    def put(self, key: str, df: pd.DataFrame, cached_at: str) -> None:
+        """키 메타데이터 저장 (행 수, 기간, 내용 해시 기록)"""
+        has_rows = len(df) > 0
+        entry = (
+            cached_at,
+            len(df),
+            str(df.index[0].date()) if has_rows else None,
+            str(df.index[-1].date()) if has_rows else None,
+            df.index[0].isoformat() if has_rows else None,
+            df.index[-1].isoformat() if has_rows else None,
+            content_hash(df),
+        )
+        with self._connect() as conn:
+            conn.execute(
+                f"INSERT OR REPLACE INTO entries (key, {', '.join(COLUMNS)}) "
+                f"VALUES (?, {', '.join('?' * len(COLUMNS))})",
+                (key,) + entry
+            )
+    
+    def delete(self, key: str) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+    
+    def clear(self) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM entries")
+    
+    def all(self) -> Dict[str, Dict]:
+        """전체 메타데이터 {key: entry}"""
+        with self._connect() as conn:
+            rows = conn.execute(f"SELECT key, {', '.join(COLUMNS)} FROM entries").fetchall()
+        return {row[0]: dict(zip(COLUMNS, row[1:])) for row in rows}
@@ -0,0 +1,330 @@
+"""
+로컬 시세 재생 서버 모듈 (오프라인 fetch 벤치마크/부하 테스트용)
+
+저장된 CSV(data/btc_4h_5y.csv 등)를 거래소처럼 제공한다.
+- 지연(latency), 초당 요청 제한(rate limit), 페이지네이션, 실패 주입 설정 가능
+- ReplayExchange: ccxt 대신 Backfiller에 넣는 거래소 객체 (프로세스 내 또는 HTTP)
+- replay_history_provider: yfinance 대신 CoinFetcher에 넣는 history provider
+
+python -m src.data.replay --port 8765 --latency 0.05 --rate-limit 20 --failure-rate 0.05
+"""
+
+import json
+import time
+import random
+import threading
+import urllib.error
+import urllib.parse
+import urllib.request
+import numpy as np
+import pandas as pd
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Optional
+
+from ..utils.helpers import INTERVAL_SECONDS
+
+
+DEFAULT_SOURCES = {
+    'BTC/USDT': 'data/btc_4h_5y.csv',
+    'ETH/USDT': 'data/eth_4h_5y.csv',
+}
+
+PERIOD_DAYS = {'d': 1, 'mo': 30, 'y': 365}
+
+
+class ReplayError(Exception):
+    """주입된 실패 (서버 오류 흉내)"""
+
+
+class RateLimitExceeded(ReplayError):
+    """초당 요청 제한 초과 (HTTP 429 흉내)"""
+
+
+class ReplayMarket:
+    """CSV 기반 OHLCV 재생 시장"""
+    
+    def __init__(self, sources: Dict[str, str] = None, timeframe: str = '4h',
+                 latency: float = 0.0, jitter: float = 0.0,
+                 rate_limit: Optional[float] = None, failure_rate: float = 0.0,
+                 page_limit: int = 300, seed: int = 0):
+        """
+        Args:
+            sources: {심볼: CSV 경로} (기본값: BTC/USDT, ETH/USDT)
+            timeframe: CSV 봉 간격
+            latency: 요청당 지연 (초)
+            jitter: 지연에 더할 최대 랜덤 값 (초)
+            rate_limit: 초당 허용 요청 수 (None이면 제한 없음)
+            failure_rate: 요청 실패 확률 (0~1)
+            page_limit: 요청당 최대 캔들 수
+            seed: 지연/실패 난수 시드 (같은 요청 순서면 같은 결과)
+        """
+        self.timeframe = timeframe
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit = rate_limit
+        self.failure_rate = failure_rate
+        self.page_limit = page_limit
+        
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._tokens = rate_limit or 0.0
+        self._last_refill = time.monotonic()
+        self.request_count = 0
+        
+        self._data = {}
+        for symbol, path in (sources or DEFAULT_SOURCES).items():
+            df = pd.read_csv(path, index_col=0, parse_dates=True)
+            self._data[symbol] = (
+                pd.DatetimeIndex(df.index).as_unit('ms').asi8,
+                df[['Open', 'High', 'Low', 'Close', 'Volume']].to_numpy(dtype=float),
+            )
+    
+    @property
+    def symbols(self) -> list:
+        return list(self._data)
+    
+    def now_ms(self, symbol: str) -> int:
+        """재생 시계: 마지막 봉이 막 마감된 시각"""
+        ts, _ = self._data[symbol]
+        return int(ts[-1]) + INTERVAL_SECONDS[self.timeframe] * 1000
+    
+    def _admit(self) -> float:
+        """rate limit/실패 판정 후 적용할 지연 반환"""
+        with self._lock:
+            self.request_count += 1
+            
+            if self.rate_limit:
+                now = time.monotonic()
+                self._tokens = min(self.rate_limit,
+                                   self._tokens + (now - self._last_refill) * self.rate_limit)
+                self._last_refill = now
+                if self._tokens < 1:
+                    raise RateLimitExceeded("rate limit exceeded")
+                self._tokens -= 1
+            
+            fail = self._rng.random() < self.failure_rate
+            delay = self.latency + self._rng.random() * self.jitter
+        
+        if fail:
+            time.sleep(delay)
+            raise ReplayError("injected failure")
+        return delay
+    
+    def ohlcv(self, symbol: str, timeframe: str, since: Optional[int] = None,
+              limit: Optional[int] = None) -> list:
+        """
+        ccxt fetch_ohlcv와 같은 형식의 캔들 리스트
+        
+        Args:
+            symbol: 심볼 (예: 'BTC/USDT')
+            timeframe: 봉 간격 (CSV 봉 간격만 지원)
+            since: 시작 시각 (ms, 포함)
+            limit: 최대 캔들 수 (page_limit으로 잘림)
+        """
+        if symbol not in self._data:
+            raise ValueError(f"알 수 없는 심볼: {symbol}")
+        if timeframe != self.timeframe:
+            raise ValueError(f"지원하지 않는 timeframe: {timeframe} (재생 데이터: {self.timeframe})")
+        
+        delay = self._admit()
+        
+        ts, values = self._data[symbol]
+        start = 0 if since is None else int(np.searchsorted(ts, since, side='left'))
+        limit = min(limit or self.page_limit, self.page_limit)
+        end = min(start + limit, len(ts))
+        
+        if delay > 0:
+            time.sleep(delay)
+        
+        return [[int(ts[i])] + values[i].tolist() for i in range(start, end)]
+
+
+class ReplayServer:
+    """ReplayMarket을 HTTP로 제공 (GET /ohlcv?symbol=&timeframe=&since=&limit=)"""
+    
+    def __init__(self, market: ReplayMarket, host: str = '127.0.0.1', port: int = 0):
+        """
+        Args:
+            market: 재생 시장
+            host: 바인딩 주소
+            port: 포트 (0이면 빈 포트 자동 선택)
+        """
+        self.market = market
+        handler = self._make_handler(market)
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self._thread = None
+    
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+    
+    @staticmethod
+    def _make_handler(market: ReplayMarket):
+        class Handler(BaseHTTPRequestHandler):
+            def _send(self, status: int, payload) -> None:
+                body = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def do_GET(self):
+                url = urllib.parse.urlparse(self.path)
+                query = dict(urllib.parse.parse_qsl(url.query))
+                
+                if url.path == '/time':
+                    self._send(200, {'now': market.now_ms(query.get('symbol', market.symbols[0]))})
+                    return
+                if url.path != '/ohlcv':
+                    self._send(404, {'error': 'not found'})
+                    return
+                
+                try:
+                    candles = market.ohlcv(
+                        query['symbol'], query.get('timeframe', market.timeframe),
+                        since=int(query['since']) if 'since' in query else None,
+                        limit=int(query['limit']) if 'limit' in query else None,
+                    )
+                    self._send(200, candles)
+                except RateLimitExceeded as e:
+                    self._send(429, {'error': str(e)})
+                except ReplayError as e:
+                    self._send(503, {'error': str(e)})
+                except (KeyError, ValueError) as e:
+                    self._send(400, {'error': str(e)})
+            
+            def log_message(self, format, *args):
+                pass  # 요청 로그 생략
+        
+        return Handler
+    
+    def start(self) -> "ReplayServer":
+        """백그라운드 스레드에서 서버 시작"""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+    
+    def __enter__(self):
+        return self.start()
+    
+    def __exit__(self, *exc):
+        self.stop()
+
+
+class ReplayExchange:
+    """
+    ccxt 거래소 흉내 (Backfiller, fetch_all_4h_data 대체용)
+    
+    market을 주면 프로세스 내에서, url을 주면 ReplayServer에 HTTP로 요청한다.
+    """
+    
+    def __init__(self, market: ReplayMarket = None, url: str = None, timeout: float = 10):
+        if (market is None) == (url is None):
+            raise ValueError("market 또는 url 중 하나만 지정")
+        self.market = market
+        self.url = url
+        self.timeout = timeout
+    
+    def _get(self, path: str, params: dict):
+        query = urllib.parse.urlencode({k: v for k, v in params.items() if v is not None})
+        try:
+            with urllib.request.urlopen(f"{self.url}{path}?{query}", timeout=self.timeout) as resp:
+                return json.loads(resp.read())
+        except urllib.error.HTTPError as e:
+            if e.code == 429:
+                raise RateLimitExceeded(f"HTTP 429 {path}") from e
+            raise ReplayError(f"HTTP {e.code} {path}") from e
+    
+    def load_markets(self) -> None:
+        pass
+    
+    def fetch_ohlcv(self, symbol: str, timeframe: str = '4h', since: int = None, limit: int = None) -> list:
+        if self.market is not None:
+            return self.market.ohlcv(symbol, timeframe, since=since, limit=limit)
+        return self._get('/ohlcv', {'symbol': symbol, 'timeframe': timeframe, 'since': since, 'limit': limit})
+    
+    def parse8601(self, text: str) -> int:
+        return int(pd.Timestamp(text).value // 10**6)
+
+
+def _period_to_ms(period: str) -> Optional[int]:
+    """'2y', '180d', '6mo' → ms ('max'는 None)"""
+    if period == 'max':
+        return None
+    for unit in ('mo', 'd', 'y'):
+        if period.endswith(unit):
+            return int(period[:-len(unit)]) * PERIOD_DAYS[unit] * 86400 * 1000
+    raise ValueError(f"알 수 없는 period: {period}")
+
+
+def replay_history_provider(market: ReplayMarket,
+                            symbol_map: Callable[[str], str] = None) -> Callable:
+    """
+    CoinFetcher(history_provider=...)에 넣을 yfinance history 대체 함수
+    
+    Args:
+        market: 재생 시장
+        symbol_map: 티커 → 재생 심볼 변환 (기본값: 'BTC-USD' → 'BTC/USDT')
+    
+    Returns:
+        (ticker, period=, interval=, start=, timeout=) -> DataFrame (UTC tz 인덱스)
+    """
+    symbol_map = symbol_map or (lambda t: f"{t.split('-')[0]}/USDT")
+    
+    def history(ticker: str, period: str = '5y', interval: str = '1d',
+                start=None, timeout: float = None) -> pd.DataFrame:
+        symbol = symbol_map(ticker)
+        
+        if start is not None:
+            since = int(pd.Timestamp(start).value // 10**6)
+        else:
+            span = _period_to_ms(period)
+            since = None if span is None else market.now_ms(symbol) - span
+        
+        # 페이지를 넘기며 끝까지 수집 (요청마다 지연/제한/실패 적용)
+        candles = []
+        while True:
+            page = market.ohlcv(symbol, interval, since=since)
+            candles.extend(page)
+            if len(page) < market.page_limit:
+                break
+            since = page[-1][0] + 1
+        
+        df = pd.DataFrame(candles, columns=['timestamp', 'Open', 'High', 'Low', 'Close', 'Volume'])
+        df.index = pd.to_datetime(df.pop('timestamp'), unit='ms', utc=True)
+        df.index.name = 'Datetime'
+        return df
+    
+    return history
+
+
+if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="로컬 시세 재생 서버")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--jitter', type=float, default=0.0)
+    parser.add_argument('--rate-limit', type=float, default=None)
+    parser.add_argument('--failure-rate', type=float, default=0.0)
+    parser.add_argument('--page-limit', type=int, default=300)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    
+    market = ReplayMarket(latency=args.latency, jitter=args.jitter, rate_limit=args.rate_limit,
+                          failure_rate=args.failure_rate, page_limit=args.page_limit, seed=args.seed)
+    server = ReplayServer(market, args.host, args.port)
+    
+    print(f"🛰️ 재생 서버 실행: {server.url} (심볼: {', '.join(market.symbols)})")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
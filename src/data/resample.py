@@ -0,0 +1,115 @@
+"""OHLCV 다중 해상도 리샘플링 모듈 (기본 봉 → 4h/1d 파생)"""
+
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Optional
+
+from .metadata import content_hash
+from ..utils.helpers import INTERVAL_SECONDS, INTERVAL_ORIGIN_SECONDS
+
+
+def resample_ohlcv(df: pd.DataFrame, interval: str, align_start: bool = True) -> pd.DataFrame:
+    """
+    OHLCV를 더 큰 봉으로 합치기 (한 번의 벡터 연산, df.resample().agg()와 같은 결과)
+    
+    봉 경계는 UTC 00:00 기준 정렬, 주봉은 월요일 시작 (next_bar_boundary와 동일).
+    데이터가 없는 구간은 봉을 만들지 않는다 (resample 후 dropna와 같음).
+    
+    Args:
+        df: 정렬된 OHLCV (결측치 없음, validate_data 통과 데이터)
+        interval: 목표 봉 간격 (4h, 1d 등)
+        align_start: True면 첫 경계 이전 봉(앞쪽 잘린 봉)은 버림.
+                     마지막 진행 중 봉은 yfinance처럼 그대로 둔다.
+    
+    Returns:
+        OHLCV DataFrame (인덱스: 각 봉 시작 시각)
+    """
+    step = INTERVAL_SECONDS[interval] * 10**9
+    origin = INTERVAL_ORIGIN_SECONDS.get(interval, 0) * 10**9
+    index = pd.DatetimeIndex(df.index)
+    ts = index.as_unit('ns').asi8
+    buckets = (ts - origin) // step * step + origin
+    
+    if align_start and len(ts) > 0 and ts[0] != buckets[0]:
+        keep = buckets > buckets[0]
+        df, ts, buckets = df[keep], ts[keep], buckets[keep]
+    
+    if len(ts) == 0:
+        return df[['Open', 'High', 'Low', 'Close', 'Volume']].iloc[:0]
+    
+    # 봉이 바뀌는 위치 → reduceat 구간 시작
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    ends = np.r_[starts[1:], len(ts)] - 1
+    
+    out = pd.DataFrame({
+        'Open': df['Open'].to_numpy()[starts],
+        'High': np.maximum.reduceat(df['High'].to_numpy(), starts),
+        'Low': np.minimum.reduceat(df['Low'].to_numpy(), starts),
+        'Close': df['Close'].to_numpy()[ends],
+        'Volume': np.add.reduceat(df['Volume'].to_numpy(), starts),
+    }, index=pd.DatetimeIndex(buckets[starts].view('datetime64[ns]'), name=index.name).as_unit(index.unit))
+    return out
+
+
+class Resampler:
+    """
+    파생 봉 캐시
+    
+    원본 내용 해시별로 결과를 저장하므로 원본이 바뀌지 않으면 다시 계산하지 않는다.
+    파일명: {cache_dir}/{키}_{interval}-{원본 해시 앞 16자}.parquet
+    """
+    
+    def __init__(self, cache_dir: str = "data/cache_resampled"):
+        """
+        Args:
+            cache_dir: 파생 봉 캐시 디렉토리
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+    
+    def _prefix(self, key: str, interval: str) -> str:
+        safe_key = key.replace('-', '_').replace('/', '_')
+        return f"{safe_key}_{interval}"
+    
+    def resample(self, key: str, df: pd.DataFrame, interval: str,
+                 source_hash: Optional[str] = None) -> pd.DataFrame:
+        """
+        캐시 우선 리샘플링
+        
+        Args:
+            key: 원본 이름 (예: 'BTC-USD_1h')
+            df: 원본 OHLCV
+            interval: 목표 봉 간격
+            source_hash: 원본 내용 해시 (DataCache.content_hash 값이 있으면 재계산 생략)
+        
+        Returns:
+            파생 OHLCV DataFrame
+        """
+        source_hash = source_hash or content_hash(df)
+        prefix = self._prefix(key, interval)
+        path = self.cache_dir / f"{prefix}-{source_hash[:16]}.parquet"
+        
+        if path.exists():
+            try:
+                return pd.read_parquet(path)
+            except Exception as e:
+                print(f"⚠️ {path.name} 로드 실패: {e}")
+        
+        out = resample_ohlcv(df, interval)
+        
+        try:
+            # 이전 원본으로 만든 파일은 더 이상 쓰이지 않음
+            for p in self.cache_dir.glob(f"{prefix}-*.parquet"):
+                p.unlink()
+            out.to_parquet(path)
+        except Exception as e:
+            print(f"⚠️ {path.name} 저장 실패: {e}")
+        
+        return out
+    
+    def clear(self, key: str = None) -> None:
+        """캐시 삭제 (key 지정 시 해당 원본의 파생 봉만)"""
+        pattern = f"{self._prefix(key, '*')}-*.parquet" if key else "*.parquet"
+        for p in self.cache_dir.glob(pattern):
+            p.unlink()
@@ -0,0 +1,200 @@
+"""파티션 컬럼형 OHLCV 저장소 (ticker/interval/year)"""
+
+import os
+import tempfile
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from pathlib import Path
+from typing import Optional, List
+
+
+class OHLCVStore:
+    """
+    ticker/interval/year 단위로 나눈 parquet 데이터셋
+    
+    디렉토리 구조 (hive 파티션):
+        {root}/ticker=BTC_USD/interval=4h/year=2024/part-{첫봉시각}.parquet
+    
+    읽을 때 기간/컬럼 필터를 주면 해당 연도 파티션과 컬럼만 읽는다.
+    """
+    
+    INDEX_NAME = "Date"
+    
+    def __init__(self, root: str = "data/store"):
+        """
+        Args:
+            root: 저장소 루트 디렉토리
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+    
+    def _series_dir(self, ticker: str, interval: str) -> Path:
+        """ticker/interval 디렉토리 경로"""
+        safe_ticker = ticker.replace('-', '_').replace('/', '_')
+        return self.root / f"ticker={safe_ticker}" / f"interval={interval}"
+    
+    def _partition_dir(self, ticker: str, interval: str, year: int) -> Path:
+        """연도 파티션 디렉토리 경로"""
+        return self._series_dir(ticker, interval) / f"year={year}"
+    
+    def exists(self, ticker: str, interval: str) -> bool:
+        """저장된 데이터가 있는지 확인"""
+        return any(self._series_dir(ticker, interval).glob("year=*/*.parquet"))
+    
+    def years(self, ticker: str, interval: str) -> List[int]:
+        """저장된 연도 목록"""
+        series_dir = self._series_dir(ticker, interval)
+        return sorted(int(p.name.split('=')[1]) for p in series_dir.glob("year=*")
+                      if any(p.glob("*.parquet")))
+    
+    @staticmethod
+    def _to_table(df: pd.DataFrame) -> pa.Table:
+        """DataFrame → Arrow 테이블 (인덱스는 timestamp[ns] 컬럼으로)"""
+        out = df.copy()
+        out.index = pd.DatetimeIndex(out.index).as_unit('ns')
+        out.index.name = "timestamp"
+        return pa.Table.from_pandas(out.reset_index(), preserve_index=False)
+    
+    def _read_partition(self, part_dir: Path) -> pd.DataFrame:
+        """연도 파티션 전체 읽기"""
+        frames = [self._from_table(pq.read_table(p)) for p in sorted(part_dir.glob("*.parquet"))]
+        df = pd.concat(frames) if len(frames) > 1 else frames[0]
+        return df[~df.index.duplicated(keep='last')].sort_index()
+    
+    @staticmethod
+    def _file_last(path: Path) -> pd.Timestamp:
+        """part 파일의 마지막 봉 시각 (parquet 푸터 통계만 읽음, 통계가 없으면 timestamp 컬럼)"""
+        meta = pq.ParquetFile(path).metadata
+        col = meta.schema.names.index("timestamp")
+        stats = [meta.row_group(i).column(col).statistics for i in range(meta.num_row_groups)]
+        if stats and all(s is not None and s.has_min_max for s in stats):
+            return pd.Timestamp(max(s.max for s in stats))
+        return pd.Timestamp(pq.read_table(path, columns=["timestamp"])["timestamp"].to_pandas().max())
+    
+    def _rewrite_partition(self, part_dir: Path, df: pd.DataFrame, old_files: List[Path]) -> None:
+        """파티션을 part 파일 하나로 다시 쓰기 (임시 파일에 쓴 뒤 교체, 이름은 프로세스마다 고유)"""
+        fd, tmp_name = tempfile.mkstemp(dir=part_dir, prefix="_compact-", suffix=".tmp")
+        os.close(fd)
+        tmp_path = Path(tmp_name)
+        try:
+            pq.write_table(self._to_table(df), tmp_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        for p in old_files:
+            p.unlink()
+        tmp_path.rename(part_dir / f"part-{df.index[0].strftime('%Y%m%d%H%M%S')}.parquet")
+    
+    def _from_table(self, table: pa.Table) -> pd.DataFrame:
+        """Arrow 테이블 → DataFrame"""
+        df = table.to_pandas().set_index("timestamp")
+        df.index.name = self.INDEX_NAME
+        return df
+    
+    def write(self, ticker: str, interval: str, df: pd.DataFrame) -> None:
+        """
+        데이터 저장 (연도 파티션별)
+        
+        기존 데이터 이후의 봉만 있으면 새 part 파일만 추가하고,
+        기존 구간과 겹치면 해당 연도 파티션만 병합해서 다시 쓴다.
+        겹침 판정은 part 파일 푸터의 timestamp 최댓값만 보므로 이어 쓰기는 파티션 크기와 무관하다.
+        """
+        if len(df) == 0:
+            return
+        
+        df = df[~df.index.duplicated(keep='last')].sort_index()
+        
+        for year, chunk in df.groupby(df.index.year):
+            part_dir = self._partition_dir(ticker, interval, year)
+            part_dir.mkdir(parents=True, exist_ok=True)
+            existing_files = sorted(part_dir.glob("*.parquet"))
+            
+            if existing_files and chunk.index[0] <= max(self._file_last(p) for p in existing_files):
+                # 겹침 → 파티션 재작성
+                merged = pd.concat([self._read_partition(part_dir), chunk])
+                merged = merged[~merged.index.duplicated(keep='last')].sort_index()
+                self._rewrite_partition(part_dir, merged, existing_files)
+                continue
+            
+            part_path = part_dir / f"part-{chunk.index[0].strftime('%Y%m%d%H%M%S')}.parquet"
+            pq.write_table(self._to_table(chunk), part_path)
+    
+    def read(self, ticker: str, interval: str,
+             start=None, end=None,
+             columns: Optional[List[str]] = None) -> Optional[pd.DataFrame]:
+        """
+        데이터 읽기 (파티션/컬럼 pruning)
+        
+        Args:
+            ticker: 티커
+            interval: 봉 간격
+            start: 시작 시각 (포함, None이면 처음부터)
+            end: 종료 시각 (포함, None이면 끝까지)
+            columns: 읽을 컬럼 (None이면 전체)
+        
+        Returns:
+            DataFrame (데이터 없으면 None)
+        """
+        if not self.exists(ticker, interval):
+            return None
+        
+        dataset = ds.dataset(self._series_dir(ticker, interval), format="parquet",
+                             partitioning="hive")
+        
+        # 연도 파티션 필터 → 필요한 파일만 열림
+        expr = None
+        if start is not None:
+            start = pd.Timestamp(start)
+            expr = (ds.field("year") >= start.year) & \
+                   (ds.field("timestamp") >= pa.scalar(start.as_unit('ns'), type=pa.timestamp('ns')))
+        if end is not None:
+            end = pd.Timestamp(end)
+            end_expr = (ds.field("year") <= end.year) & \
+                       (ds.field("timestamp") <= pa.scalar(end.as_unit('ns'), type=pa.timestamp('ns')))
+            expr = end_expr if expr is None else expr & end_expr
+        
+        if columns is None:
+            columns = [c for c in dataset.schema.names if c not in ("timestamp", "year")]
+        
+        table = dataset.to_table(columns=["timestamp"] + list(columns), filter=expr)
+        df = self._from_table(table)
+        return df[~df.index.duplicated(keep='last')].sort_index()
+    
+    def last_timestamp(self, ticker: str, interval: str) -> Optional[pd.Timestamp]:
+        """마지막 저장 봉 시각 (최신 연도 파티션만 읽음)"""
+        years = self.years(ticker, interval)
+        if not years:
+            return None
+        
+        part_dir = self._partition_dir(ticker, interval, years[-1])
+        return max(self._file_last(p) for p in part_dir.glob("*.parquet"))
+    
+    def compact(self, ticker: str, interval: str) -> None:
+        """연도 파티션마다 part 파일을 하나로 병합"""
+        for year in self.years(ticker, interval):
+            part_dir = self._partition_dir(ticker, interval, year)
+            files = sorted(part_dir.glob("*.parquet"))
+            if len(files) <= 1:
+                continue
+            
+            self._rewrite_partition(part_dir, self._read_partition(part_dir), files)
+    
+    def clear(self, ticker: str, interval: str) -> None:
+        """ticker/interval 데이터 삭제"""
+        for p in self._series_dir(ticker, interval).glob("year=*/*.parquet"):
+            p.unlink()
+    
+    def import_csv(self, csv_path: str, ticker: str, interval: str) -> pd.DataFrame:
+        """기존 CSV 파일을 저장소로 가져오기"""
+        df = pd.read_csv(csv_path, index_col=0, parse_dates=True)
+        self.write(ticker, interval, df)
+        print(f"✅ {csv_path} → {self._series_dir(ticker, interval)} ({len(df)}봉)")
+        return df
+    
+    def read_or_import(self, csv_path: str, ticker: str, interval: str, **kwargs) -> Optional[pd.DataFrame]:
+        """저장소에 없으면 CSV에서 가져온 뒤 읽기"""
+        if not self.exists(ticker, interval):
+            self.import_csv(csv_path, ticker, interval)
+        return self.read(ticker, interval, **kwargs)
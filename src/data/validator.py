@@ -2,9 +2,42 @@
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Tuple
+from typing import Dict, Tuple, Optional
 from dataclasses import dataclass
 
+from ..utils.helpers import INTERVAL_SECONDS
+
+
+@dataclass
+class GapReport:
+    """봉 누락(갭) 리포트 데이터 클래스"""
+    interval: str
+    expected_bars: int
+    actual_bars: int
+    missing_bars: int
+    duplicate_bars: int
+    off_grid_bars: int
+    gaps: pd.DataFrame  # start(첫 누락 봉), end(마지막 누락 봉), bars(누락 수)
+    method: Optional[str]
+    off_grid: Optional[pd.DatetimeIndex] = None  # 격자에 맞지 않는 봉 시각 (격자 DataFrame에서 제외됨)
+    
+    @property
+    def coverage(self) -> float:
+        """기대 봉 대비 실제 봉 비율"""
+        return self.actual_bars / self.expected_bars if self.expected_bars else 1.0
+    
+    @property
+    def largest_gap(self) -> int:
+        """가장 긴 연속 누락 봉 수"""
+        return int(self.gaps['bars'].max()) if len(self.gaps) else 0
+    
+    def summary(self) -> str:
+        text = (f"{self.interval} 봉 {self.actual_bars}/{self.expected_bars} "
+                f"(누락 {self.missing_bars}개, 갭 {len(self.gaps)}곳, 최대 {self.largest_gap}봉)")
+        if self.off_grid_bars:
+            text += f", 격자 밖 봉 {self.off_grid_bars}개 제외"
+        return text
+
 
 @dataclass
 class ValidationReport:
@@ -16,6 +49,7 @@ class ValidationReport:
     is_continuous: bool
     price_valid: bool
     issues: list
+    gaps: Optional[GapReport] = None
     
     def is_valid(self) -> bool:
         """데이터가 유효한지 확인"""
@@ -26,8 +60,18 @@ class DataValidator:
     """데이터 검증 클래스"""
     
     @staticmethod
-    def validate(df: pd.DataFrame, ticker: str = "UNKNOWN") -> Tuple[pd.DataFrame, ValidationReport]:
-        """데이터 검증 및 정제"""
+    def validate(df: pd.DataFrame, ticker: str = "UNKNOWN",
+                 interval: Optional[str] = None,
+                 gap_method: Optional[str] = None) -> Tuple[pd.DataFrame, ValidationReport]:
+        """
+        데이터 검증 및 정제
+        
+        Args:
+            df: OHLCV DataFrame
+            ticker: 리포트용 티커
+            interval: 봉 간격. 지정하면 3일 갭 대신 봉 단위 격자로 누락을 찾는다
+            gap_method: repair_gaps의 method ('flat', 'mask', None=탐지만 하고 봉은 채우지 않음)
+        """
         issues = []
         original_len = len(df)
         
@@ -47,7 +91,13 @@ class DataValidator:
         
         # 3. 데이터 연속성 검증 (코인은 365일 거래라 다름)
         is_continuous = True
-        if len(df_clean) > 1:
+        gap_report = None
+        if interval is not None:
+            df_clean, gap_report = DataValidator.repair_gaps(df_clean, interval, method=gap_method)
+            if gap_report.missing_bars > 0 or gap_report.off_grid_bars > 0:
+                is_continuous = False
+                issues.append(f"누락 봉: {gap_report.summary()}")
+        elif len(df_clean) > 1:
             date_diff = df_clean.index.to_series().diff()
             gaps = date_diff[date_diff > pd.Timedelta(days=3)]  # 3일 이상 갭
             if len(gaps) > 0:
@@ -80,8 +130,117 @@ class DataValidator:
             missing_ratio=missing_ratio,
             is_continuous=is_continuous,
             price_valid=price_valid,
-            issues=issues
+            issues=issues,
+            gaps=gap_report
         )
         
         return df_clean, report
+    
+    @staticmethod
+    def repair_gaps(df: pd.DataFrame, interval: str,
+                    method: Optional[str] = None) -> Tuple[pd.DataFrame, GapReport]:
+        """
+        봉 격자 기준 누락 봉 탐지 및 복구 (O(n) 벡터 연산, 정렬/groupby 없음)
+        
+        첫 봉 시각부터 interval 간격 격자를 만들고 각 봉을 격자 위치에 놓는다.
+        누락 봉이 있으면 rolling 창이 시간 기준으로 어긋나므로 격자를 채워서 돌려준다.
+        격자 시각에 맞지 않는 봉은 다른 칸으로 옮기지 않고 GapReport.off_grid에 남긴다
+        ('flat'/'mask' 결과에서는 빠지고, 그 칸에 격자 봉이 없으면 누락으로 센다).
+        
+        Args:
+            df: 시간순 정렬된 OHLCV
+            interval: 봉 간격 ('1m', '1h', '4h', '1d' 등 INTERVAL_SECONDS 키)
+            method: 'flat' - 직전 종가로 평평한 봉 (Volume 0)
+                    'mask' - OHLCV를 NaN으로 두고 표시만
+                    None  - 탐지만 하고 df 그대로 반환 (기본, 복구는 명시적으로 선택)
+        
+        Returns:
+            (격자 DataFrame, GapReport). 'flat'/'mask'는 is_gap 컬럼 추가,
+            OHLCV 외 컬럼의 누락 칸은 NaN (불리언은 False)
+        """
+        if interval not in INTERVAL_SECONDS:
+            raise ValueError(f"지원하지 않는 interval: {interval}")
+        if method not in ("flat", "mask", None):
+            raise ValueError(f"알 수 없는 method: {method}")
+        
+        empty_gaps = pd.DataFrame({'start': pd.DatetimeIndex([]), 'end': pd.DatetimeIndex([]),
+                                   'bars': np.array([], dtype=np.int64)})
+        if len(df) == 0:
+            return df, GapReport(interval, 0, 0, 0, 0, 0, empty_gaps, method, pd.DatetimeIndex([]))
+        
+        index = pd.DatetimeIndex(df.index)
+        step = INTERVAL_SECONDS[interval] * 10**9
+        ts = index.as_unit('ns').asi8
+        
+        # 격자 위치 (격자에서 벗어난 봉은 제외하고 리포트)
+        offset = ts - ts[0]
+        on_grid = offset % step == 0
+        rows = np.flatnonzero(on_grid)
+        pos = offset[rows] // step
+        
+        # 같은 칸에 여러 봉 → 마지막 봉 사용
+        last_in_cell = np.r_[pos[1:] != pos[:-1], True]
+        duplicates = int(len(pos) - np.count_nonzero(last_in_cell))
+        
+        n = int(pos[-1]) + 1
+        present = np.zeros(n, dtype=bool)
+        present[pos] = True
+        actual = int(np.count_nonzero(present))
+        
+        # 갭 구간: 누락 칸이 시작/끝나는 위치
+        edges = np.diff(np.r_[0, (~present).view(np.int8), 0])
+        gap_start = np.flatnonzero(edges == 1)
+        gap_end = np.flatnonzero(edges == -1) - 1
+        grid_origin = ts[0]
+        gaps = pd.DataFrame({
+            'start': pd.DatetimeIndex((grid_origin + gap_start * step).view('datetime64[ns]')).as_unit(index.unit),
+            'end': pd.DatetimeIndex((grid_origin + gap_end * step).view('datetime64[ns]')).as_unit(index.unit),
+            'bars': gap_end - gap_start + 1,
+        })
+        
+        report = GapReport(
+            interval=interval,
+            expected_bars=n,
+            actual_bars=actual,
+            missing_bars=n - actual,
+            duplicate_bars=duplicates,
+            off_grid_bars=int(len(ts) - len(rows)),
+            gaps=gaps,
+            method=method,
+            off_grid=index[~on_grid]
+        )
+        
+        if method is None:
+            return df, report
+        
+        src_rows = rows[last_in_cell]
+        cells = pos[last_in_cell]
+        grid_index = pd.DatetimeIndex((grid_origin + np.arange(n) * step).view('datetime64[ns]'),
+                                      name=index.name).as_unit(index.unit)
+        
+        out = {}
+        for c in df.columns:
+            values = df[c].to_numpy()
+            if values.dtype.kind in 'iuf':
+                col = np.full(n, np.nan)  # 정수 컬럼도 누락 칸 NaN을 위해 float
+            elif values.dtype.kind == 'b':
+                col = np.zeros(n, dtype=bool)
+            else:
+                col = np.empty(n, dtype=object)
+            col[cells] = values[src_rows]
+            out[c] = col
+        
+        if method == "flat" and 'Close' in out:
+            # 직전 실제 봉 위치 (첫 칸은 항상 실제 봉)
+            last_real = np.maximum.accumulate(np.where(present, np.arange(n), 0))
+            prev_close = out['Close'][last_real]
+            missing = ~present
+            for c in ('Open', 'High', 'Low', 'Close'):
+                if c in out:
+                    out[c][missing] = prev_close[missing]
+            if 'Volume' in out:
+                out['Volume'][missing] = 0.0
+        
+        out['is_gap'] = ~present
+        return pd.DataFrame(out, index=grid_index), report
 
@@ -1,2 +1,4 @@
-from .technical import TechnicalIndicators
+from .technical import TechnicalIndicators, trim_warmup
 
+from .streaming import StreamingIndicators
+from .cache import IndicatorCache
@@ -0,0 +1,115 @@
+"""지표 결과 캐시 모듈 (내용 주소 + 메모리 맵)"""
+
+import os
+import json
+import shutil
+import hashlib
+import pandas as pd
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from ..data.arrays import OHLCVArrays
+from ..data.metadata import content_hash
+
+
+class IndicatorCache:
+    """
+    (입력 데이터 해시, 지표 이름, 파라미터, 계산 백엔드) → 지표 컬럼 캐시
+    
+    디렉토리 구조:
+        {cache_dir}/{키}/  OHLCVArrays 형식 (meta.json, index.npy, {컬럼}.npy)
+    
+    - 같은 봉으로 같은 지표를 요청하면 다른 프로세스여도 .npy를 메모리 맵으로 바로 연다
+    - 백엔드(pandas/numpy/numba)마다 부동소수 오차가 달라 (EMA ~1e-13) 항목을 따로 둔다
+    - 읽을 때마다 meta.json 수정 시각을 갱신하고, 전체 크기가 max_bytes를 넘으면
+      가장 오래 안 쓴 항목부터 지운다 (LRU)
+    """
+    
+    def __init__(self, cache_dir: str = "data/cache_indicators", max_bytes: int = 512 * 1024**2):
+        """
+        Args:
+            cache_dir: 캐시 디렉토리
+            max_bytes: 최대 전체 크기 (바이트)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def make_key(data_hash: str, name: str, params: Dict, backend: str = 'pandas') -> str:
+        """캐시 키 (파라미터는 정렬된 JSON으로 직렬화)"""
+        raw = f"{data_hash}|{name}|{backend}|{json.dumps(params, sort_keys=True, default=str)}"
+        return hashlib.sha1(raw.encode()).hexdigest()
+    
+    def get(self, df: pd.DataFrame, name: str, params: Dict,
+            compute: Callable[[pd.DataFrame], Dict[str, pd.Series]],
+            source_columns=('Close',), data_hash: Optional[str] = None,
+            backend: str = 'pandas') -> Dict[str, pd.Series]:
+        """
+        캐시된 지표 컬럼 가져오기 (없으면 계산 후 저장)
+        
+        Args:
+            df: 입력 데이터
+            name: 지표 이름 (예: 'rsi')
+            params: 지표 파라미터 (예: {'period': 14})
+            compute: df → {컬럼: Series} 계산 함수
+            source_columns: 지표가 읽는 컬럼 (이 컬럼들만 해시 → 다른 컬럼이 붙어도 같은 키)
+            data_hash: 미리 계산한 입력 해시 (있으면 해시 생략)
+            backend: compute가 쓰는 계산 백엔드 (키에 포함)
+        
+        Returns:
+            {컬럼: Series} (캐시 적중 시 읽기 전용 메모리 맵)
+        """
+        data_hash = data_hash or content_hash(df[list(source_columns)])
+        path = self.cache_dir / self.make_key(data_hash, name, params, backend)
+        
+        if (path / "meta.json").exists():
+            try:
+                arrays = OHLCVArrays(path)
+                os.utime(path / "meta.json")
+                self.hits += 1
+                return {c: pd.Series(arrays[c], index=df.index, name=c, copy=False)
+                        for c in arrays.columns}
+            except (OSError, ValueError, KeyError) as e:
+                print(f"⚠️ 지표 캐시 로드 실패 ({name}): {e}")
+        
+        self.misses += 1
+        result = compute(df)
+        try:
+            OHLCVArrays.save(pd.DataFrame(result, index=df.index), str(path))
+            self._evict()
+        except OSError as e:
+            print(f"⚠️ 지표 캐시 저장 실패 ({name}): {e}")
+        return result
+    
+    @staticmethod
+    def _entry_size(path: Path) -> int:
+        return sum(p.stat().st_size for p in path.iterdir())
+    
+    def _evict(self) -> None:
+        """전체 크기가 max_bytes 이하가 될 때까지 오래 안 쓴 항목 삭제"""
+        entries = []
+        for path in self.cache_dir.iterdir():
+            meta = path / "meta.json"
+            try:
+                entries.append((meta.stat().st_mtime, self._entry_size(path), path))
+            except OSError:
+                continue  # 쓰는 중(.tmp)이거나 다른 프로세스가 지움
+        
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+    
+    def size(self) -> int:
+        """현재 전체 크기 (바이트)"""
+        return sum(self._entry_size(p) for p in self.cache_dir.iterdir() if p.is_dir())
+    
+    def clear(self) -> None:
+        """캐시 전체 삭제"""
+        for path in self.cache_dir.iterdir():
+            shutil.rmtree(path, ignore_errors=True)
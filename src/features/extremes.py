@@ -0,0 +1,141 @@
+"""
+rolling 최댓값/최솟값 모듈 (창 길이와 무관한 O(n), 과거/미래 창)
+
+van Herk/Gil-Werman 방식: 배열을 창 길이 블록으로 나눠 블록 안 앞→뒤 누적 극값과
+뒤→앞 누적 극값을 한 번씩 만들면, 어떤 창이든 (앞 블록 뒤쪽 누적, 뒤 블록 앞쪽 누적)
+두 값의 극값이다. 단조 덱과 같은 O(n)이지만 파이썬 루프 없이 배열 연산으로 끝난다.
+
+- trailing 창: out[t] = values[t-window+1 : t+1] (pandas rolling(window)와 같음)
+- forward 창:  out[t] = values[t : t+window] (매수 후 보유 기간 최저가 등, 끝에서 창이 모자라면 NaN)
+- 창 안에 NaN이 있으면 NaN (위치 함수는 -1)
+"""
+
+import numpy as np
+
+
+def _forward_extreme(values, window: int, find_max: bool, with_position: bool = False):
+    """
+    forward 창 극값 (시작 위치 t마다, 길이 n - window + 1)
+    
+    Returns:
+        (극값, 가장 앞 위치 또는 None)
+    """
+    if window < 1:
+        raise ValueError(f"window는 1 이상: {window}")
+    x = np.asarray(values, dtype=float)
+    n = len(x)
+    m = n - window + 1
+    if m <= 0:
+        return np.zeros(0), np.zeros(0, dtype=np.int64)
+    
+    op = np.maximum if find_max else np.minimum
+    fill = -np.inf if find_max else np.inf
+    
+    # 창 안 NaN 여부 (창 시작 위치 기준)
+    is_nan = np.isnan(x)
+    bad = None
+    if is_nan.any():
+        cn = np.r_[0, np.cumsum(is_nan)]
+        bad = (cn[window:] - cn[:m]) > 0
+    
+    nb = -(-n // window)
+    blocks = np.full((nb, window), fill)
+    flat = blocks.reshape(-1)
+    flat[:n] = x
+    if bad is not None:
+        flat[:n][is_nan] = fill
+    
+    prefix = op.accumulate(blocks, axis=1)
+    suffix = op.accumulate(blocks[:, ::-1], axis=1)[:, ::-1]
+    left = suffix.reshape(-1)[:m]                        # [t, t가 속한 블록 끝]
+    right = prefix.reshape(-1)[window - 1:window - 1 + m]  # [다음 블록 시작, t + window - 1]
+    value = op(left, right)
+    
+    position = None
+    if with_position:
+        better = np.greater if find_max else np.less
+        idx = np.arange(nb * window).reshape(nb, window)
+        # 블록 앞에서부터: 극값이 (엄격히) 갱신된 가장 최근 위치
+        prev = np.empty_like(prefix)
+        prev[:, 0] = fill
+        prev[:, 1:] = prefix[:, :-1]
+        prefix_pos = np.maximum.accumulate(np.where(better(blocks, prev), idx, -1), axis=1)
+        # 블록 뒤에서부터: 뒤쪽 극값 이상으로 좋은(같은 값 포함) 가장 앞 위치
+        nxt = np.empty_like(suffix)
+        nxt[:, -1] = fill
+        nxt[:, :-1] = suffix[:, 1:]
+        marks = np.where(~better(nxt, blocks), idx, nb * window)
+        suffix_pos = np.minimum.accumulate(marks[:, ::-1], axis=1)[:, ::-1]
+        # 같은 값이면 앞쪽 구간 (idxmin/idxmax처럼 처음 위치)
+        position = np.where(~better(right, left), suffix_pos.reshape(-1)[:m],
+                            prefix_pos.reshape(-1)[window - 1:window - 1 + m])
+        if bad is not None:
+            position[bad] = -1
+    
+    if bad is not None:
+        value[bad] = np.nan
+    return value, position
+
+
+def _place(forward_values: np.ndarray, n: int, window: int, forward: bool, fill) -> np.ndarray:
+    """forward 창 결과(시작 위치 기준)를 전체 길이로 배치 (trailing이면 끝 위치 기준)"""
+    out = np.full(n, fill, dtype=forward_values.dtype)
+    m = len(forward_values)
+    if forward:
+        out[:m] = forward_values
+    else:
+        out[window - 1:window - 1 + m] = forward_values
+    return out
+
+
+def rolling_min(values, window: int, forward: bool = False) -> np.ndarray:
+    """rolling 최솟값 (trailing: values.rolling(window).min(), forward: t부터 window개)"""
+    value, _ = _forward_extreme(values, window, find_max=False)
+    return _place(value, len(values), window, forward, np.nan)
+
+
+def rolling_max(values, window: int, forward: bool = False) -> np.ndarray:
+    """rolling 최댓값 (trailing: values.rolling(window).max(), forward: t부터 window개)"""
+    value, _ = _forward_extreme(values, window, find_max=True)
+    return _place(value, len(values), window, forward, np.nan)
+
+
+def rolling_argmin(values, window: int, forward: bool = False) -> np.ndarray:
+    """창 안 최솟값 위치 (전체 배열 기준 정수 인덱스, 같은 값이면 앞쪽 = idxmin, 없으면 -1)"""
+    _, position = _forward_extreme(values, window, find_max=False, with_position=True)
+    return _place(position, len(values), window, forward, -1)
+
+
+def rolling_argmax(values, window: int, forward: bool = False) -> np.ndarray:
+    """창 안 최댓값 위치 (전체 배열 기준 정수 인덱스, 같은 값이면 앞쪽 = idxmax, 없으면 -1)"""
+    _, position = _forward_extreme(values, window, find_max=True, with_position=True)
+    return _place(position, len(values), window, forward, -1)
+
+
+def drawdown(close, high, window: int) -> np.ndarray:
+    """최근 window봉 고점 대비 하락률 (%) = (close - 고점) / 고점 × 100"""
+    peak = rolling_max(high, window)
+    close = np.asarray(close, dtype=float)
+    return (close - peak) / peak * 100
+
+
+def max_adverse_excursion(entry, prices, window: int, side: str = 'long') -> np.ndarray:
+    """
+    진입 후 window봉(진입 봉 포함) 동안 가장 불리했던 가격까지의 변화율 (%)
+    
+    Args:
+        entry: 봉별 진입가 (보통 종가)
+        prices: 불리한 쪽 가격 (롱이면 저가, 숏이면 고가)
+        window: 보유 봉 수
+        side: 'long' (최저가 기준) 또는 'short' (최고가 기준)
+    
+    Returns:
+        봉별 변화율 (롱: 최저가 / 진입가 - 1, 숏: 1 - 최고가 / 진입가, 음수일수록 불리),
+        보유 기간이 데이터 끝을 넘으면 NaN
+    """
+    entry = np.asarray(entry, dtype=float)
+    if side == 'long':
+        return (rolling_min(prices, window, forward=True) / entry - 1) * 100
+    if side == 'short':
+        return (1 - rolling_max(prices, window, forward=True) / entry) * 100
+    raise ValueError(f"알 수 없는 방향: {side}")
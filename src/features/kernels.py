@@ -0,0 +1,408 @@
+"""
+지표 계산 커널 (NumPy / numba)
+
+pandas rolling/ewm 대신 연속 float64 배열에서 바로 계산한다.
+- numba가 설치돼 있으면 JIT 루프 (pandas와 같은 Kahan 합/보정 Welford 분산)
+- 없으면 NumPy 블록 벡터 연산
+- 결과는 pandas 계산과 부동소수점 오차 범위 내에서 같다 (NaN 위치 동일)
+
+TechnicalIndicators(backend='numpy' | 'numba' | 'auto')로 사용.
+"""
+
+import numpy as np
+import pandas as pd
+
+try:
+    import numba
+except ImportError:  # 선택 의존성
+    numba = None
+
+
+BACKENDS = ('numpy', 'numba')
+BLOCK = 64  # NumPy 블록 길이 (창 길이보다 작으면 창 길이 사용)
+
+
+def available_backends() -> tuple:
+    """사용 가능한 커널 백엔드"""
+    return BACKENDS if numba is not None else ('numpy',)
+
+
+def resolve_backend(backend: str) -> str:
+    """'auto' → numba(설치 시) 또는 numpy"""
+    if backend == 'auto':
+        return 'numba' if numba is not None else 'numpy'
+    if backend not in BACKENDS:
+        raise ValueError(f"알 수 없는 커널 백엔드: {backend}")
+    if backend == 'numba' and numba is None:
+        raise ValueError("numba가 설치되지 않음 (pip install numba)")
+    return backend
+
+
+def _as_array(x) -> np.ndarray:
+    """Series/리스트/float32 → 연속 float64 배열 (이미 그렇다면 복사 없음)"""
+    if isinstance(x, pd.Series):
+        x = x.to_numpy()
+    return np.ascontiguousarray(x, dtype=np.float64)
+
+
+# ===== NumPy 백엔드 =====
+
+def _window_sums(c: np.ndarray, w: int) -> np.ndarray:
+    """블록별 누적합 c (nb, L) → 같은 블록 안에서 끝나는 길이 w 창의 합 (앞 블록 걸침 부분 제외)"""
+    L = c.shape[1]
+    s = np.empty_like(c)
+    s[:, :w] = c[:, :w]
+    np.subtract(c[:, w:], c[:, :L - w], out=s[:, w:])
+    return s
+
+
+def _np_rolling_moments(x: np.ndarray, window: int, need_var: bool):
+    """
+    rolling 평균/분산 (ddof=1) - 블록별 기준값으로 누적합 상쇄 오차를 줄인 벡터 연산
+    
+    길이 L(>= window) 블록으로 나누고 블록마다 블록 평균을 뺀 값의 누적합을 만든다.
+    창이 앞 블록에 걸치면 앞 블록의 나머지 합을 현재 블록 기준값으로 옮겨 더한다.
+    가격 수준이 커도 제곱합 상쇄 오차가 블록 안 변동폭 수준으로 제한된다.
+    임시 배열은 제자리 연산으로 재사용한다 (입력 크기의 약 4배 메모리).
+    """
+    n = len(x)
+    w = window
+    if w > n or w < 1:
+        return np.full(n, np.nan), (np.full(n, np.nan) if need_var else None)
+    if w == 1:
+        return x.copy(), (np.full(n, np.nan) if need_var else None)
+    
+    L = max(BLOCK, w)
+    nb = -(-n // L)
+    is_nan = np.isnan(x)
+    has_nan = bool(is_nan.any())
+    
+    d = np.zeros((nb, L))
+    flat = d.reshape(-1)
+    flat[:n] = x
+    if has_nan:
+        flat[:n][is_nan] = 0.0
+    
+    counts = np.full(nb, float(L))
+    counts[-1] = n - (nb - 1) * L
+    if has_nan:
+        counts -= np.bincount(np.flatnonzero(is_nan) // L, minlength=nb)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        base = d.sum(axis=1) / counts
+    base[~np.isfinite(base)] = 0.0
+    
+    d -= base[:, None]
+    flat[n:] = 0.0
+    if has_nan:
+        flat[:n][is_nan] = 0.0
+    
+    # 창이 앞 블록에 걸치는 위치 p < w: 앞 블록의 마지막 cnt = w - 1 - p개가 창에 들어감
+    cnt = (w - 1 - np.arange(w, dtype=float))[None, :]
+    delta = (base[:-1] - base[1:])[:, None]  # 앞 블록 기준값 - 현재 블록 기준값
+    
+    d2 = d * d if need_var and w > 1 else None
+    np.cumsum(d, axis=1, out=d)
+    s1 = _window_sums(d, w)
+    p1 = d[:-1, -1:] - d[:-1, L - w:]
+    s1[1:, :w] += p1 + cnt * delta
+    
+    var = None
+    if need_var:
+        if d2 is None:
+            var = np.full(n, np.nan)
+        else:
+            np.cumsum(d2, axis=1, out=d2)
+            s2 = _window_sums(d2, w)
+            p2 = d2[:-1, -1:] - d2[:-1, L - w:]
+            s2[1:, :w] += p2 + 2 * delta * p1 + cnt * delta * delta
+            # (s2 - s1²/w) / (w - 1)
+            np.multiply(s1, s1, out=d2)
+            d2 /= w
+            s2 -= d2
+            s2 /= (w - 1)
+            np.maximum(s2, 0.0, out=s2)
+            var = s2.reshape(-1)[:n]
+    
+    s1 /= w
+    s1 += base[:, None]
+    mean = s1.reshape(-1)[:n]
+    
+    # 같은 값만 있는 창은 pandas처럼 평균 = 그 값, 분산 = 0
+    if w > 1:
+        eq = x[1:] == x[:-1]
+        if eq.any():
+            ce = np.r_[0, np.cumsum(eq)]
+            same = np.zeros(n, dtype=bool)
+            same[w - 1:] = ce[w - 1:] - ce[:n - w + 1] == w - 1
+            mean[same] = x[same]
+            if var is not None:
+                var[same] = 0.0
+    
+    # 첫 w-1개는 창이 덜 참, NaN이 낀 창은 NaN
+    bad = slice(0, w - 1)
+    if has_nan:
+        cn = np.r_[0, np.cumsum(is_nan)]
+        bad = np.zeros(n, dtype=bool)
+        bad[:w - 1] = True
+        bad[w - 1:] = cn[w:] - cn[:n - w + 1] > 0
+    mean[bad] = np.nan
+    if var is not None:
+        var[bad] = np.nan
+    return mean, var
+
+
+def _np_linear_recurrence(b: np.ndarray, c: float, z0: float = 0.0, block: int = 32) -> np.ndarray:
+    """
+    z[t] = c * z[t-1] + b[t] (z[-1] = z0)를 블록 행렬곱으로 계산
+    
+    블록 안은 거듭제곱 하삼각 행렬과의 곱으로 한 번에 구하고,
+    블록 사이 이월값은 계수 c^block인 같은 점화식이므로 재귀로 구한다.
+    """
+    n = len(b)
+    if n == 0:
+        return np.zeros(0)
+    nb = -(-n // block)
+    padded = np.zeros(nb * block)
+    padded[:n] = b
+    B = padded.reshape(nb, block)
+    
+    j = np.arange(block)
+    with np.errstate(under='ignore'):
+        powers = c ** np.abs(j[None, :] - j[:, None])
+        T = np.where(j[None, :] >= j[:, None], powers, 0.0)  # T[i, j] = c^(j-i) (j >= i)
+        local = B @ T
+        decay = c ** (j + 1)  # 이전 블록 마지막 값이 j번째 봉에 주는 가중치
+        c_block = c ** block
+    
+    # carry[k] = k번째 블록 마지막 z = c^block * carry[k-1] + local[k, -1]
+    if nb == 1:
+        carry_in = np.array([z0])
+    else:
+        carry = _np_linear_recurrence(local[:-1, -1], c_block, z0, block)
+        carry_in = np.r_[z0, carry]
+    
+    local += carry_in[:, None] * decay[None, :]
+    return local.reshape(-1)[:n]
+
+
+def _np_ema(x: np.ndarray, span: float, adjust: bool) -> np.ndarray:
+    alpha = 2.0 / (span + 1.0)
+    c = 1.0 - alpha
+    if len(x) == 0:
+        return x.copy()
+    if adjust:
+        # y_t = Σ c^i x_{t-i} / Σ c^i
+        num = _np_linear_recurrence(x, c)
+        den = _np_linear_recurrence(np.ones_like(x), c)
+        return num / den
+    # y_0 = x_0, y_t = c y_{t-1} + α x_t
+    b = alpha * x
+    b[0] = x[0]
+    return _np_linear_recurrence(b, c)
+
+
+# ===== numba 백엔드 (pandas rolling/ewm과 같은 갱신 순서: 뺄 값 제거 후 새 값 추가) =====
+
+if numba is not None:
+    @numba.njit(cache=True, error_model='numpy')
+    def _nb_rolling_mean(x, window):
+        """Kahan 합 rolling 평균 (같은 값만 있는 창은 그 값)"""
+        n = len(x)
+        out = np.full(n, np.nan)
+        nobs = 0
+        s = 0.0
+        comp = 0.0
+        same = 0
+        prev = np.nan
+        for i in range(n):
+            if i >= window:
+                v = x[i - window]
+                if v == v:
+                    nobs -= 1
+                    y = -v - comp
+                    t = s + y
+                    comp = t - s - y
+                    s = t
+            v = x[i]
+            if v == v:
+                nobs += 1
+                y = v - comp
+                t = s + y
+                comp = t - s - y
+                s = t
+                same = same + 1 if v == prev else 1
+                prev = v
+            if nobs >= window:
+                out[i] = prev if same >= nobs else s / nobs
+        return out
+    
+    @numba.njit(cache=True, error_model='numpy')
+    def _nb_rolling_var(x, window):
+        """보정항을 둔 Welford rolling 분산 (ddof=1, 같은 값만 있는 창은 0)"""
+        n = len(x)
+        out = np.full(n, np.nan)
+        nobs = 0
+        mean = 0.0
+        ssq = 0.0
+        comp = 0.0
+        same = 0
+        prev = np.nan
+        for i in range(n):
+            if i >= window:
+                v = x[i - window]
+                if v == v:
+                    nobs -= 1
+                    if nobs > 0:
+                        prev_mean = mean - comp
+                        y = v - comp
+                        t = y - mean
+                        comp = t + mean - y
+                        mean -= t / nobs
+                        ssq -= (v - prev_mean) * (v - mean)
+                    else:
+                        mean = 0.0
+                        ssq = 0.0
+            v = x[i]
+            if v == v:
+                nobs += 1
+                same = same + 1 if v == prev else 1
+                prev = v
+                prev_mean = mean - comp
+                y = v - comp
+                t = y - mean
+                comp = t + mean - y
+                mean += t / nobs
+                ssq += (v - prev_mean) * (v - mean)
+            if nobs >= window and nobs > 1:
+                out[i] = 0.0 if same >= nobs else max(ssq, 0.0) / (nobs - 1)
+        return out
+    
+    @numba.njit(cache=True, error_model='numpy')
+    def _nb_rsi(x, period):
+        """상승/하락폭 rolling 합을 한 루프에서 갱신하는 단순평균 RSI"""
+        n = len(x)
+        out = np.full(n, np.nan)
+        gains = np.zeros(n)
+        losses = np.zeros(n)
+        g = 0.0
+        g_comp = 0.0
+        l = 0.0
+        l_comp = 0.0
+        for i in range(n):
+            if i >= period:
+                y = -gains[i - period] - g_comp
+                t = g + y
+                g_comp = t - g - y
+                g = t
+                y = -losses[i - period] - l_comp
+                t = l + y
+                l_comp = t - l - y
+                l = t
+            # NaN diff는 pandas where처럼 상승/하락폭 0
+            d = x[i] - x[i - 1] if i > 0 else np.nan
+            if d > 0:
+                gains[i] = d
+            elif d < 0:
+                losses[i] = -d
+            y = gains[i] - g_comp
+            t = g + y
+            g_comp = t - g - y
+            g = t
+            y = losses[i] - l_comp
+            t = l + y
+            l_comp = t - l - y
+            l = t
+            if i >= period - 1:
+                out[i] = 100 - (100 / (1 + (g / period) / (l / period)))
+        return out
+    
+    @numba.njit(cache=True, error_model='numpy')
+    def _nb_ema(x, span, adjust):
+        n = len(x)
+        out = np.empty(n)
+        if n == 0:
+            return out
+        alpha = 2.0 / (span + 1.0)
+        c = 1.0 - alpha
+        if adjust:
+            num = 0.0
+            den = 0.0
+            for i in range(n):
+                num = c * num + x[i]
+                den = c * den + 1.0
+                out[i] = num / den
+        else:
+            out[0] = x[0]
+            for i in range(1, n):
+                out[i] = c * out[i - 1] + alpha * x[i]
+        return out
+
+
+# ===== 공개 함수 =====
+
+def rolling_mean(x, window: int, backend: str = 'numpy') -> np.ndarray:
+    """x.rolling(window).mean()"""
+    x = _as_array(x)
+    if resolve_backend(backend) == 'numba':
+        return _nb_rolling_mean(x, window)
+    return _np_rolling_moments(x, window, False)[0]
+
+
+def rolling_std(x, window: int, backend: str = 'numpy') -> np.ndarray:
+    """x.rolling(window).std() (ddof=1)"""
+    x = _as_array(x)
+    if resolve_backend(backend) == 'numba':
+        var = _nb_rolling_var(x, window)
+    else:
+        var = _np_rolling_moments(x, window, True)[1]
+    return np.sqrt(var)
+
+
+def ema(x, span: float, adjust: bool = False, backend: str = 'numpy') -> np.ndarray:
+    """
+    x.ewm(span=span, adjust=adjust).mean()
+    
+    NaN이 섞인 입력은 pandas의 NaN 가중치 규칙을 따르기 위해 pandas로 계산한다.
+    """
+    x = _as_array(x)
+    if np.isnan(x).any():
+        return pd.Series(x).ewm(span=span, adjust=adjust).mean().to_numpy()
+    if resolve_backend(backend) == 'numba':
+        return _nb_ema(x, float(span), adjust)
+    return _np_ema(x, span, adjust)
+
+
+def rsi(x, period: int = 14, backend: str = 'numpy') -> np.ndarray:
+    """단순평균 RSI (TechnicalIndicators._calculate_rsi와 같은 정의)"""
+    x = _as_array(x)
+    if resolve_backend(backend) == 'numba':
+        return _nb_rsi(x, period)
+    delta = np.empty_like(x)
+    delta[0] = np.nan
+    np.subtract(x[1:], x[:-1], out=delta[1:])
+    # pandas where(delta > 0, 0)처럼 NaN diff는 0으로
+    gain = np.where(delta > 0, delta, 0.0)
+    loss = np.where(delta < 0, -delta, 0.0)
+    avg_gain = rolling_mean(gain, period, backend)
+    avg_loss = rolling_mean(loss, period, backend)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return 100 - (100 / (1 + avg_gain / avg_loss))
+
+
+def macd(x, fast: int = 12, slow: int = 26, signal: int = 9, backend: str = 'numpy') -> tuple:
+    """(macd, signal, hist) - ewm(adjust=False)"""
+    x = _as_array(x)
+    line = ema(x, fast, backend=backend) - ema(x, slow, backend=backend)
+    sig = ema(line, signal, backend=backend)
+    return line, sig, line - sig
+
+
+def bollinger(x, period: int = 20, std_dev: float = 2, backend: str = 'numpy') -> tuple:
+    """(upper, middle, lower)"""
+    x = _as_array(x)
+    if resolve_backend(backend) == 'numba':
+        middle, var = _nb_rolling_mean(x, period), _nb_rolling_var(x, period)
+    else:
+        middle, var = _np_rolling_moments(x, period, True)
+    std = np.sqrt(var)
+    return middle + std * std_dev, middle, middle - std * std_dev
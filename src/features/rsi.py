@@ -0,0 +1,149 @@
+"""RSI 계산 모듈 (평활 방식/워밍업 정책 선택, 스크립트·대시보드 공용)"""
+
+import numpy as np
+import pandas as pd
+from typing import Optional
+
+from . import kernels
+
+
+SMOOTHING = ('sma', 'wilder')
+WARMUP = ('nan', 'expanding', 'fill')
+
+
+class RSI:
+    """
+    RSI 엔진
+    
+    평활 방식:
+        sma: 상승/하락폭 단순이동평균 (기존 TechnicalIndicators와 같은 값)
+        wilder: 첫 period개 평균에서 시작해 (이전 × (period-1) + 현재) / period
+    워밍업 정책 (첫 평균이 나오기 전 구간):
+        nan: NaN
+        expanding: 지금까지의 봉만으로 평균 (rolling(min_periods=1)과 같음)
+        fill: fill_value (기본 50)
+    fill_value를 주면 워밍업 외의 NaN(변동 없는 창의 0/0)도 채운다.
+    
+    상승/하락폭은 한 번만 만들고 배열 연산으로 평균을 구한다.
+    cache(IndicatorCache)를 주면 같은 backend의 TechnicalIndicators 'rsi'와 같은 키로 저장/재사용한다.
+    """
+    
+    def __init__(self, period: int = 14, smoothing: str = 'sma', warmup: str = 'nan',
+                 fill_value: Optional[float] = None, backend: str = 'pandas', cache=None):
+        """
+        Args:
+            period: RSI 기간
+            smoothing: 'sma' 또는 'wilder'
+            warmup: 'nan', 'expanding', 'fill'
+            fill_value: NaN을 채울 값 (warmup='fill'이면 기본 50)
+            backend: 'pandas', 'numpy', 'numba', 'auto' (TechnicalIndicators와 동일)
+            cache: IndicatorCache
+        """
+        if smoothing not in SMOOTHING:
+            raise ValueError(f"알 수 없는 RSI 평활 방식: {smoothing}")
+        if warmup not in WARMUP:
+            raise ValueError(f"알 수 없는 RSI 워밍업 정책: {warmup}")
+        if warmup == 'fill' and fill_value is None:
+            fill_value = 50.0
+        
+        self.period = int(period)
+        self.smoothing = smoothing
+        self.warmup = warmup
+        self.fill_value = fill_value
+        self.backend = backend if backend == 'pandas' else kernels.resolve_backend(backend)
+        self.cache = cache
+    
+    @classmethod
+    def from_config(cls, config: dict = None, **kwargs) -> "RSI":
+        """settings.yaml의 indicators.rsi 섹션으로 생성"""
+        config = config or {}
+        return cls(period=config.get('period', 14), smoothing=config.get('smoothing', 'sma'),
+                   warmup=config.get('warmup', 'nan'), fill_value=config.get('fill_value'), **kwargs)
+    
+    @property
+    def params(self) -> dict:
+        """캐시 키 파라미터"""
+        return {'period': self.period, 'smoothing': self.smoothing,
+                'warmup': self.warmup, 'fill_value': self.fill_value}
+    
+    @property
+    def lookback(self) -> int:
+        """
+        첫 유효 값 전에 필요한 과거 봉 수
+        
+        sma는 첫 봉(diff 없음)이 창에서 빠진 뒤부터 전체 이력 계산과 같다.
+        wilder는 시드 뒤 지수 평활이므로 시드 영향이 e^-8 이하로 줄어드는 8 × period봉을 더 둔다.
+        """
+        if self.smoothing == 'sma':
+            return self.period
+        return self.period + 8 * self.period
+    
+    def calculate(self, prices) -> pd.Series:
+        """
+        RSI 계산
+        
+        Args:
+            prices: 종가 Series (배열이면 RangeIndex)
+        
+        Returns:
+            RSI Series (이름 'rsi', 입력과 같은 인덱스)
+        """
+        if not isinstance(prices, pd.Series):
+            prices = pd.Series(np.asarray(prices, dtype=float))
+        if self.cache is None:
+            return self._compute(prices)
+        return self.cache.get(prices.to_frame('Close'), 'rsi', self.params,
+                              lambda d: {'rsi': self._compute(d['Close'])}, backend=self.backend)['rsi']
+    
+    def _compute(self, prices: pd.Series) -> pd.Series:
+        x = prices.to_numpy(dtype=float)
+        
+        if self.smoothing == 'sma' and self.warmup != 'expanding' and self.backend != 'pandas':
+            # 커널이 상승/하락폭 평균을 한 번에 계산
+            rsi = kernels.rsi(x, self.period, self.backend)
+        else:
+            delta = np.empty_like(x)
+            delta[:1] = np.nan
+            np.subtract(x[1:], x[:-1], out=delta[1:])
+            # pandas where(delta > 0, 0)처럼 NaN diff는 0으로
+            gain = np.where(delta > 0, delta, 0.0)
+            loss = np.where(delta < 0, -delta, 0.0)
+            
+            average = self._sma if self.smoothing == 'sma' else self._wilder
+            with np.errstate(divide='ignore', invalid='ignore'):
+                rsi = 100 - (100 / (1 + average(gain) / average(loss)))
+        
+        if self.fill_value is not None:
+            rsi[np.isnan(rsi)] = self.fill_value
+        return pd.Series(rsi, index=prices.index, name='rsi')
+    
+    def _sma(self, values: np.ndarray) -> np.ndarray:
+        p = self.period
+        if self.backend == 'pandas':
+            min_periods = 1 if self.warmup == 'expanding' else None
+            return pd.Series(values).rolling(window=p, min_periods=min_periods).mean().to_numpy()
+        
+        avg = kernels.rolling_mean(values, p, self.backend)
+        if self.warmup == 'expanding':
+            head = min(p - 1, len(values))
+            avg[:head] = np.cumsum(values[:head]) / np.arange(1, head + 1)
+        return avg
+    
+    def _wilder(self, values: np.ndarray) -> np.ndarray:
+        """values[0]은 첫 봉(diff 없음) 자리 → 평균은 values[1:]부터"""
+        p = self.period
+        n = len(values)
+        avg = np.full(n, np.nan)
+        
+        if n > p:
+            # 시드 뒤로는 alpha = 1/period인 ewm(adjust=False)와 같은 점화식
+            series = np.r_[values[1:p + 1].mean(), values[p + 1:]]
+            if self.backend == 'pandas':
+                avg[p:] = pd.Series(series).ewm(alpha=1 / p, adjust=False).mean().to_numpy()
+            else:
+                avg[p:] = kernels.ema(series, 2 * p - 1, backend=self.backend)
+        
+        if self.warmup == 'expanding':
+            head = min(p, n)
+            avg[1:head] = np.cumsum(values[1:head]) / np.arange(1, head)
+        return avg
@@ -0,0 +1,345 @@
+"""증분(스트리밍) 기술적 지표 계산 모듈"""
+
+import json
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Dict, Optional
+
+from .technical import TechnicalIndicators
+
+
+INDICATOR_COLUMNS = [
+    'rsi', 'macd', 'macd_signal', 'macd_hist',
+    'bb_upper', 'bb_middle', 'bb_lower',
+    'ma_short', 'ma_medium', 'ma_long',
+    'momentum', 'volatility',
+]
+
+
+class RollingWindow:
+    """
+    고정 길이 링 버퍼 + Welford 평균/편차제곱합 (봉당 O(1) 평균/표준편차)
+    
+    값 추가/제거 때 평균과 편차제곱합(M2)을 Welford 방식으로 갱신한다.
+    합/제곱합(Σx² − n·mean²)은 가격처럼 평균에 비해 편차가 작은 값에서 자릿수가 상쇄되므로 쓰지 않는다.
+    누적 오차를 막기 위해 size번 갱신마다 버퍼에서 두 번 훑어 다시 계산한다 (분할 상환 O(1)).
+    NaN이 창 안에 있으면 pandas rolling처럼 NaN을 반환한다.
+    """
+    
+    def __init__(self, size: int):
+        self.size = size
+        self.buffer = np.zeros(size)
+        self.pos = 0
+        self.count = 0
+        self.nan_count = 0
+        self._n = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._since_resync = 0
+    
+    def push(self, value: float) -> None:
+        """값 추가 (창이 차 있으면 가장 오래된 값 제거)"""
+        if self.count == self.size:
+            old = self.buffer[self.pos]
+            if np.isnan(old):
+                self.nan_count -= 1
+            else:
+                self._remove(old)
+        else:
+            self.count += 1
+        
+        self.buffer[self.pos] = value
+        if np.isnan(value):
+            self.nan_count += 1
+        else:
+            self._add(value)
+        self.pos = (self.pos + 1) % self.size
+        
+        self._since_resync += 1
+        if self._since_resync >= self.size:
+            self._resync()
+    
+    @property
+    def total(self) -> float:
+        """창 안의 NaN 아닌 값 합"""
+        return self._mean * self._n
+    
+    def _add(self, value: float) -> None:
+        self._n += 1
+        delta = value - self._mean
+        self._mean += delta / self._n
+        self._m2 += delta * (value - self._mean)
+    
+    def _remove(self, value: float) -> None:
+        self._n -= 1
+        if self._n == 0:
+            self._mean = 0.0
+            self._m2 = 0.0
+            return
+        prev_mean = self._mean
+        self._mean -= (value - prev_mean) / self._n
+        self._m2 -= (value - self._mean) * (value - prev_mean)
+    
+    def _resync(self) -> None:
+        values = self.buffer[:self.count]
+        valid = values[~np.isnan(values)]
+        self._n = len(valid)
+        self._mean = float(valid.mean()) if self._n else 0.0
+        self._m2 = float(((valid - self._mean) ** 2).sum())
+        self._since_resync = 0
+    
+    @property
+    def full(self) -> bool:
+        return self.count == self.size and self.nan_count == 0
+    
+    def mean(self) -> float:
+        return self._mean if self.full else np.nan
+    
+    def std(self) -> float:
+        """표본 표준편차 (ddof=1, pandas rolling().std()와 동일)"""
+        if not self.full or self.size < 2:
+            return np.nan
+        return float(np.sqrt(max(self._m2 / (self.size - 1), 0.0)))
+    
+    def oldest(self) -> float:
+        """창에서 가장 오래된 값 (창이 안 찼으면 NaN)"""
+        return self.buffer[self.pos] if self.count == self.size else np.nan
+    
+    def state_dict(self) -> Dict:
+        # 오래된 값부터 순서대로 저장
+        order = np.r_[self.pos:self.count, 0:self.pos] if self.count == self.size else np.arange(self.count)
+        return {'size': self.size, 'values': self.buffer[order].tolist()}
+    
+    @classmethod
+    def from_state(cls, state: Dict) -> "RollingWindow":
+        window = cls(state['size'])
+        for v in state['values']:
+            window.push(np.nan if v is None else v)
+        return window
+
+
+class EMAState:
+    """지수이동평균 상태 (ewm(span, adjust=False)와 동일)"""
+    
+    def __init__(self, span: int, value: Optional[float] = None):
+        self.span = span
+        self.alpha = 2.0 / (span + 1)
+        self.value = value
+    
+    def update(self, x: float) -> float:
+        if self.value is None:
+            self.value = x
+        else:
+            self.value = (1 - self.alpha) * self.value + self.alpha * x
+        return self.value
+
+
+class WilderState:
+    """Wilder 평활 상태 (RSI smoothing='wilder'와 동일: 첫 period개 평균 후 지수 평활)"""
+    
+    def __init__(self, period: int, count: int = 0, total: float = 0.0, value: Optional[float] = None):
+        self.period = period
+        self.alpha = 1.0 / period
+        self.count = count
+        self.total = total
+        self.value = value
+    
+    def push(self, x: float) -> None:
+        self.count += 1
+        if self.count <= self.period:
+            self.total += x
+            if self.count == self.period:
+                self.value = self.total / self.period
+        else:
+            self.value = (1 - self.alpha) * self.value + self.alpha * x
+    
+    def mean(self, expanding: bool = False) -> float:
+        """평균 (첫 period개가 모이기 전에는 NaN, expanding이면 지금까지의 평균)"""
+        if self.value is not None:
+            return self.value
+        if expanding and self.count > 0:
+            return self.total / self.count
+        return np.nan
+    
+    def state_dict(self) -> Dict:
+        return {'period': self.period, 'count': self.count, 'total': self.total, 'value': self.value}
+    
+    @classmethod
+    def from_state(cls, state: Dict) -> "WilderState":
+        return cls(**state)
+
+
+class StreamingIndicators:
+    """
+    TechnicalIndicators.calculate_all의 증분 버전
+    
+    새 봉 하나를 update()에 넣으면 그 봉의 지표 행을 O(1)로 계산한다.
+    전체 이력으로 warmup()한 뒤 마감된 봉만 순서대로 넣으면 배치 계산과 같은 값이 나온다
+    (부동소수점 오차 범위 내). 상태는 save()/load()로 JSON 저장 가능.
+    """
+    
+    MOMENTUM_PERIOD = 10
+    VOLATILITY_PERIOD = 20
+    
+    def __init__(self, config: dict = None):
+        """
+        Args:
+            config: 지표 설정 (settings.yaml의 indicators 섹션, TechnicalIndicators와 동일)
+        """
+        self.config = config or {}
+        p = TechnicalIndicators(self.config)
+        self.rsi_engine = p.rsi_engine
+        self.rsi_period = p.rsi_period
+        self.bb_std = p.bb_std
+        
+        average = WilderState if self.rsi_engine.smoothing == 'wilder' else RollingWindow
+        self.gain = average(self.rsi_engine.period)
+        self.loss = average(self.rsi_engine.period)
+        self.ema_fast = EMAState(p.macd_fast)
+        self.ema_slow = EMAState(p.macd_slow)
+        self.ema_signal = EMAState(p.macd_signal)
+        self.bb = RollingWindow(p.bb_period)
+        self.ma_short = RollingWindow(p.ma_short)
+        self.ma_medium = RollingWindow(p.ma_medium)
+        self.ma_long = RollingWindow(p.ma_long)
+        self.vol = RollingWindow(self.VOLATILITY_PERIOD)
+        self.closes = RollingWindow(self.MOMENTUM_PERIOD + 1)
+        self.prev_close = None
+        self.last_timestamp = None
+    
+    def update(self, bar, timestamp=None) -> Dict[str, float]:
+        """
+        마감된 봉 하나 추가
+        
+        Args:
+            bar: Close를 가진 dict/Series (또는 종가 숫자)
+            timestamp: 봉 시각 (상태에 기록, 선택)
+        
+        Returns:
+            {지표 컬럼: 값} (calculate_all과 같은 컬럼)
+        """
+        close = float(bar['Close']) if not np.isscalar(bar) else float(bar)
+        
+        # RSI: 첫 봉의 diff는 NaN → sma는 where(delta > 0, 0)에서 0으로 들어가고, wilder는 건너뜀
+        delta = close - self.prev_close if self.prev_close is not None else np.nan
+        if self.prev_close is not None or self.rsi_engine.smoothing == 'sma':
+            self.gain.push(delta if delta > 0 else 0.0)
+            self.loss.push(-delta if delta < 0 else 0.0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rs = np.float64(self._rsi_average(self.gain)) / np.float64(self._rsi_average(self.loss))
+            rsi = 100 - (100 / (1 + rs))
+        if self.rsi_engine.fill_value is not None and np.isnan(rsi):
+            rsi = self.rsi_engine.fill_value
+        
+        # MACD
+        macd = self.ema_fast.update(close) - self.ema_slow.update(close)
+        macd_signal = self.ema_signal.update(macd)
+        
+        # Bollinger Bands
+        self.bb.push(close)
+        bb_middle = self.bb.mean()
+        bb_std = self.bb.std()
+        
+        # Moving Averages
+        for window in (self.ma_short, self.ma_medium, self.ma_long, self.vol, self.closes):
+            window.push(close)
+        
+        # 추가 지표
+        momentum = (close / self.closes.oldest() - 1) * 100
+        volatility = self.vol.std() / self.vol.mean() * 100
+        
+        self.prev_close = close
+        if timestamp is not None:
+            self.last_timestamp = pd.Timestamp(timestamp)
+        
+        return {
+            'rsi': float(rsi),
+            'macd': macd,
+            'macd_signal': macd_signal,
+            'macd_hist': macd - macd_signal,
+            'bb_upper': bb_middle + bb_std * self.bb_std,
+            'bb_middle': bb_middle,
+            'bb_lower': bb_middle - bb_std * self.bb_std,
+            'ma_short': self.ma_short.mean(),
+            'ma_medium': self.ma_medium.mean(),
+            'ma_long': self.ma_long.mean(),
+            'momentum': momentum,
+            'volatility': volatility,
+        }
+    
+    def _rsi_average(self, window) -> float:
+        expanding = self.rsi_engine.warmup == 'expanding'
+        if isinstance(window, WilderState):
+            return window.mean(expanding)
+        if expanding and not window.full and window.count > 0:
+            return window.total / window.count
+        return window.mean()
+    
+    def warmup(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        여러 봉을 순서대로 넣고 calculate_all과 같은 형태로 반환
+        
+        이미 넣은 봉(last_timestamp 이전)은 건너뛰므로 전체 이력을 다시 넣어도 된다.
+        """
+        if self.last_timestamp is not None:
+            df = df[df.index > self.last_timestamp]
+        
+        rows = [self.update(close, ts) for ts, close in zip(df.index, df['Close'].to_numpy())]
+        out = df.copy()
+        if rows:
+            values = pd.DataFrame(rows, index=df.index, columns=INDICATOR_COLUMNS)
+            for c in INDICATOR_COLUMNS:
+                out[c] = values[c]
+        else:
+            for c in INDICATOR_COLUMNS:
+                out[c] = pd.Series(dtype=float)
+        return out
+    
+    def append(self, df: pd.DataFrame, new_bars: pd.DataFrame) -> pd.DataFrame:
+        """
+        지표가 계산된 df에 새 봉만 계산해서 이어붙이기 (전체 재계산 없음)
+        
+        Args:
+            df: 지금까지 warmup/append로 만든 DataFrame
+            new_bars: 새로 마감된 봉 (OHLCV)
+        """
+        new_rows = self.warmup(new_bars)
+        return pd.concat([df, new_rows]) if len(new_rows) else df
+    
+    def state_dict(self) -> Dict:
+        return {
+            'config': self.config,
+            'windows': {name: getattr(self, name).state_dict()
+                        for name in ('gain', 'loss', 'bb', 'ma_short', 'ma_medium', 'ma_long', 'vol', 'closes')},
+            'ema': {name: getattr(self, name).value
+                    for name in ('ema_fast', 'ema_slow', 'ema_signal')},
+            'prev_close': self.prev_close,
+            'last_timestamp': self.last_timestamp.isoformat() if self.last_timestamp is not None else None,
+        }
+    
+    @classmethod
+    def from_state(cls, state: Dict) -> "StreamingIndicators":
+        engine = cls(state['config'])
+        for name, window_state in state['windows'].items():
+            window_cls = WilderState if 'period' in window_state else RollingWindow
+            setattr(engine, name, window_cls.from_state(window_state))
+        for name, value in state['ema'].items():
+            getattr(engine, name).value = value
+        engine.prev_close = state['prev_close']
+        if state['last_timestamp']:
+            engine.last_timestamp = pd.Timestamp(state['last_timestamp'])
+        return engine
+    
+    def save(self, path: str) -> None:
+        """상태를 JSON으로 저장 (임시 파일에 쓴 뒤 교체)"""
+        path = Path(path)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(self.state_dict(), f)
+        tmp_path.replace(path)
+    
+    @classmethod
+    def load(cls, path: str) -> "StreamingIndicators":
+        with open(path, "r") as f:
+            return cls.from_state(json.load(f))
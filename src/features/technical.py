@@ -1,18 +1,50 @@
 """기술적 지표 계산 모듈"""
 
+import re
 import pandas as pd
 import numpy as np
 
+from . import kernels
+from .rsi import RSI
+from ..data.metadata import content_hash
+
+
+def trim_warmup(df: pd.DataFrame, columns: list = None) -> pd.DataFrame:
+    """
+    미리 계산된 지표 컬럼(CSV 등)의 워밍업 구간 제외: columns가 모두 채워진 첫 봉부터 (복사 없이 슬라이스)
+    
+    지표를 여기서 계산한다면 TechnicalIndicators.calculate_window를 쓴다.
+    모두 채워진 봉이 없으면 빈 DataFrame (argmax가 0을 돌려 전체가 남지 않도록).
+    """
+    complete = (df[columns] if columns is not None else df).notna().all(axis=1).to_numpy()
+    if not complete.any():
+        return df.iloc[0:0]
+    return df.iloc[complete.argmax():]
+
 
 class TechnicalIndicators:
     """기술적 지표 계산 클래스"""
     
-    def __init__(self, config: dict = None):
+    # calculate_all이 만드는 컬럼 (순서 유지)
+    COLUMNS = ['rsi', 'macd', 'macd_signal', 'macd_hist', 'bb_upper', 'bb_middle', 'bb_lower',
+               'ma_short', 'ma_medium', 'ma_long', 'momentum', 'volatility']
+    INPUT_COLUMNS = ('Open', 'High', 'Low', 'Close', 'Volume')
+    # 지수 평활 lookback = EMA_SETTLE / alpha 봉 (시작값 영향이 e^-EMA_SETTLE ≈ 0.03% 이하)
+    EMA_SETTLE = 8
+    
+    def __init__(self, config: dict = None, cache=None, backend: str = None):
         """
         Args:
             config: 지표 설정 (settings.yaml의 indicators 섹션)
+            cache: IndicatorCache (지정하면 같은 봉/파라미터 결과를 재사용)
+            backend: rolling/ewm 계산 방식 - 'pandas'(기본), 'numpy', 'numba', 'auto'
+                     (기본값: config의 backend 값)
         """
         self.config = config or {}
+        self.cache = cache
+        self.backend = backend or self.config.get('backend', 'pandas')
+        if self.backend != 'pandas':
+            self.backend = kernels.resolve_backend(self.backend)
         
         # 기본값 설정
         self.rsi_period = self.config.get('rsi', {}).get('period', 14)
@@ -24,66 +56,288 @@ class TechnicalIndicators:
         self.ma_short = self.config.get('moving_averages', {}).get('short', 20)
         self.ma_medium = self.config.get('moving_averages', {}).get('medium', 50)
         self.ma_long = self.config.get('moving_averages', {}).get('long', 200)
+        self.cross_short = self.config.get('golden_cross', {}).get('short', 40)
+        self.cross_long = self.config.get('golden_cross', {}).get('long', 200)
+        self.rsi_engine = RSI.from_config(self.config.get('rsi'), backend=self.backend)
     
-    def calculate_all(self, df: pd.DataFrame) -> pd.DataFrame:
-        """모든 기술적 지표 계산"""
-        df = df.copy()
+    # ===== 지표 그래프 =====
+    
+    def _node(self, name: str) -> tuple:
+        """
+        지표 노드 정의 (의존 노드, 캐시 키 파라미터, 계산 함수, lookback)
+        
+        계산 함수는 의존 노드 값을 순서대로 인자로 받는다.
+        sma_/std_/ema_ 같은 중간 노드는 여러 지표가 공유한다 (예: bb_middle = ma_short = sma_20).
+        lookback은 의존 노드 위에 이 노드가 더 필요로 하는 과거 봉 수 (전체는 lookback()).
+        """
+        m = re.fullmatch(r'(sma|std|ema|ema_adj|MA)_?(\d+)', name)
+        if m and self.backend != 'pandas' and m.group(1) != 'MA':
+            return self._kernel_node(m.group(1), int(m.group(2)))
+        if m:
+            kind, n = m.group(1), int(m.group(2))
+            if kind == 'sma':
+                return ['Close'], {'window': n}, lambda c: c.rolling(window=n).mean(), n - 1
+            if kind == 'std':
+                return ['Close'], {'window': n}, lambda c: c.rolling(window=n).std(), n - 1
+            if kind == 'ema':
+                return ['Close'], {'span': n}, lambda c: c.ewm(span=n, adjust=False).mean(), self._ema_lookback(n)
+            if kind == 'ema_adj':
+                return ['Close'], {'span': n}, lambda c: c.ewm(span=n).mean(), self._ema_lookback(n)
+            return [f'sma_{n}'], {'window': n}, lambda x: x, 0  # MA40, MA200 ...
         
-        # RSI
-        df['rsi'] = self._calculate_rsi(df['Close'], self.rsi_period)
+        bb = {'period': self.bb_period, 'std': self.bb_std}
+        macd = {'fast': self.macd_fast, 'slow': self.macd_slow, 'signal': self.macd_signal}
+        cross = {'short': self.cross_short, 'long': self.cross_long}
+        cross_deps = [f'MA{self.cross_short}', f'MA{self.cross_long}']
         
-        # MACD
-        df['macd'], df['macd_signal'], df['macd_hist'] = self._calculate_macd(
-            df['Close'], self.macd_fast, self.macd_slow, self.macd_signal
-        )
+        nodes = {
+            'rsi': (['Close'], self.rsi_engine.params, self.rsi_engine.calculate, self.rsi_engine.lookback),
+            'macd': ([f'ema_{self.macd_fast}', f'ema_{self.macd_slow}'], macd, lambda fast, slow: fast - slow, 0),
+            'macd_signal': (['macd'], macd, self._macd_signal, self._ema_lookback(self.macd_signal)),
+            'macd_hist': (['macd', 'macd_signal'], macd, lambda m, sig: m - sig, 0),
+            'bb_middle': ([f'sma_{self.bb_period}'], bb, lambda mid: mid, 0),
+            'bb_upper': ([f'sma_{self.bb_period}', f'std_{self.bb_period}'], bb,
+                         lambda mid, std: mid + (std * self.bb_std), 0),
+            'bb_lower': ([f'sma_{self.bb_period}', f'std_{self.bb_period}'], bb,
+                         lambda mid, std: mid - (std * self.bb_std), 0),
+            'ma_short': ([f'sma_{self.ma_short}'], {'window': self.ma_short}, lambda x: x, 0),
+            'ma_medium': ([f'sma_{self.ma_medium}'], {'window': self.ma_medium}, lambda x: x, 0),
+            'ma_long': ([f'sma_{self.ma_long}'], {'window': self.ma_long}, lambda x: x, 0),
+            'momentum': (['Close'], {'periods': 10}, lambda c: c.pct_change(periods=10) * 100, 10),
+            'volatility': (['std_20', 'sma_20'], {'window': 20}, lambda std, mean: std / mean * 100, 0),
+            # 대시보드 공통 컬럼
+            'golden_cross': (cross_deps, cross, lambda short, long: short > long, 0),
+            'dead_cross': (cross_deps, cross, lambda short, long: short < long, 0),
+            'MACD': (['ema_adj_12', 'ema_adj_26'], {'fast': 12, 'slow': 26, 'adjust': True},
+                     lambda fast, slow: fast - slow, 0),
+        }
+        if name not in nodes:
+            raise ValueError(f"알 수 없는 지표: {name}")
+        return nodes[name]
+    
+    def _kernel_node(self, kind: str, n: int) -> tuple:
+        """rolling/ewm 중간 노드를 배열 커널로 계산 (backend가 pandas가 아닐 때)"""
+        backend = self.backend
+        wrap = lambda values, like: pd.Series(values, index=like.index)
+        if kind == 'sma':
+            return ['Close'], {'window': n}, lambda c: wrap(kernels.rolling_mean(c, n, backend), c), n - 1
+        if kind == 'std':
+            return ['Close'], {'window': n}, lambda c: wrap(kernels.rolling_std(c, n, backend), c), n - 1
+        adjust = kind == 'ema_adj'
+        return ['Close'], {'span': n}, lambda c: wrap(kernels.ema(c, n, adjust, backend), c), self._ema_lookback(n)
+    
+    @classmethod
+    def _ema_lookback(cls, span: int) -> int:
+        """span EMA가 시작값을 잊는 데 필요한 봉 수 (alpha = 2 / (span + 1))"""
+        return cls.EMA_SETTLE * (span + 1) // 2
+    
+    def _macd_signal(self, macd: pd.Series) -> pd.Series:
+        if self.backend == 'pandas':
+            return macd.ewm(span=self.macd_signal, adjust=False).mean()
+        return pd.Series(kernels.ema(macd, self.macd_signal, backend=self.backend), index=macd.index)
+    
+    def _evaluate(self, df: pd.DataFrame, columns: list) -> dict:
+        """요청 컬럼과 그 의존 노드만 계산 (노드당 한 번, 요청 컬럼은 캐시 경유)"""
+        memo = {}
+        # 모든 지표가 종가만 사용 → 종가 해시 한 번만 계산
+        data_hash = content_hash(df[['Close']]) if self.cache is not None else None
         
-        # Bollinger Bands
-        df['bb_upper'], df['bb_middle'], df['bb_lower'] = self._calculate_bollinger(
-            df['Close'], self.bb_period, self.bb_std
-        )
+        def resolve(name: str, requested: bool = False) -> pd.Series:
+            if name in memo:
+                return memo[name]
+            if name in self.INPUT_COLUMNS:
+                memo[name] = df[name]
+                return memo[name]
+            
+            deps, params, fn, _ = self._node(name)
+            compute = lambda: fn(*[resolve(d) for d in deps])
+            if requested and self.cache is not None:
+                value = self.cache.get(df, name, params, lambda _: {name: compute()},
+                                       data_hash=data_hash, backend=self.backend)[name]
+            else:
+                value = compute()
+            memo[name] = value
+            return value
         
-        # Moving Averages
-        df['ma_short'] = df['Close'].rolling(window=self.ma_short).mean()
-        df['ma_medium'] = df['Close'].rolling(window=self.ma_medium).mean()
-        df['ma_long'] = df['Close'].rolling(window=self.ma_long).mean()
+        return {name: resolve(name, requested=True) for name in columns}
+    
+    def calculate(self, df: pd.DataFrame, columns: list, include_input: bool = True) -> pd.DataFrame:
+        """
+        필요한 지표만 계산
         
-        # 추가 지표
-        df['momentum'] = df['Close'].pct_change(periods=10) * 100
-        df['volatility'] = df['Close'].rolling(window=20).std() / df['Close'].rolling(window=20).mean() * 100
+        Args:
+            df: OHLCV 데이터 (수정하지 않음)
+            columns: 계산할 컬럼 (예: ['rsi', 'golden_cross', 'MACD', 'MA100'])
+            include_input: True면 df 컬럼 뒤에 붙여서, False면 요청 컬럼만 반환
         
-        return df
+        Returns:
+            DataFrame (입력 전체를 복사하지 않고 컬럼만 이어붙임)
+        """
+        new = pd.DataFrame(self._evaluate(df, list(columns)), index=df.index)
+        if not include_input:
+            return new
+        kept = df.drop(columns=[c for c in new.columns if c in df.columns])
+        return pd.concat([kept, new], axis=1)
     
-    def _calculate_rsi(self, prices: pd.Series, period: int = 14) -> pd.Series:
-        """RSI 계산"""
-        delta = prices.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+    def lookback(self, columns: list) -> int:
+        """
+        columns를 계산하려면 요청 구간 앞에 필요한 과거 봉 수 (의존 노드 lookback 누적의 최댓값)
         
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
+        rolling 지표는 이 봉 수 이후부터 전체 이력으로 계산한 값과 같고,
+        EMA/Wilder 같은 지수 평활은 시작값 영향이 EMA_SETTLE 기준 이하로 줄어든 값이 된다.
+        """
+        memo = {}
+        
+        def total(name: str) -> int:
+            if name in self.INPUT_COLUMNS:
+                return 0
+            if name not in memo:
+                deps, _, _, own = self._node(name)
+                memo[name] = own + max((total(d) for d in deps), default=0)
+            return memo[name]
         
-        return rsi
+        return max((total(c) for c in columns), default=0)
     
-    def _calculate_macd(self, prices: pd.Series, fast: int, slow: int, signal: int):
-        """MACD 계산"""
-        exp_fast = prices.ewm(span=fast, adjust=False).mean()
-        exp_slow = prices.ewm(span=slow, adjust=False).mean()
+    def calculate_window(self, df: pd.DataFrame, columns: list, start=None, end=None,
+                         include_input: bool = True) -> pd.DataFrame:
+        """
+        [start, end] 구간만 계산 (앞에 lookback봉만 붙여 계산한 뒤 잘라냄)
         
-        macd = exp_fast - exp_slow
-        macd_signal = macd.ewm(span=signal, adjust=False).mean()
-        macd_hist = macd - macd_signal
+        df가 전체 이력이어도 필요한 봉만 쓰므로 180일 차트에 5년치를 계산하지 않는다.
+        df 앞쪽 봉이 lookback보다 적으면 있는 만큼만 쓴다 (전체 계산과 같은 결과).
         
-        return macd, macd_signal, macd_hist
+        Args:
+            df: OHLCV 데이터 (정렬됨, load_window로 읽은 데이터면 그대로)
+            columns: 계산할 컬럼
+            start: 구간 시작 시각 (포함, None이면 처음부터)
+            end: 구간 끝 시각 (포함, None이면 끝까지)
+            include_input: calculate와 동일
+        """
+        first = 0 if start is None else int(df.index.searchsorted(pd.Timestamp(start)))
+        last = len(df) if end is None else int(df.index.searchsorted(pd.Timestamp(end), side='right'))
+        begin = max(first - self.lookback(columns), 0)
+        out = self.calculate(df.iloc[begin:last], columns, include_input)
+        return out.iloc[first - begin:]
     
-    def _calculate_bollinger(self, prices: pd.Series, period: int, std_dev: float):
-        """볼린저 밴드 계산"""
-        middle = prices.rolling(window=period).mean()
-        std = prices.rolling(window=period).std()
+    def calculate_all(self, df: pd.DataFrame) -> pd.DataFrame:
+        """모든 기술적 지표 계산"""
+        return self.calculate(df, self.COLUMNS)
+    
+    # ===== 다중 파라미터 (파라미터 축 = 열) =====
+    
+    @staticmethod
+    def _rolling_sum_matrix(values: np.ndarray, windows, divide: bool = False) -> np.ndarray:
+        """
+        누적합 한 번으로 여러 창 길이의 rolling sum 계산 (봉 × 창 행렬)
+        
+        창 안에 NaN이 있거나 창이 덜 찼으면 NaN (pandas rolling(window)와 동일).
+        누적합 크기를 줄이려고 첫 유효값을 빼고 더한다. divide=True면 창 길이로 나눈 평균.
+        """
+        x = np.asarray(values, dtype=float)
+        n = len(x)
+        windows = np.asarray(windows, dtype=int)
+        out = np.full((n, len(windows)), np.nan, order='F')  # 열 단위로 채우므로 열 우선
+        
+        is_nan = np.isnan(x)
+        has_nan = is_nan.any()
+        base = x[~is_nan][0] if not is_nan.all() else 0.0
+        cs = np.zeros(n + 1)
+        np.cumsum(np.where(is_nan, 0.0, x - base) if has_nan else x - base, out=cs[1:])
+        nan_cs = np.r_[0, np.cumsum(is_nan)] if has_nan else None
+        
+        for j, w in enumerate(windows):
+            if w > n:
+                continue
+            col = out[w - 1:, j]
+            np.subtract(cs[w:], cs[:-w], out=col)
+            col += base * w
+            if divide:
+                col /= w
+            if has_nan:
+                col[(nan_cs[w:] - nan_cs[:-w]) > 0] = np.nan
+        return out
+    
+    @staticmethod
+    def sma_matrix(prices, windows) -> np.ndarray:
+        """
+        여러 창 길이 단순이동평균을 한 번에 계산
+        
+        Args:
+            prices: 가격 (Series 또는 배열)
+            windows: 창 길이 리스트 (예: [10, 20, 30, 50, 100, 200])
         
-        upper = middle + (std * std_dev)
-        lower = middle - (std * std_dev)
+        Returns:
+            (봉 수 × len(windows)) 행렬, j열 = prices.rolling(windows[j]).mean()
+        """
+        return TechnicalIndicators._rolling_sum_matrix(prices, windows, divide=True)
+    
+    @staticmethod
+    def rsi_matrix(prices, periods) -> np.ndarray:
+        """
+        여러 기간 RSI를 한 번에 계산 (RSI smoothing='sma', warmup='nan'과 같은 값)
         
-        return upper, middle, lower
+        상승/하락폭 누적합은 한 번만 만들고 기간별로 차이만 구한다.
+        
+        Returns:
+            (봉 수 × len(periods)) 행렬
+        """
+        x = np.asarray(prices, dtype=float)
+        periods = np.asarray(periods, dtype=int)
+        delta = np.r_[np.nan, np.diff(x)]
+        # pandas where(delta > 0, 0)처럼 NaN diff는 0으로
+        gain = np.where(delta > 0, delta, 0.0)
+        loss = np.where(delta < 0, -delta, 0.0)
+        
+        avg_gain = TechnicalIndicators._rolling_sum_matrix(gain, periods, divide=True)
+        avg_loss = TechnicalIndicators._rolling_sum_matrix(loss, periods, divide=True)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # 100 - 100 / (1 + gain / loss)와 같은 값, 임시 행렬 줄이려고 제자리 연산
+            avg_gain /= avg_loss
+            avg_gain += 1
+            np.divide(100, avg_gain, out=avg_gain)
+            np.subtract(100, avg_gain, out=avg_gain)
+        return avg_gain
+    
+    @staticmethod
+    def rolling_max_matrix(values, windows) -> np.ndarray:
+        """
+        여러 창 길이 rolling max를 한 번에 계산 (고점 대비 하락률 lookback 스윕용)
+        
+        2^k 길이 구간 최댓값 표(sparse table)를 한 번 만들고, 각 창은 겹치는 두 구간의
+        최댓값으로 구한다. O(n log W + n × 창 수).
+        
+        Returns:
+            (봉 수 × len(windows)) 행렬, j열 = values.rolling(windows[j]).max()
+        """
+        x = np.asarray(values, dtype=float)
+        n = len(x)
+        windows = np.asarray(windows, dtype=int)
+        out = np.full((n, len(windows)), np.nan, order='F')  # 열 단위로 채우므로 열 우선
+        
+        levels = [x]
+        while 2 ** len(levels) <= min(windows.max(), n):
+            prev, half = levels[-1], 2 ** (len(levels) - 1)
+            levels.append(np.maximum(prev[:-half], prev[half:]))
+        
+        for j, w in enumerate(windows):
+            if w > n:
+                continue
+            k = int(np.log2(w))
+            span = 2 ** k
+            table = levels[k]
+            # 창 [t-w+1, t]: 앞쪽 구간 시작 t-w+1, 뒤쪽 구간 시작 t-span+1
+            out[w - 1:, j] = np.maximum(table[:n - w + 1], table[w - span:n - span + 1])
+        return out
+    
+    @staticmethod
+    def rolling_min_matrix(values, windows) -> np.ndarray:
+        """여러 창 길이 rolling min (rolling_max_matrix의 부호 반전)"""
+        return -TechnicalIndicators.rolling_max_matrix(-np.asarray(values, dtype=float), windows)
+    
+    def _calculate_rsi(self, prices: pd.Series, period: int = 14) -> pd.Series:
+        """RSI 계산 (설정의 평활 방식/워밍업 정책, 기간만 지정)"""
+        return RSI(period, self.rsi_engine.smoothing, self.rsi_engine.warmup, self.rsi_engine.fill_value,
+                   backend=self.backend).calculate(prices)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,90 @@
+"""
+상위 봉(1d/1w) 지표를 기본 봉(4h)에 붙이는 모듈 (미래 데이터 없이)
+
+기본 봉에서 상위 봉을 파생해 지표를 계산한 뒤, 각 기본 봉 마감 시각까지
+완전히 마감된 상위 봉 중 마지막 값만 가져온다.
+    
+    상위 봉 j 사용 가능  ⇔  상위 봉 j 마감 시각 <= 기본 봉 i 마감 시각
+
+마감 시각은 정렬돼 있으므로 searchsorted 한 번으로 모든 기본 봉의 위치를 찾는다.
+진행 중인 상위 봉(예: 오늘 일봉)의 값은 그 봉이 끝나기 전까지 절대 쓰이지 않는다.
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Callable, Dict, Union
+
+from ..data.resample import resample_ohlcv
+from ..utils.helpers import INTERVAL_SECONDS
+
+
+def bar_close_times(index, interval: str) -> np.ndarray:
+    """봉 시작 시각 인덱스 → 마감 시각 (int64 ns)"""
+    index = pd.DatetimeIndex(index)
+    return index.as_unit('ns').asi8 + INTERVAL_SECONDS[interval] * 10**9
+
+
+def closed_bar_positions(base_index, base_interval: str, higher_index, interval: str) -> np.ndarray:
+    """
+    기본 봉마다 그 봉 마감 시점에 마감돼 있던 마지막 상위 봉 위치
+    
+    Returns:
+        정수 배열 (기본 봉 길이, 해당 상위 봉이 없으면 -1)
+    """
+    base_close = bar_close_times(base_index, base_interval)
+    higher_close = bar_close_times(higher_index, interval)
+    return np.searchsorted(higher_close, base_close, side='right') - 1
+
+
+def align_to_base(base_index, base_interval: str, higher: pd.DataFrame, interval: str) -> pd.DataFrame:
+    """
+    상위 봉 컬럼을 기본 봉 인덱스로 forward 정렬
+    
+    Args:
+        base_index: 기본 봉 시작 시각 인덱스
+        base_interval: 기본 봉 간격 (예: '4h')
+        higher: 상위 봉 지표 DataFrame (인덱스: 상위 봉 시작 시각)
+        interval: 상위 봉 간격 (예: '1d', '1w')
+    
+    Returns:
+        DataFrame (인덱스: base_index, 마감된 상위 봉이 없으면 NaN)
+    """
+    pos = closed_bar_positions(base_index, base_interval, higher.index, interval)
+    valid = pos >= 0
+    out = {}
+    for c in higher.columns:
+        values = higher[c].to_numpy(dtype=float)
+        col = np.full(len(pos), np.nan)
+        col[valid] = values[pos[valid]]
+        out[c] = col
+    return pd.DataFrame(out, index=base_index)
+
+
+def add_higher_timeframe(df: pd.DataFrame, interval: str,
+                         compute: Callable[[pd.DataFrame], Union[pd.DataFrame, Dict[str, pd.Series]]],
+                         base_interval: str = '4h', prefix: str = None) -> pd.DataFrame:
+    """
+    기본 봉에서 상위 봉을 만들어 지표를 계산하고 기본 봉에 붙이기
+    
+    Args:
+        df: 기본 봉 OHLCV (정렬됨)
+        interval: 상위 봉 간격 ('1d', '1w')
+        compute: 상위 봉 OHLCV → {컬럼: Series} 또는 DataFrame
+                 (예: lambda d: {'MA200': d['Close'].rolling(200).mean()})
+        base_interval: df의 봉 간격
+        prefix: 붙일 컬럼 접두사 (기본값: '{interval}_', 예: '1d_MA200')
+    
+    Returns:
+        df 컬럼 뒤에 상위 봉 지표 컬럼을 이어붙인 DataFrame
+    """
+    if INTERVAL_SECONDS[interval] <= INTERVAL_SECONDS[base_interval]:
+        raise ValueError(f"상위 봉 간격이 기본 봉보다 커야 함: {interval} <= {base_interval}")
+    
+    # 앞쪽 잘린 상위 봉도 마감 시각은 정확하므로 버리지 않는다 (값은 있는 봉만으로 계산)
+    higher = resample_ohlcv(df, interval, align_start=False)
+    features = pd.DataFrame(compute(higher), index=higher.index)
+    
+    prefix = f"{interval}_" if prefix is None else prefix
+    aligned = align_to_base(df.index, base_interval, features, interval).add_prefix(prefix)
+    kept = df.drop(columns=[c for c in aligned.columns if c in df.columns])
+    return pd.concat([kept, aligned], axis=1)
@@ -0,0 +1,5 @@
+from .hysteresis import zone_exit, zone_exit_indices, cross_below
+from .signal_set import SignalSet, confirm_prices
+from .rsi_exit import (rsi_buy_signal_set, rsi_sell_signal_set, rsi_buy_signal_sets, rsi_sell_signal_sets,
+                       rsi_buy_signals, rsi_sell_signals)
+from .rsi_peak import rsi_peak_short_signal_sets, rsi_peak_short_signal_set, rsi_peak_short_signals
@@ -0,0 +1,127 @@
+"""
+구간 진입 → 탈출 (히스테리시스) 상태 기계 벡터화 모듈
+
+RSI 과매도/과매수 시그널은 모두 같은 규칙이다.
+    
+    진입 봉(enter): 무장 (예: RSI < 35)
+    탈출 봉(exit):  무장 상태면 시그널 발생 후 해제 (예: RSI >= 40)
+    둘 다 아닌 봉:  상태 유지 (NaN 봉 포함)
+
+진입/탈출 봉만 순서대로 뽑으면 "바로 앞 이벤트가 진입인 탈출 이벤트"가 곧 시그널이다.
+(진입 뒤에는 항상 무장, 탈출 뒤에는 항상 해제 상태이므로)
+봉마다 파이썬 루프를 돌지 않고 마스크 → 이벤트 인덱스 → 첫 탈출 선택으로 끝난다.
+"""
+
+import numpy as np
+from typing import Tuple
+
+ANCHORS = ('last', 'first')
+
+
+def zone_exit(enter, exit, anchor: str = 'last') -> Tuple[np.ndarray, np.ndarray]:
+    """
+    진입 구간 뒤 첫 탈출 봉 찾기
+    
+    Args:
+        enter: 진입(무장) 봉 마스크
+        exit: 탈출 봉 마스크
+        anchor: 시그널 봉 = 탈출 직전 진입 구간의
+                'last' 마지막 진입 봉 (대시보드: 구간 안에서 계속 갱신)
+                'first' 첫 진입 봉 (optimize_params: 무장할 때 한 번만 기록)
+    
+    enter와 exit가 둘 다 참인 봉은 무장 상태면 탈출, 아니면 진입으로 본다.
+    
+    Returns:
+        (시그널 봉 인덱스, 탈출 확인 봉 인덱스) - 둘 다 int64 배열, 확인 봉 오름차순
+    """
+    if anchor not in ANCHORS:
+        raise ValueError(f"알 수 없는 anchor: {anchor}")
+    enter = np.asarray(enter, dtype=bool)
+    exit = np.asarray(exit, dtype=bool)
+    
+    events = np.flatnonzero(enter | exit)
+    if (enter[events] & exit[events]).any():
+        return _zone_exit_sequential(events, enter[events], exit[events], anchor)
+    
+    is_enter = enter[events]
+    # 바로 앞 이벤트가 진입인 탈출 이벤트
+    fire = np.flatnonzero(~is_enter[1:] & is_enter[:-1]) + 1
+    if anchor == 'last':
+        anchor_pos = fire - 1
+    else:
+        # 진입 이벤트 연속 구간의 첫 위치
+        run_start = is_enter & np.r_[True, ~is_enter[:-1]]
+        first = np.maximum.accumulate(np.where(run_start, np.arange(len(events)), 0))
+        anchor_pos = first[fire - 1]
+    return events[anchor_pos], events[fire]
+
+
+def _zone_exit_sequential(events, is_enter, is_exit, anchor):
+    """진입/탈출이 겹치는 봉이 있을 때 (탈출 임계값이 진입 구간 안쪽) - 이벤트 봉만 순서대로"""
+    signal, confirm = [], []
+    armed_at = -1
+    for pos, e, x in zip(events.tolist(), is_enter.tolist(), is_exit.tolist()):
+        if armed_at >= 0 and x:
+            signal.append(armed_at)
+            confirm.append(pos)
+            armed_at = -1
+        elif e and (armed_at < 0 or anchor == 'last'):
+            armed_at = pos
+    return np.array(signal, dtype=np.int64), np.array(confirm, dtype=np.int64)
+
+
+def zone_exit_indices(enter_idx: np.ndarray, exit_idx: np.ndarray, anchor: str = 'last') -> Tuple[np.ndarray, np.ndarray]:
+    """
+    zone_exit의 봉 위치 입력 버전 (진입/탈출 봉 위치가 겹치지 않을 때)
+    
+    탈출 봉 x는 직전 탈출 봉과 x 사이에 진입 봉이 있으면 시그널이다.
+    마스크 없이 searchsorted만 쓰므로 이벤트 수에만 비례 - 임계값 격자에서 봉 위치를 공유할 때 쓴다.
+    탈출은 구간 시작 봉만, 진입은 구간 끝('last') / 시작('first') 봉만 넘겨도 결과가 같다.
+    
+    Args:
+        enter_idx: 진입 봉 위치 (오름차순)
+        exit_idx: 탈출 봉 위치 (오름차순, enter_idx와 겹치지 않음)
+        anchor: zone_exit와 동일
+    
+    Returns:
+        (시그널 봉 인덱스, 탈출 확인 봉 인덱스) - zone_exit와 같은 결과
+    """
+    if anchor not in ANCHORS:
+        raise ValueError(f"알 수 없는 anchor: {anchor}")
+    enter_idx = np.asarray(enter_idx, dtype=np.int64)
+    exit_idx = np.asarray(exit_idx, dtype=np.int64)
+    # 직전 탈출 봉 (첫 탈출은 -1, 탈출이 없으면 빈 배열)
+    prev_exit = np.r_[-1, exit_idx][:len(exit_idx)]
+    
+    if anchor == 'last':
+        # x 앞의 마지막 진입 봉
+        pos = np.searchsorted(enter_idx, exit_idx) - 1
+        fire = pos >= 0
+        fire[fire] = enter_idx[pos[fire]] > prev_exit[fire]
+    else:
+        # 직전 탈출 뒤 첫 진입 봉
+        pos = np.searchsorted(enter_idx, prev_exit, side='right')
+        fire = pos < len(enter_idx)
+        fire[fire] = enter_idx[pos[fire]] < exit_idx[fire]
+    return enter_idx[pos[fire]], exit_idx[fire]
+
+
+def cross_below(values, level: float, prev=None) -> np.ndarray:
+    """
+    level 하향 돌파 봉 위치 (직전 봉 > level, 현재 봉 <= level)
+    
+    NaN 봉은 돌파가 아니다 (`pd.isna(curr) or pd.isna(prev)`면 건너뛰던 루프와 동일).
+    
+    Args:
+        values: 값 배열 (예: RSI)
+        level: 기준값
+        prev: 봉별 직전 값 배열 (None이면 한 칸 민 값, 첫 봉은 돌파 없음)
+    
+    Returns:
+        돌파 봉 인덱스 (int64, 오름차순)
+    """
+    values = np.asarray(values, dtype=float)
+    if prev is None:
+        prev = np.r_[np.nan, values[:-1]]
+    with np.errstate(invalid='ignore'):
+        return np.flatnonzero((prev > level) & (values <= level))
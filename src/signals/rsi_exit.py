@@ -0,0 +1,213 @@
+"""RSI 구간 탈출 매수/매도 시그널 모듈 (대시보드·최적화 스크립트 공용)"""
+
+import numpy as np
+import pandas as pd
+
+from .hysteresis import zone_exit, zone_exit_indices
+from .signal_set import SignalSet
+
+# golden_cross가 NaN인 봉 처리: 거부 / 허용 / 봉 자체를 건너뜀 (RSI NaN 봉처럼 상태 유지)
+MISSING_FILTERS = ('reject', 'accept', 'skip')
+
+
+def golden_cross_mask(df: pd.DataFrame, missing: bool = False) -> np.ndarray:
+    """golden_cross 컬럼 → bool 배열 (NaN은 missing, 기본값은 `gc if not pd.isna(gc) else False`와 같음)"""
+    gc = df['golden_cross']
+    if gc.dtype == bool:
+        return gc.to_numpy()
+    return gc.astype(object).where(gc.notna(), missing).astype(bool).to_numpy()
+
+
+def _extra(kind: str = None, **fields) -> dict:
+    return {'type': kind, **fields} if kind is not None else fields
+
+
+class _LevelIndex(dict):
+    """
+    임계값 → `op(rsi, 임계값)` 구간의 시작(또는 끝) 봉 위치 (오름차순)
+    
+    처음 물을 때 한 번 계산해 조합끼리 공유한다. 시그널은 구간 경계에서만 나므로 경계만 있으면 된다
+    (직전 탈출 뒤 첫 진입 = 진입 구간 시작, 탈출 직전 마지막 진입 = 진입 구간 끝, 진입 뒤 첫 탈출 = 탈출 구간 시작).
+    """
+    
+    def __init__(self, rsi: np.ndarray, op, keep: np.ndarray = None, edge: str = 'start'):
+        super().__init__()
+        self.rsi, self.op, self.keep, self.edge = rsi, op, keep, edge
+    
+    def __missing__(self, level):
+        with np.errstate(invalid='ignore'):
+            mask = self.op(self.rsi, level)
+        if self.keep is not None:
+            mask &= self.keep
+        if self.edge == 'start':
+            boundary = mask & ~np.r_[False, mask[:-1]]
+        else:
+            boundary = mask & ~np.r_[mask[1:], False]
+        self[level] = idx = np.flatnonzero(boundary)
+        return idx
+
+
+def rsi_buy_signal_set(df: pd.DataFrame, rsi_oversold: float, rsi_exit: float, use_golden_cross: bool = False,
+                       anchor: str = 'last', reset_on_reject: bool = False, missing_filter: str = 'reject',
+                       kind: str = None) -> SignalSet:
+    """
+    매수 시그널: RSI < rsi_oversold 진입 후 RSI >= rsi_exit 탈출 시 매수
+    
+    Args:
+        df: 'rsi', 'Close' (use_golden_cross면 'golden_cross') 컬럼이 있는 DataFrame
+        rsi_oversold: 과매도 진입 기준
+        rsi_exit: 탈출(매수 확인) 기준
+        use_golden_cross: 골든크로스일 때만 매수
+        anchor: 'last' - 탈출 직전 과매도 봉이 시그널 봉, 탈출 봉은 과매도 밖이어야 함 (대시보드)
+                'first' - 과매도 첫 봉이 시그널 봉, RSI >= rsi_exit면 바로 탈출 (optimize_params)
+        reset_on_reject: 골든크로스 필터로 거른 탈출에서도 대기 해제 (dashboard_4h_dual),
+                         False면 다음 탈출 봉까지 대기 유지 (dashboard_4h)
+        missing_filter: golden_cross NaN 봉 처리
+                        'reject' - 필터 거부 (대시보드)
+                        'accept' - 필터 통과 (verify_dashboard_calc: `... and gc`)
+                        'skip' - RSI NaN처럼 봉을 건너뜀 (optimize_final, optimize_with_gc)
+        kind: 시그널 dict에 넣을 'type' 값 (예: 'long', 'short_exit'), None이면 넣지 않음
+    
+    Returns:
+        SignalSet (dict로 바꾸면 'golden_cross': True 포함, 확인 봉 순서)
+    """
+    rsi = df['rsi'].to_numpy(dtype=float)
+    with np.errstate(invalid='ignore'):
+        enter = rsi < rsi_oversold
+        exit = rsi >= rsi_exit
+    if anchor == 'last':
+        exit &= ~enter
+    
+    if missing_filter not in MISSING_FILTERS:
+        raise ValueError(f"알 수 없는 missing_filter: {missing_filter}")
+    accept = None
+    if use_golden_cross and 'golden_cross' in df.columns:
+        accept = golden_cross_mask(df, missing=missing_filter == 'accept')
+        if missing_filter == 'skip':
+            present = df['golden_cross'].notna().to_numpy()
+            enter &= present
+            exit &= present
+    if accept is not None and not reset_on_reject:
+        exit &= accept
+    
+    signal, confirm = zone_exit(enter, exit, anchor)
+    if accept is not None and reset_on_reject:
+        keep = accept[confirm]
+        signal, confirm = signal[keep], confirm[keep]
+    return SignalSet(df, signal, confirm, rsi, _extra(kind, golden_cross=True))
+
+
+def rsi_sell_signal_set(df: pd.DataFrame, rsi_overbought: float, rsi_exit: float, anchor: str = 'last',
+                        kind: str = None) -> SignalSet:
+    """
+    매도 시그널: RSI > rsi_overbought 진입 후 RSI <= rsi_exit 하락 시 매도
+    
+    Args:
+        df: 'rsi', 'Close' 컬럼이 있는 DataFrame
+        rsi_overbought: 과매수 진입 기준
+        rsi_exit: 탈출(매도 확인) 기준
+        anchor, kind: rsi_buy_signal_set과 동일
+    
+    Returns:
+        SignalSet (확인 봉 순서)
+    """
+    rsi = df['rsi'].to_numpy(dtype=float)
+    with np.errstate(invalid='ignore'):
+        enter = rsi > rsi_overbought
+        exit = rsi <= rsi_exit
+    if anchor == 'last':
+        exit &= ~enter
+    
+    signal, confirm = zone_exit(enter, exit, anchor)
+    return SignalSet(df, signal, confirm, rsi, _extra(kind))
+
+
+def rsi_buy_signal_sets(df: pd.DataFrame, pairs, use_golden_cross: bool = False, anchor: str = 'last',
+                        reset_on_reject: bool = False, missing_filter: str = 'reject', kind: str = None) -> dict:
+    """
+    매수 시그널 일괄 계산: 여러 (rsi_oversold, rsi_exit) 조합을 한 번에 (최적화 격자용)
+    
+    과매도 구간(RSI < 임계값)과 탈출 구간(RSI >= 임계값)의 경계 봉을 임계값마다 한 번만 구해 두고
+    조합마다 zone_exit_indices로 맞춘다 - 조합당 비용은 봉 수가 아니라 구간 수에 비례.
+    anchor='last'의 탈출 봉(과매도 밖, RSI >= rsi_exit)은 RSI >= max(rsi_oversold, rsi_exit)와 같다.
+    
+    Args:
+        df: rsi_buy_signal_set과 동일
+        pairs: (rsi_oversold, rsi_exit) 목록
+        나머지: rsi_buy_signal_set과 동일
+    
+    Returns:
+        {(rsi_oversold, rsi_exit): SignalSet} - 조합마다 rsi_buy_signal_set과 같은 결과
+    """
+    rsi = df['rsi'].to_numpy(dtype=float)
+    if missing_filter not in MISSING_FILTERS:
+        raise ValueError(f"알 수 없는 missing_filter: {missing_filter}")
+    accept = present = None
+    if use_golden_cross and 'golden_cross' in df.columns:
+        accept = golden_cross_mask(df, missing=missing_filter == 'accept')
+        if missing_filter == 'skip':
+            present = df['golden_cross'].notna().to_numpy()
+    exit_keep = present
+    if accept is not None and not reset_on_reject:
+        exit_keep = accept if present is None else accept & present
+    
+    below = _LevelIndex(rsi, np.less, present, 'end' if anchor == 'last' else 'start')
+    at_or_above = _LevelIndex(rsi, np.greater_equal, exit_keep)
+    results = {}
+    for rsi_oversold, rsi_exit in pairs:
+        if anchor == 'first' and rsi_exit < rsi_oversold:
+            # 진입/탈출 봉이 겹침 → 봉 순서대로 처리하는 단건 경로
+            results[(rsi_oversold, rsi_exit)] = rsi_buy_signal_set(
+                df, rsi_oversold, rsi_exit, use_golden_cross, anchor, reset_on_reject, missing_filter, kind)
+            continue
+        exit_level = max(rsi_oversold, rsi_exit) if anchor == 'last' else rsi_exit
+        signal, confirm = zone_exit_indices(below[rsi_oversold], at_or_above[exit_level], anchor)
+        if accept is not None and reset_on_reject:
+            keep = accept[confirm]
+            signal, confirm = signal[keep], confirm[keep]
+        results[(rsi_oversold, rsi_exit)] = SignalSet(df, signal, confirm, rsi, _extra(kind, golden_cross=True))
+    return results
+
+
+def rsi_sell_signal_sets(df: pd.DataFrame, pairs, anchor: str = 'last', kind: str = None) -> dict:
+    """
+    매도 시그널 일괄 계산: 여러 (rsi_overbought, rsi_exit) 조합을 한 번에
+    
+    rsi_buy_signal_sets와 같은 방식 (anchor='last'의 탈출 봉은 RSI <= min(rsi_overbought, rsi_exit)).
+    
+    Returns:
+        {(rsi_overbought, rsi_exit): SignalSet} - 조합마다 rsi_sell_signal_set과 같은 결과
+    """
+    rsi = df['rsi'].to_numpy(dtype=float)
+    above = _LevelIndex(rsi, np.greater, edge='end' if anchor == 'last' else 'start')
+    at_or_below = _LevelIndex(rsi, np.less_equal)
+    results = {}
+    for rsi_overbought, rsi_exit in pairs:
+        if anchor == 'first' and rsi_exit > rsi_overbought:
+            results[(rsi_overbought, rsi_exit)] = rsi_sell_signal_set(df, rsi_overbought, rsi_exit, anchor, kind)
+            continue
+        exit_level = min(rsi_overbought, rsi_exit) if anchor == 'last' else rsi_exit
+        signal, confirm = zone_exit_indices(above[rsi_overbought], at_or_below[exit_level], anchor)
+        results[(rsi_overbought, rsi_exit)] = SignalSet(df, signal, confirm, rsi, _extra(kind))
+    return results
+
+
+def rsi_buy_signals(df: pd.DataFrame, *args, **kwargs) -> list:
+    """
+    rsi_buy_signal_set의 dict 리스트 버전 (화면 표시·기존 코드용, 인자 동일)
+    
+    Returns:
+        [{'signal_date', 'signal_price', 'signal_rsi', 'confirm_date', 'confirm_price',
+          'confirm_rsi', 'golden_cross'}, ...] (확인 봉 순서)
+    """
+    return rsi_buy_signal_set(df, *args, **kwargs).to_records()
+
+
+def rsi_sell_signals(df: pd.DataFrame, *args, **kwargs) -> list:
+    """
+    rsi_sell_signal_set의 dict 리스트 버전 (인자 동일)
+    
+    Returns:
+        [{'signal_date', 'signal_price', 'signal_rsi', 'confirm_date', 'confirm_price', 'confirm_rsi'}, ...]
+    """
+    return rsi_sell_signal_set(df, *args, **kwargs).to_records()
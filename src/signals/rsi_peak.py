@@ -0,0 +1,113 @@
+"""
+RSI 피크 후 하락 숏 진입 시그널 모듈 (dashboard_4h_dual·optimize_dual_strategy 공용)
+
+기존 구현은 봉마다 `rsi.iloc[idx-lookback:idx]`를 잘라 any()로 피크를 찾고,
+다시 거꾸로 훑어 peak_idx를 구했다 (O(n·lookback)).
+여기서는 "RSI > rsi_peak였던 마지막 봉 위치"를 한 번 누적해 두고 (O(n)),
+확인 봉 직전 값이 lookback 안에 있는지만 본다 - lookback 길이와 무관하다.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .hysteresis import cross_below
+from .signal_set import SignalSet
+from .rsi_exit import _extra
+
+
+def last_true_index(mask: np.ndarray) -> np.ndarray:
+    """봉별로 mask가 True였던 마지막 위치 (해당 봉 포함, 없으면 -1)"""
+    return np.maximum.accumulate(np.where(mask, np.arange(len(mask)), -1))
+
+
+def _truthy(df: pd.DataFrame, column: str, default: bool) -> np.ndarray:
+    """컬럼 값의 `if value:` 판정 배열 (NaN은 참, None은 거짓 - 기존 루프와 동일)"""
+    if column not in df.columns:
+        return np.full(len(df), default)
+    values = df[column]
+    if values.dtype == bool:
+        return values.to_numpy()
+    return np.fromiter(map(bool, values.to_numpy(dtype=object)), dtype=bool, count=len(values))
+
+
+def rsi_peak_short_signal_sets(df: pd.DataFrame, triples, dc_rsi_threshold: float = None,
+                               kind: str = 'short') -> dict:
+    """
+    숏 진입 시그널 일괄 계산: 여러 (rsi_peak, rsi_entry, lookback) 조합을 한 번에
+    
+    조건 (확인 봉 idx >= lookback):
+        직전 lookback봉 [idx-lookback, idx-1] 안에 RSI > rsi_peak 봉이 있고
+        RSI가 rsi_entry를 하향 돌파 (prev > rsi_entry, curr <= rsi_entry)
+        → 시그널 봉 = 구간 안 마지막 피크 봉
+    
+    rsi_peak별 "마지막 피크 위치", rsi_entry별 하향 돌파 봉은 한 번만 계산해 조합끼리 공유한다.
+    
+    Args:
+        df: 'rsi', 'Close' 컬럼이 있는 DataFrame
+        triples: (rsi_peak, rsi_entry, lookback) 목록
+        dc_rsi_threshold: 지정하면 dashboard_4h_dual 방식 -
+                          골든크로스 봉에서만 피크 조건을 보고 ('golden_cross' 없으면 모든 봉),
+                          데드크로스 봉('dead_cross')에서는 RSI가 dc_rsi_threshold를 하향 돌파하면
+                          그 봉이 시그널 (signal_rsi = 직전 봉 RSI)
+                          None이면 optimize_dual_strategy 방식 (모든 봉에서 피크 조건)
+        kind: 시그널 dict의 'type' 값
+    
+    Returns:
+        {(rsi_peak, rsi_entry, lookback): SignalSet} (확인 봉 순서)
+    """
+    rsi = df['rsi'].to_numpy(dtype=float)
+    # idx=0의 직전 값은 기존 루프의 iloc[-1]처럼 마지막 봉 (lookback=0일 때만 의미 있음)
+    prev = np.roll(rsi, 1)
+    
+    gc = dc_confirm = None
+    if dc_rsi_threshold is not None:
+        gc = _truthy(df, 'golden_cross', True)
+        dc = _truthy(df, 'dead_cross', False)
+        dc_confirm = cross_below(rsi, dc_rsi_threshold, prev)
+        dc_confirm = dc_confirm[~gc[dc_confirm] & dc[dc_confirm]]
+    
+    last_peaks, crosses, results = {}, {}, {}
+    for rsi_peak, rsi_entry, lookback in triples:
+        if rsi_peak not in last_peaks:
+            with np.errstate(invalid='ignore'):
+                last_peaks[rsi_peak] = last_true_index(rsi > rsi_peak)
+        if rsi_entry not in crosses:
+            crosses[rsi_entry] = cross_below(rsi, rsi_entry, prev)
+        
+        confirm = crosses[rsi_entry]
+        confirm = confirm[confirm >= lookback]
+        if gc is not None:
+            confirm = confirm[gc[confirm]]
+        # 확인 봉 직전까지의 마지막 피크가 lookback 구간 안이어야 함
+        peak = last_peaks[rsi_peak][confirm - 1]
+        keep = (peak >= confirm - lookback) & (peak < confirm)
+        signal, confirm = peak[keep], confirm[keep]
+        signal_rsi = rsi[signal]
+        
+        if dc_confirm is not None:
+            dc_part = dc_confirm[dc_confirm >= lookback]
+            order = np.argsort(np.r_[confirm, dc_part], kind='stable')
+            signal = np.r_[signal, dc_part][order]
+            confirm = np.r_[confirm, dc_part][order]
+            signal_rsi = np.r_[signal_rsi, prev[dc_part]][order]
+        
+        results[(rsi_peak, rsi_entry, lookback)] = SignalSet(df, signal, confirm, rsi, _extra(kind), signal_rsi)
+    return results
+
+
+def rsi_peak_short_signal_set(df: pd.DataFrame, rsi_peak: float, rsi_entry: float, lookback: int,
+                              dc_rsi_threshold: float = None, kind: str = 'short') -> SignalSet:
+    """숏 진입 시그널 (조합 하나, 인자는 rsi_peak_short_signal_sets와 동일)"""
+    triple = (rsi_peak, rsi_entry, lookback)
+    return rsi_peak_short_signal_sets(df, [triple], dc_rsi_threshold, kind)[triple]
+
+
+def rsi_peak_short_signals(df: pd.DataFrame, *args, **kwargs) -> list:
+    """
+    rsi_peak_short_signal_set의 dict 리스트 버전 (화면 표시용, 인자 동일)
+    
+    Returns:
+        [{'signal_date', 'signal_price', 'signal_rsi', 'confirm_date', 'confirm_price',
+          'confirm_rsi', 'type'}, ...] (확인 봉 순서)
+    """
+    return rsi_peak_short_signal_set(df, *args, **kwargs).to_records()
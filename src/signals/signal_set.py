@@ -0,0 +1,113 @@
+"""
+시그널 열 단위(columnar) 표현 모듈
+
+시그널 하나마다 dict를 만들지 않고 봉 인덱스/가격/RSI를 NumPy 배열로 들고 있는다.
+시뮬레이터는 확인 봉 인덱스를 그대로 쓰고 ({confirm_date: dict} 맵 없음),
+dict 리스트나 DataFrame은 화면에 보여줄 때만 만든다.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+class SignalSet:
+    """
+    시그널 묶음 (확인 봉 오름차순)
+    
+    속성 (모두 길이 = 시그널 수):
+        signal_idx / confirm_idx: 시그널 봉 / 확인 봉 위치 (int64)
+        signal_price / confirm_price: 해당 봉 종가
+        signal_rsi / confirm_rsi: 해당 봉 RSI
+    
+    len()과 for 문은 기존 dict 리스트와 같게 동작한다 (반복 시 dict 생성).
+    """
+    
+    __slots__ = ('index', 'signal_idx', 'confirm_idx', 'signal_price', 'confirm_price',
+                 'signal_rsi', 'confirm_rsi', 'extra')
+    
+    def __init__(self, df: pd.DataFrame, signal_idx, confirm_idx, rsi: np.ndarray = None, extra: dict = None,
+                 signal_rsi: np.ndarray = None):
+        """
+        Args:
+            df: 시그널을 찾은 DataFrame ('Close', 'rsi')
+            signal_idx: 시그널 봉 위치 배열
+            confirm_idx: 확인 봉 위치 배열
+            rsi: 이미 꺼낸 RSI 배열 (None이면 df['rsi'])
+            extra: dict로 바꿀 때 덧붙일 고정 키 (예: {'type': 'long'})
+            signal_rsi: 시그널 RSI를 직접 지정 (None이면 시그널 봉 RSI)
+        """
+        close = df['Close'].to_numpy()
+        rsi = df['rsi'].to_numpy(dtype=float) if rsi is None else rsi
+        self.index = df.index
+        self.signal_idx = np.asarray(signal_idx, dtype=np.int64)
+        self.confirm_idx = np.asarray(confirm_idx, dtype=np.int64)
+        self.signal_price = close[self.signal_idx]
+        self.confirm_price = close[self.confirm_idx]
+        self.signal_rsi = rsi[self.signal_idx] if signal_rsi is None else np.asarray(signal_rsi, dtype=float)
+        self.confirm_rsi = rsi[self.confirm_idx]
+        self.extra = extra or {}
+    
+    def __len__(self) -> int:
+        return len(self.confirm_idx)
+    
+    def __iter__(self):
+        return iter(self.to_records())
+    
+    def __repr__(self) -> str:
+        return f"SignalSet({len(self)}개, {self.extra})"
+    
+    @property
+    def signal_dates(self) -> pd.Index:
+        return self.index[self.signal_idx]
+    
+    @property
+    def confirm_dates(self) -> pd.Index:
+        return self.index[self.confirm_idx]
+    
+    def to_records(self) -> list:
+        """기존 형식 dict 리스트 ({'signal_date', ..., 'confirm_rsi', **extra})"""
+        signal_dates, confirm_dates = self.signal_dates, self.confirm_dates
+        return [{
+            'signal_date': signal_dates[i],
+            'signal_price': self.signal_price[i],
+            'signal_rsi': self.signal_rsi[i],
+            'confirm_date': confirm_dates[i],
+            'confirm_price': self.confirm_price[i],
+            'confirm_rsi': self.confirm_rsi[i],
+            **self.extra,
+        } for i in range(len(self))]
+    
+    def to_frame(self) -> pd.DataFrame:
+        """표시용 DataFrame (한 행 = 시그널 하나)"""
+        frame = pd.DataFrame({
+            'signal_date': self.signal_dates,
+            'signal_price': self.signal_price,
+            'signal_rsi': self.signal_rsi,
+            'confirm_date': self.confirm_dates,
+            'confirm_price': self.confirm_price,
+            'confirm_rsi': self.confirm_rsi,
+        })
+        for key, value in self.extra.items():
+            frame[key] = value
+        return frame
+
+
+def confirm_prices(signals, index: pd.Index) -> np.ndarray:
+    """
+    봉별 확인 가격 배열 (시그널 없는 봉은 NaN) - 시뮬레이터용
+    
+    SignalSet이면 확인 봉 인덱스를 그대로 쓰고, dict 리스트면 confirm_date로 봉을 찾는다
+    (같은 날짜가 여러 번이면 기존 {confirm_date: dict}처럼 마지막 값).
+    """
+    prices = np.full(len(index), np.nan)
+    if isinstance(signals, SignalSet) and (signals.index is index or signals.index.equals(index)):
+        prices[signals.confirm_idx] = signals.confirm_price
+        return prices
+    
+    signals = list(signals)
+    if signals:
+        pos = index.get_indexer([s['confirm_date'] for s in signals])
+        values = np.array([s['confirm_price'] for s in signals], dtype=float)
+        found = pos >= 0
+        prices[pos[found]] = values[found]
+    return prices
@@ -1,2 +1,2 @@
-from .helpers import load_config
+from .helpers import load_config, next_bar_boundary, INTERVAL_SECONDS, INTERVAL_ORIGIN_SECONDS
 
@@ -2,6 +2,25 @@
 
 import yaml
 from pathlib import Path
+from datetime import datetime
+
+
+# 봉 간격별 길이 (초)
+INTERVAL_SECONDS = {
+    '1m': 60,
+    '5m': 5 * 60,
+    '15m': 15 * 60,
+    '30m': 30 * 60,
+    '1h': 3600,
+    '4h': 4 * 3600,
+    '1d': 24 * 3600,
+    '1w': 7 * 24 * 3600,
+}
+
+# 봉 경계 기준점 (epoch 기준 초) - 주봉은 1970-01-05(월) 00:00 UTC부터 7일 단위
+INTERVAL_ORIGIN_SECONDS = {
+    '1w': 4 * 24 * 3600,
+}
 
 
 def load_config(config_path: str = "config/settings.yaml") -> dict:
@@ -15,3 +34,14 @@ def load_config(config_path: str = "config/settings.yaml") -> dict:
     with open(path, 'r', encoding='utf-8') as f:
         return yaml.safe_load(f)
 
+
+def next_bar_boundary(ts: datetime, interval: str) -> datetime:
+    """
+    ts 이후 첫 봉 경계 시각 (UTC 00:00 기준 정렬)
+    
+    naive datetime은 로컬 시각으로 보고, 결과도 로컬 naive datetime으로 반환
+    """
+    step = INTERVAL_SECONDS[interval]
+    origin = INTERVAL_ORIGIN_SECONDS.get(interval, 0)
+    epoch = int(ts.timestamp())
+    return datetime.fromtimestamp((epoch - origin) // step * step + step + origin)
@@ -0,0 +1,148 @@
+"""
+압축 표현(float32 + 1바이트 bool) 정밀도 검증
+
+같은 CSV를 float64 원본과 compact_frame 두 가지로 읽어서
+1. 메모리 사용량
+2. 컬럼 값 오차 (CSV에 저장된 지표 포함)
+3. 압축 가격으로 다시 계산한 지표 오차
+4. 롱/숏 시그널 날짜, 롱 시뮬레이션 거래 (날짜/사유/수익률)
+가 같은지, float32로 표현할 수 없는 컬럼은 float64로 남는지 확인한다. 하나라도 다르면 종료 코드 1.
+
+사용법:
+    python verify_compact_precision.py [CSV 경로 ...]
+"""
+import sys
+sys.path.insert(0, '.')
+
+import warnings
+import numpy as np
+import pandas as pd
+
+from src.data.compact import FLOAT32_RTOL, compact_frame, float32_safe, frame_nbytes, pack_bits, unpack_bits
+from src.features.technical import TechnicalIndicators
+from src.utils.helpers import load_config
+from dashboard_4h import find_buy_signals, find_sell_signals, simulate_trades
+from dashboard_4h_dual import find_short_signals, find_short_exit_signals
+
+# 수익률(%) 허용 오차: float32 가격 반올림(상대 6e-8)이 수익률에 주는 영향보다 넉넉하게
+RETURN_TOLERANCE = 1e-3
+INDICATOR_COLUMNS = ['rsi', 'MA40', 'MA100', 'MA200', 'golden_cross', 'dead_cross']
+
+
+def signal_dates(signals):
+    return [(s['signal_date'], s['confirm_date']) for s in signals]
+
+
+def compare_trades(trades64, trades32):
+    """거래 목록 비교 → (같은 거래 구조인지, 최대 수익률 차이)"""
+    keys = lambda t: (tuple(t['entry_dates']), t['exit_date'], t['exit_reason'], t['num_buys'])
+    same = [keys(t) for t in trades64] == [keys(t) for t in trades32]
+    diff = max((abs(a['return'] - b['return']) for a, b in zip(trades64, trades32)), default=0.0)
+    return same, diff
+
+
+def verify(csv_path: str) -> bool:
+    print(f"\n📂 {csv_path}")
+    df64 = pd.read_csv(csv_path, index_col=0, parse_dates=True)
+    df32 = compact_frame(df64)
+    ok = True
+    
+    # 1. 메모리
+    before, after = frame_nbytes(df64), frame_nbytes(df32)
+    print(f"  메모리: {before / 1024:,.0f} KB → {after / 1024:,.0f} KB ({after / before * 100:.0f}%)")
+    print(f"  dtype: {dict(df32.dtypes.astype(str).value_counts())}")
+    
+    # 2. 저장된 컬럼
+    for c in df64.columns:
+        a = df64[c].to_numpy()
+        b = df32[c].to_numpy()
+        if b.dtype == bool:
+            same = np.array_equal(pd.Series(a).fillna(False).astype(bool).to_numpy(), b)
+            ok &= same
+            print(f"  {'✅' if same else '❌'} {c:<14} bool 일치")
+        else:
+            a = a.astype(float)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                rel = np.nanmax(np.abs(b.astype(float) - a) / np.abs(a)) if np.isfinite(a).any() else 0.0
+            print(f"     {c:<14} {str(b.dtype):<8} 최대 상대 오차 {rel:.1e}")
+    
+    # 3. 압축 가격으로 지표 재계산 (계산은 float64)
+    ti = TechnicalIndicators(load_config().get('indicators', {}))
+    ind64 = ti.calculate(df64[['Open', 'High', 'Low', 'Close', 'Volume']], INDICATOR_COLUMNS)
+    ind32 = ti.calculate(df32[['Open', 'High', 'Low', 'Close', 'Volume']], INDICATOR_COLUMNS)
+    rsi_diff = np.nanmax(np.abs(ind64['rsi'] - ind32['rsi']))
+    cross_same = ind64['golden_cross'].equals(ind32['golden_cross']) and \
+        ind64['dead_cross'].equals(ind32['dead_cross'])
+    ok &= cross_same
+    print(f"  재계산 RSI 최대 차이 {rsi_diff:.1e}, 크로스 {'✅ 일치' if cross_same else '❌ 불일치'}")
+    
+    # 4. 시그널/거래 (대시보드 기본 파라미터)
+    for use_gc in (False, True):
+        buy64 = find_buy_signals(ind64, 35, 40, use_gc)
+        buy32 = find_buy_signals(ind32, 35, 40, use_gc)
+        sell64 = find_sell_signals(ind64, 80, 55)
+        sell32 = find_sell_signals(ind32, 80, 55)
+        same_signals = signal_dates(buy64) == signal_dates(buy32) and signal_dates(sell64) == signal_dates(sell32)
+        
+        trades64 = simulate_trades(ind64, buy64, sell64, -25)[0]
+        trades32 = simulate_trades(ind32, buy32, sell32, -25)[0]
+        same_trades, diff = compare_trades(trades64, trades32)
+        passed = same_signals and same_trades and diff <= RETURN_TOLERANCE
+        ok &= passed
+        print(f"  {'✅' if passed else '❌'} 롱 (GC {'ON' if use_gc else 'OFF'}): 매수 {len(buy64)}/{len(buy32)}, "
+              f"매도 {len(sell64)}/{len(sell32)}, 거래 {len(trades64)}/{len(trades32)}, 수익률 최대 차이 {diff:.1e}%p")
+    
+    short64 = find_short_signals(ind64) + find_short_exit_signals(ind64)
+    short32 = find_short_signals(ind32) + find_short_exit_signals(ind32)
+    same_short = [s['confirm_date'] for s in short64] == [s['confirm_date'] for s in short32]
+    ok &= same_short
+    print(f"  {'✅' if same_short else '❌'} 숏 진입/청산 시그널 {len(short64)}/{len(short32)}")
+    
+    # 5. 비트마스크 왕복 (스윕 시그널 행렬용)
+    mask = np.column_stack([ind64['golden_cross'].to_numpy(), ind64['dead_cross'].to_numpy()])
+    packed = pack_bits(mask)
+    same_bits = np.array_equal(unpack_bits(packed, len(mask)), mask)
+    ok &= same_bits
+    print(f"  {'✅' if same_bits else '❌'} 비트마스크: {mask.nbytes:,} B → {packed.nbytes:,} B")
+    return ok
+
+
+def verify_refusal() -> bool:
+    """float32로 표현할 수 없는 컬럼은 float64로 남는지 (경고 포함)"""
+    print("\n📂 float32 거부 케이스")
+    prices = np.linspace(100.01, 69000.37, 1000)
+    cases = [
+        ("가격 (정상 범위)", prices, FLOAT32_RTOL, True),
+        ("범위 초과 (1e39 → inf)", np.r_[prices, 1e39], FLOAT32_RTOL, False),
+        ("비정규화 (1e-40)", np.r_[prices, 1e-40], FLOAT32_RTOL, False),
+        ("rtol을 반올림 상한보다 엄격하게 (1e-9)", prices, 1e-9, False),
+    ]
+    ok = True
+    for label, values, rtol, expected in cases:
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            index = pd.date_range('2024', periods=len(values), freq='4h')
+            dtype = compact_frame(pd.DataFrame({'x': values}, index=index), rtol)['x'].dtype
+        passed = float32_safe(values, rtol) == expected and (dtype == np.float32) == expected \
+            and bool(caught) != expected
+        ok &= passed
+        print(f"  {'✅' if passed else '❌'} {label}: {dtype}{' (경고)' if caught else ''}")
+    return ok
+
+
+if __name__ == '__main__':
+    paths = sys.argv[1:] or ["data/btc_4h_5y.csv", "data/eth_4h_5y.csv"]
+    
+    print("=" * 80)
+    print("🔍 압축 표현 정밀도 검증 (float32 / bool / int64 epoch)")
+    print("=" * 80)
+    
+    results = [verify(p) for p in paths] + [verify_refusal()]
+    
+    print("\n" + "=" * 80)
+    if all(results):
+        print("✅ 시그널과 거래 결과 동일 - 압축 표현 사용 가능")
+    else:
+        print("❌ 차이 발견 - 해당 컬럼은 compact_frame(keep=[...])로 float64 유지")
+    print("=" * 80)
+    sys.exit(0 if all(results) else 1)
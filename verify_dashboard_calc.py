@@ -4,11 +4,12 @@
 - 결과가 대시보드와 일치하는지 확인
 """
 
-import pandas as pd
+import numpy as np
 import yfinance as yf
 import sys
 sys.path.insert(0, '.')
 from src.features.technical import TechnicalIndicators
+from src.signals import confirm_prices, rsi_buy_signals, rsi_peak_short_signals, rsi_sell_signals
 from src.utils.helpers import load_config
 
 # 대시보드와 동일하게 데이터 로드
@@ -24,10 +25,7 @@ df = df.resample('4h').agg({
 
 # 지표 계산
 ti = TechnicalIndicators(load_config().get('indicators', {}))
-df = ti.calculate_all(df)
-df['MA40'] = df['Close'].rolling(window=40).mean()
-df['MA200'] = df['Close'].rolling(window=200).mean()
-df['golden_cross'] = df['MA40'] > df['MA200']
+df = ti.calculate(df, ['rsi', 'MA40', 'MA200', 'golden_cross'])
 
 print('=' * 80)
 print('🔍 대시보드 계산 검증')
@@ -59,142 +57,29 @@ print(f"숏: lookback {short_lookback}, max_hold {short_max_hold}, max_entries {
 
 # ===== 대시보드와 동일한 시그널 함수 =====
 def find_long_signals(df, rsi_oversold=35, rsi_exit=40, use_gc=True):
-    signals = []
-    in_oversold = False
-    last_signal_date = None
-    last_signal_price = None
-    
-    for idx in range(len(df)):
-        rsi = df['rsi'].iloc[idx]
-        gc = df['golden_cross'].iloc[idx] if use_gc else True
-        
-        if pd.isna(rsi):
-            continue
-        
-        if rsi < rsi_oversold:
-            in_oversold = True
-            last_signal_date = df.index[idx]
-            last_signal_price = df['Close'].iloc[idx]
-        else:
-            if in_oversold and rsi >= rsi_exit and last_signal_date is not None and gc:
-                signals.append({
-                    'type': 'long_entry',
-                    'signal_date': last_signal_date,
-                    'signal_price': last_signal_price,
-                    'confirm_date': df.index[idx],
-                    'confirm_price': df['Close'].iloc[idx],
-                    'confirm_rsi': rsi
-                })
-                in_oversold = False
-                last_signal_date = None
-    return signals
+    return rsi_buy_signals(df, rsi_oversold, rsi_exit, use_gc, missing_filter='accept', kind='long_entry')
 
 
 def find_long_exit_signals(df, rsi_overbought=80, rsi_sell=55):
-    signals = []
-    in_overbought = False
-    last_signal_date = None
-    last_signal_price = None
-    
-    for idx in range(len(df)):
-        rsi = df['rsi'].iloc[idx]
-        
-        if pd.isna(rsi):
-            continue
-        
-        if rsi > rsi_overbought:
-            in_overbought = True
-            last_signal_date = df.index[idx]
-            last_signal_price = df['Close'].iloc[idx]
-        else:
-            if in_overbought and rsi <= rsi_sell and last_signal_date is not None:
-                signals.append({
-                    'type': 'long_exit',
-                    'signal_date': last_signal_date,
-                    'signal_price': last_signal_price,
-                    'confirm_date': df.index[idx],
-                    'confirm_price': df['Close'].iloc[idx],
-                    'confirm_rsi': rsi
-                })
-                in_overbought = False
-                last_signal_date = None
-    return signals
+    return rsi_sell_signals(df, rsi_overbought, rsi_sell, kind='long_exit')
 
 
 def find_short_signals(df, rsi_peak=80, rsi_exit=70, lookback=30):
-    signals = []
-    
-    for idx in range(lookback, len(df)):
-        recent_rsi = df['rsi'].iloc[idx-lookback:idx]
-        had_peak = any(recent_rsi > rsi_peak)
-        
-        if not had_peak:
-            continue
-        
-        curr_rsi = df['rsi'].iloc[idx]
-        prev_rsi = df['rsi'].iloc[idx-1]
-        
-        if pd.isna(curr_rsi) or pd.isna(prev_rsi):
-            continue
-        
-        if prev_rsi > rsi_exit and curr_rsi <= rsi_exit:
-            peak_idx = None
-            for j in range(idx-1, max(idx-lookback, 0)-1, -1):
-                if df['rsi'].iloc[j] > rsi_peak:
-                    peak_idx = j
-                    break
-            
-            if peak_idx is not None:
-                signals.append({
-                    'type': 'short_entry',
-                    'peak_date': df.index[peak_idx],
-                    'peak_price': df['Close'].iloc[peak_idx],
-                    'peak_rsi': df['rsi'].iloc[peak_idx],
-                    'confirm_date': df.index[idx],
-                    'confirm_price': df['Close'].iloc[idx],
-                    'confirm_rsi': curr_rsi
-                })
-    return signals
+    return [{key.replace('signal_', 'peak_'): value for key, value in s.items()}
+            for s in rsi_peak_short_signals(df, rsi_peak, rsi_exit, lookback, kind='short_entry')]
 
 
 def find_short_exit_signals(df, rsi_oversold=35, rsi_exit=45):
-    signals = []
-    in_oversold = False
-    last_signal_date = None
-    last_signal_price = None
-    
-    for idx in range(len(df)):
-        rsi = df['rsi'].iloc[idx]
-        
-        if pd.isna(rsi):
-            continue
-        
-        if rsi < rsi_oversold:
-            in_oversold = True
-            last_signal_date = df.index[idx]
-            last_signal_price = df['Close'].iloc[idx]
-        else:
-            if in_oversold and rsi >= rsi_exit and last_signal_date is not None:
-                signals.append({
-                    'type': 'short_exit',
-                    'signal_date': last_signal_date,
-                    'signal_price': last_signal_price,
-                    'confirm_date': df.index[idx],
-                    'confirm_price': df['Close'].iloc[idx],
-                    'confirm_rsi': rsi
-                })
-                in_oversold = False
-                last_signal_date = None
-    return signals
+    return rsi_buy_signals(df, rsi_oversold, rsi_exit, kind='short_exit')
 
 
 def simulate_dual_trades(df, long_signals, long_exit_signals, short_signals, short_exit_signals,
                          l_stop=-25, s_stop=-15, s_max_hold=42, s_max_entries=4):
     """대시보드와 동일한 시뮬레이션 로직"""
-    long_entry_dates = {s['confirm_date']: s for s in long_signals}
-    long_exit_dates = {s['confirm_date']: s for s in long_exit_signals}
-    short_entry_dates = {s['confirm_date']: s for s in short_signals}
-    short_exit_dates = {s['confirm_date']: s for s in short_exit_signals}
+    long_entry_prices = confirm_prices(long_signals, df.index)
+    long_exit_prices = confirm_prices(long_exit_signals, df.index)
+    short_entry_prices = confirm_prices(short_signals, df.index)
+    short_exit_prices = confirm_prices(short_exit_signals, df.index)
     
     trades = []
     current_position = None
@@ -222,12 +107,12 @@ def simulate_dual_trades(df, long_signals, long_exit_signals, short_signals, sho
             
             if current_return <= stop_loss:
                 exit_reason = "손절"
-            elif current_position == 'long' and current_date in long_exit_dates:
+            elif current_position == 'long' and not np.isnan(long_exit_prices[idx]):
                 if current_return > 0:
                     exit_reason = "익절"
-                    exit_price = long_exit_dates[current_date]['confirm_price']
-            elif current_position == 'short' and current_date in short_exit_dates:
-                exit_price_candidate = short_exit_dates[current_date]['confirm_price']
+                    exit_price = long_exit_prices[idx]
+            elif current_position == 'short' and not np.isnan(short_exit_prices[idx]):
+                exit_price_candidate = short_exit_prices[idx]
                 candidate_return = -((exit_price_candidate / avg_price - 1) * 100)
                 if candidate_return > 0:
                     exit_reason = "익절"
@@ -260,21 +145,21 @@ def simulate_dual_trades(df, long_signals, long_exit_signals, short_signals, sho
         
         # 신규 진입
         if current_position is None:
-            if current_date in long_entry_dates:
+            if not np.isnan(long_entry_prices[idx]):
                 current_position = 'long'
-                positions.append({'date': current_date, 'price': long_entry_dates[current_date]['confirm_price']})
+                positions.append({'date': current_date, 'price': long_entry_prices[idx]})
                 entry_bar_idx = idx
-            elif current_date in short_entry_dates:
+            elif not np.isnan(short_entry_prices[idx]):
                 current_position = 'short'
-                positions.append({'date': current_date, 'price': short_entry_dates[current_date]['confirm_price']})
+                positions.append({'date': current_date, 'price': short_entry_prices[idx]})
                 entry_bar_idx = idx
         
         # 물타기
-        elif current_position == 'long' and current_date in long_entry_dates:
-            positions.append({'date': current_date, 'price': long_entry_dates[current_date]['confirm_price']})
-        elif current_position == 'short' and current_date in short_entry_dates:
+        elif current_position == 'long' and not np.isnan(long_entry_prices[idx]):
+            positions.append({'date': current_date, 'price': long_entry_prices[idx]})
+        elif current_position == 'short' and not np.isnan(short_entry_prices[idx]):
             if len(positions) < s_max_entries:
-                positions.append({'date': current_date, 'price': short_entry_dates[current_date]['confirm_price']})
+                positions.append({'date': current_date, 'price': short_entry_prices[idx]})
     
     return trades
 
@@ -5,6 +5,11 @@ ETH 최근 2년 결과 검증
 import pandas as pd
 import numpy as np
 from datetime import timedelta
+import sys
+sys.path.insert(0, '.')
+
+from src.features.rsi import RSI
+from src.signals import rsi_buy_signals, rsi_sell_signals
 
 # 5년 데이터로 최근 2년 테스트
 df = pd.read_csv('data/eth_4h_5y.csv', index_col='Date', parse_dates=True)
@@ -21,14 +26,7 @@ print(f'데이터 개수: {len(df_2y)}개')
 print()
 
 # RSI 계산
-def calculate_rsi(series, period=14):
-    delta = series.diff()
-    gain = delta.where(delta > 0, 0).rolling(window=period).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-    rs = gain / loss
-    return 100 - (100 / (1 + rs))
-
-df_2y['rsi'] = calculate_rsi(df_2y['Close'])
+df_2y['rsi'] = RSI(14).calculate(df_2y['Close'])
 exp1 = df_2y['Close'].ewm(span=12, adjust=False).mean()
 exp2 = df_2y['Close'].ewm(span=26, adjust=False).mean()
 df_2y['MACD'] = exp1 - exp2
@@ -39,31 +37,10 @@ RSI_SELL, RSI_SELL_EXIT = 85, 55
 
 # 시그널
 def find_signals(df):
-    buy_signals, sell_signals = [], []
-    in_oversold, in_overbought = False, False
-    last_buy, last_sell = None, None
-    
-    for idx in range(len(df)):
-        rsi = df['rsi'].iloc[idx]
-        if pd.isna(rsi):
-            continue
-        
-        if rsi < RSI_BUY:
-            in_oversold = True
-            last_buy = df.index[idx]
-        elif in_oversold and rsi >= RSI_BUY_EXIT and last_buy:
-            buy_signals.append({'date': df.index[idx], 'price': df['Close'].iloc[idx]})
-            in_oversold = False
-            last_buy = None
-        
-        if rsi > RSI_SELL:
-            in_overbought = True
-            last_sell = df.index[idx]
-        elif in_overbought and rsi <= RSI_SELL_EXIT and last_sell:
-            sell_signals.append({'date': df.index[idx], 'price': df['Close'].iloc[idx]})
-            in_overbought = False
-            last_sell = None
-    
+    buy_signals = [{'date': s['confirm_date'], 'price': s['confirm_price']}
+                   for s in rsi_buy_signals(df, RSI_BUY, RSI_BUY_EXIT)]
+    sell_signals = [{'date': s['confirm_date'], 'price': s['confirm_price']}
+                    for s in rsi_sell_signals(df, RSI_SELL, RSI_SELL_EXIT)]
     return buy_signals, sell_signals
 
 buy_sigs, sell_sigs = find_signals(df_2y)
@@ -0,0 +1,68 @@
+"""
+CoinFetcher 동시 다운로드 타임아웃 검증 (네트워크 없이 stub provider 사용)
+
+provider가 timeout 인자를 무시하고 멈추는 티커가 있어도
+1. fetch가 티커 예산(ticker_budget) 안에 돌아오는지
+2. 멈춘 티커만 결과에서 빠지고 나머지는 그대로 받는지
+확인한다. 하나라도 다르면 종료 코드 1.
+
+python verify_fetch_timeout.py
+"""
+import sys
+sys.path.insert(0, '.')
+
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.data.fetcher import CoinFetcher
+
+TIMEOUT = 0.2
+MARGIN = 1.0        # 스레드 스케줄링 여유 (초)
+
+
+def make_provider(hang: set, release: threading.Event):
+    """hang에 있는 티커는 release될 때까지 멈추고 (timeout 무시), 나머지는 바로 20봉 반환"""
+    def provider(ticker: str, timeout: float = None, **kwargs) -> pd.DataFrame:
+        if ticker in hang:
+            release.wait()
+        index = pd.date_range('2024-01-01', periods=20, freq='4h')
+        close = np.linspace(100, 120, 20)
+        return pd.DataFrame({'Open': close, 'High': close, 'Low': close, 'Close': close, 'Volume': 1.0}, index=index)
+    return provider
+
+
+def check(label: str, tickers: list, hang: set, max_workers: int) -> bool:
+    release = threading.Event()
+    fetcher = CoinFetcher(tickers, history_provider=make_provider(hang, release),
+                          max_workers=max_workers, timeout=TIMEOUT, retries=1, backoff=0.05)
+    limit = fetcher.ticker_budget * -(-len(tickers) // min(max_workers, len(tickers))) + MARGIN
+    
+    start = time.perf_counter()
+    data = fetcher.fetch(period='1y', interval='4h', concurrent=True)
+    elapsed = time.perf_counter() - start
+    release.set()  # 멈춘 stub 스레드 정리
+    
+    expected = [t for t in tickers if t not in hang]
+    passed = elapsed < limit and list(data) == expected
+    print(f"  {'✅' if passed else '❌'} {label}: {elapsed:.2f}초 (한도 {limit:.2f}초), 결과 {list(data)}")
+    return passed
+
+
+if __name__ == '__main__':
+    print("=" * 80)
+    print("🔍 CoinFetcher 동시 다운로드 타임아웃 검증")
+    print("=" * 80)
+    
+    ok = True
+    ok &= check("멈춘 티커 없음", ['BTC-USD', 'ETH-USD', 'SOL-USD'], set(), 4)
+    ok &= check("티커 하나가 멈춤", ['BTC-USD', 'HANG-USD', 'ETH-USD'], {'HANG-USD'}, 4)
+    ok &= check("모든 티커가 멈춤", ['HANG1-USD', 'HANG2-USD'], {'HANG1-USD', 'HANG2-USD'}, 2)
+    ok &= check("대기열 티커 (스레드 2개)", ['BTC-USD', 'HANG-USD', 'ETH-USD', 'SOL-USD'], {'HANG-USD'}, 2)
+    
+    print("\n" + "=" * 80)
+    print("✅ 타임아웃 처리 정상" if ok else "❌ 타임아웃 처리 실패")
+    print("=" * 80)
+    sys.exit(0 if ok else 1)
@@ -5,13 +5,13 @@
 import sys
 sys.path.insert(0, '.')
 
-import pandas as pd
-
 from dashboard_4h import (
     find_buy_signals,
     find_sell_signals,
     simulate_trades
 )
+from src.data.store import OHLCVStore
+from src.features.technical import trim_warmup
 
 print("=" * 100)
 print("🔍 골든크로스 ON/OFF 연도별 비교")
@@ -53,8 +53,10 @@ def run_test_yearly(df, use_gc, name):
 
 # ===== OKX 5년 데이터 =====
 print("\n📊 OKX 5년 데이터 로드...")
-df = pd.read_csv("data/btc_4h_5y.csv", index_col=0, parse_dates=True)
-df = df.dropna()
+store = OHLCVStore()
+df = store.read_or_import("data/btc_4h_5y.csv", 'BTC-USD', '4h',
+                          columns=['High', 'Low', 'Close', 'rsi', 'MA100', 'MA200', 'golden_cross'])
+df = trim_warmup(df)  # MA 워밍업 구간 제외 (복사 없이 슬라이스)
 print(f"   기간: {df.index[0]} ~ {df.index[-1]} ({len(df)}봉)")
 
 result_on = run_test_yearly(df, True, "GC ON")
@@ -0,0 +1,57 @@
+"""
+지표 워밍업/구간 계산 검증
+
+1. trim_warmup: 지표 컬럼이 모두 채워진 첫 봉부터 남기는지 (채워진 봉이 없으면 빈 DataFrame)
+2. TechnicalIndicators.calculate_window: 전체 계산 결과의 같은 구간과 같은지
+
+하나라도 다르면 종료 코드 1.
+
+python verify_indicator_window.py
+"""
+import sys
+sys.path.insert(0, '.')
+
+import numpy as np
+import pandas as pd
+
+from src.features.technical import TechnicalIndicators, trim_warmup
+
+COLUMNS = ['rsi', 'MA40', 'MA200', 'golden_cross']
+
+
+def report(label: str, passed: bool) -> bool:
+    print(f"  {'✅' if passed else '❌'} {label}")
+    return passed
+
+
+if __name__ == '__main__':
+    print("=" * 80)
+    print("🔍 지표 워밍업/구간 계산 검증")
+    print("=" * 80)
+    
+    df = pd.read_csv("data/btc_4h_5y.csv", index_col=0, parse_dates=True)[['Open', 'High', 'Low', 'Close', 'Volume']]
+    ti = TechnicalIndicators()
+    full = ti.calculate(df, COLUMNS)
+    ok = True
+    
+    print("\n📊 trim_warmup")
+    trimmed = trim_warmup(full, ['rsi', 'MA200'])
+    first = int(full['MA200'].notna().to_numpy().argmax())
+    ok &= report(f"MA200 워밍업 {first}봉 제외", trimmed.index[0] == full.index[first] and len(trimmed) == len(full) - first)
+    short = full.iloc[:100]  # MA200이 한 봉도 채워지지 않는 구간
+    ok &= report("채워진 봉이 없으면 빈 DataFrame", trim_warmup(short, ['rsi', 'MA200']).empty)
+    ok &= report("채워진 봉이 없을 때 컬럼 유지", list(trim_warmup(short).columns) == list(short.columns))
+    ok &= report("빈 입력", trim_warmup(full.iloc[0:0], ['rsi']).empty)
+    
+    print("\n📊 calculate_window")
+    for start, end in [(df.index[1500], None), (df.index[3000], df.index[5000]), (None, df.index[300])]:
+        window = ti.calculate_window(df, COLUMNS, start, end)
+        expected = full.loc[start:end]
+        same = window.index.equals(expected.index) and all(
+            np.allclose(window[c].astype(float), expected[c].astype(float), rtol=1e-9, equal_nan=True) for c in COLUMNS)
+        ok &= report(f"{start} ~ {end}: {len(window)}봉", same)
+    
+    print("\n" + "=" * 80)
+    print("✅ 모두 일치" if ok else "❌ 불일치 발견")
+    print("=" * 80)
+    sys.exit(0 if ok else 1)
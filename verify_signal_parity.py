@@ -0,0 +1,688 @@
+"""
+RSI 시그널 벡터화 엔진(src.signals) 동일성 검증
+
+봉마다 .iloc로 도는 기존 구현(아래 legacy_* - 원본 그대로 보존)과
+src.signals.rsi_buy_signals / rsi_sell_signals / rsi_peak_short_signals 결과를 비교한다.
+
+- 데이터: data/btc_4h_5y.csv, data/eth_4h_5y.csv (+ RSI/golden_cross 일부를 NaN으로 만든 사본)
+- 파라미터: 과매도/과매수 진입·탈출 임계값 격자 (탈출 기준이 진입 구간 안쪽인 조합 포함)
+- 변형: 대시보드(anchor='last'), dashboard_4h_dual(reset_on_reject), optimize_params(anchor='first'),
+        optimize_final(missing_filter='skip'), verify_dashboard_calc(missing_filter='accept'),
+        eth_* 스크립트(매수/매도 한 루프),
+        숏 진입 피크 시그널(dashboard_4h_dual GC/DC 분기, optimize_dual_strategy 피크만, 일괄 계산),
+        최적화 격자 일괄 계산(rsi_buy_signal_sets / rsi_sell_signal_sets),
+        scripts/check_4h*.py 최근 봉 라이브 체크, final_comparison* / debug_dashboard 숏 확인 봉,
+        optimize_dc_rsi 데드크로스 하향 돌파(cross_below)
+
+기존 구현이 만드는 키는 모두 같은 값이어야 한다. 하나라도 다르면 종료 코드 1.
+
+python verify_signal_parity.py
+"""
+import sys
+sys.path.insert(0, '.')
+
+import itertools
+import numpy as np
+import pandas as pd
+
+from src.features.technical import TechnicalIndicators
+from src.signals import (rsi_buy_signals, rsi_sell_signals, rsi_buy_signal_set, rsi_sell_signal_set,
+                         rsi_buy_signal_sets, rsi_sell_signal_sets, rsi_peak_short_signal_set,
+                         rsi_peak_short_signal_sets, rsi_peak_short_signals, cross_below)
+from src.signals.rsi_exit import golden_cross_mask
+
+BUY_GRID = list(itertools.product([25, 30, 35, 40], [30, 35, 40, 45, 50]))
+SELL_GRID = list(itertools.product([70, 75, 80, 85], [50, 55, 60, 80]))
+# (rsi_peak, rsi_entry, lookback) - 기존 숏 루프가 봉마다 슬라이스를 떠서 격자를 작게
+SHORT_GRID = list(itertools.product([75, 80], [65, 70], [1, 24]))
+
+
+# ===== 기존 구현 (dashboard_4h.py / dashboard_eth_4h.py / dashboard.py / scripts/check_4h_detailed.py) =====
+
+def legacy_buy_signals(df: pd.DataFrame, rsi_oversold: float = 30, rsi_exit: float = 50, use_golden_cross: bool = True):
+    """
+    매수 시그널 찾기 (RSI 탈출 방식 + 골든크로스 필터)
+    조건: RSI < rsi_oversold 후 → RSI >= rsi_exit 탈출 시 매수
+    골든크로스 필터: MA40 > MA200 일 때만 매수 허용
+    """
+    buy_signals = []
+    
+    in_oversold = False
+    last_signal_date = None
+    last_signal_price = None
+    last_signal_rsi = None
+    
+    for idx in range(len(df)):
+        rsi = df['rsi'].iloc[idx]
+        
+        if pd.isna(rsi):
+            continue
+        
+        # 골든크로스 체크
+        golden_cross_ok = True
+        if use_golden_cross and 'golden_cross' in df.columns:
+            gc = df['golden_cross'].iloc[idx]
+            golden_cross_ok = gc if not pd.isna(gc) else False
+        
+        if rsi < rsi_oversold:
+            in_oversold = True
+            last_signal_date = df.index[idx]
+            last_signal_price = df['Close'].iloc[idx]
+            last_signal_rsi = rsi
+        else:
+            if in_oversold and rsi >= rsi_exit and last_signal_date is not None:
+                # 골든크로스 필터: 상승장에서만 매수
+                if golden_cross_ok:
+                    buy_signals.append({
+                        'signal_date': last_signal_date,
+                        'signal_price': last_signal_price,
+                        'signal_rsi': last_signal_rsi,
+                        'confirm_date': df.index[idx],
+                        'confirm_price': df['Close'].iloc[idx],
+                        'confirm_rsi': rsi,
+                        'golden_cross': golden_cross_ok
+                    })
+                    in_oversold = False
+                    last_signal_date = None
+    
+    return buy_signals
+
+
+def legacy_sell_signals(df: pd.DataFrame, rsi_overbought: float = 70, rsi_exit: float = 50):
+    """
+    매도 시그널 찾기 (RSI 탈출 방식)
+    조건: RSI > rsi_overbought 후 → RSI <= rsi_exit 하락 시 매도
+    """
+    sell_signals = []
+    
+    in_overbought = False
+    last_signal_date = None
+    last_signal_price = None
+    last_signal_rsi = None
+    
+    for idx in range(len(df)):
+        rsi = df['rsi'].iloc[idx]
+        
+        if pd.isna(rsi):
+            continue
+        
+        if rsi > rsi_overbought:
+            in_overbought = True
+            last_signal_date = df.index[idx]
+            last_signal_price = df['Close'].iloc[idx]
+            last_signal_rsi = rsi
+        else:
+            if in_overbought and rsi <= rsi_exit and last_signal_date is not None:
+                sell_signals.append({
+                    'signal_date': last_signal_date,
+                    'signal_price': last_signal_price,
+                    'signal_rsi': last_signal_rsi,
+                    'confirm_date': df.index[idx],
+                    'confirm_price': df['Close'].iloc[idx],
+                    'confirm_rsi': rsi
+                })
+                in_overbought = False
+                last_signal_date = None
+    
+    return sell_signals
+
+
+# ===== 기존 구현 (dashboard_4h_dual.py - 골든크로스 필터로 거른 탈출에서도 대기 해제) =====
+
+def legacy_buy_signals_reset(df: pd.DataFrame, rsi_oversold: float = 35, rsi_exit: float = 40, use_golden_cross: bool = True):
+    """
+    롱 진입 시그널 찾기
+    조건: RSI < rsi_oversold 후 → RSI >= rsi_exit 탈출 + 골든크로스
+    """
+    signals = []
+    
+    in_oversold = False
+    last_signal_date = None
+    last_signal_price = None
+    last_signal_rsi = None
+    
+    for idx in range(len(df)):
+        rsi = df['rsi'].iloc[idx]
+        
+        if pd.isna(rsi):
+            continue
+        
+        golden_cross_ok = True
+        if use_golden_cross and 'golden_cross' in df.columns:
+            gc = df['golden_cross'].iloc[idx]
+            golden_cross_ok = gc if not pd.isna(gc) else False
+        
+        if rsi < rsi_oversold:
+            in_oversold = True
+            last_signal_date = df.index[idx]
+            last_signal_price = df['Close'].iloc[idx]
+            last_signal_rsi = rsi
+        else:
+            if in_oversold and rsi >= rsi_exit and last_signal_date is not None:
+                if golden_cross_ok:
+                    signals.append({
+                        'type': 'long',
+                        'signal_date': last_signal_date,
+                        'signal_price': last_signal_price,
+                        'signal_rsi': last_signal_rsi,
+                        'confirm_date': df.index[idx],
+                        'confirm_price': df['Close'].iloc[idx],
+                        'confirm_rsi': rsi,
+                        'golden_cross': golden_cross_ok
+                    })
+                in_oversold = False
+                last_signal_date = None
+    
+    return signals
+
+
+# ===== 기존 구현 (optimize_params.py - 과매도 첫 봉 기준) =====
+
+def legacy_buy_signals_first(df: pd.DataFrame, rsi_oversold: int, rsi_exit: int) -> list:
+    """매수 시그널 찾기 (confirm_date 기준)"""
+    signals = []
+    in_oversold = False
+    signal_start = None
+    signal_price = None
+    signal_rsi = None
+    
+    for i in range(len(df)):
+        row = df.iloc[i]
+        current_rsi = row.get('rsi', 50)
+        
+        if current_rsi < rsi_oversold and not in_oversold:
+            in_oversold = True
+            signal_start = df.index[i]
+            signal_price = row['Close']
+            signal_rsi = current_rsi
+        elif in_oversold and current_rsi >= rsi_exit:
+            # 실제 매수 시점!
+            signals.append({
+                'signal_date': signal_start,
+                'signal_price': signal_price,
+                'signal_rsi': signal_rsi,
+                'confirm_date': df.index[i],
+                'confirm_price': row['Close'],
+                'confirm_rsi': current_rsi
+            })
+            in_oversold = False
+            signal_start = None
+    
+    return signals
+
+
+def legacy_sell_signals_first(df: pd.DataFrame, rsi_overbought: int, rsi_exit: int) -> list:
+    """매도 시그널 찾기 (confirm_date 기준)"""
+    signals = []
+    in_overbought = False
+    signal_start = None
+    signal_price = None
+    signal_rsi = None
+    
+    for i in range(len(df)):
+        row = df.iloc[i]
+        current_rsi = row.get('rsi', 50)
+        
+        if current_rsi > rsi_overbought and not in_overbought:
+            in_overbought = True
+            signal_start = df.index[i]
+            signal_price = row['Close']
+            signal_rsi = current_rsi
+        elif in_overbought and current_rsi <= rsi_exit:
+            # 실제 매도 시점!
+            signals.append({
+                'signal_date': signal_start,
+                'signal_price': signal_price,
+                'signal_rsi': signal_rsi,
+                'confirm_date': df.index[i],
+                'confirm_price': row['Close'],
+                'confirm_rsi': current_rsi
+            })
+            in_overbought = False
+            signal_start = None
+    
+    return signals
+
+
+# ===== 기존 구현 (optimize_final.py / optimize_with_gc.py - golden_cross NaN 봉 건너뜀) =====
+
+def legacy_buy_signals_skip(df, rsi_oversold, rsi_exit):
+    """매수 시그널 (골든크로스 필터 적용)"""
+    signals = []
+    in_oversold = False
+    
+    for idx in range(len(df)):
+        rsi = df['rsi'].iloc[idx]
+        gc = df['golden_cross'].iloc[idx]
+        
+        if pd.isna(rsi) or pd.isna(gc):
+            continue
+        
+        if rsi < rsi_oversold:
+            in_oversold = True
+        elif in_oversold and rsi >= rsi_exit:
+            if gc:
+                signals.append({
+                    'confirm_date': df.index[idx],
+                    'confirm_price': df['Close'].iloc[idx]
+                })
+            in_oversold = False
+    
+    return signals
+
+
+# ===== 기존 구현 (verify_dashboard_calc.py - golden_cross NaN 허용) =====
+
+def legacy_buy_signals_accept(df, rsi_oversold=35, rsi_exit=40, use_gc=True):
+    signals = []
+    in_oversold = False
+    last_signal_date = None
+    last_signal_price = None
+    
+    for idx in range(len(df)):
+        rsi = df['rsi'].iloc[idx]
+        gc = df['golden_cross'].iloc[idx] if use_gc else True
+        
+        if pd.isna(rsi):
+            continue
+        
+        if rsi < rsi_oversold:
+            in_oversold = True
+            last_signal_date = df.index[idx]
+            last_signal_price = df['Close'].iloc[idx]
+        else:
+            if in_oversold and rsi >= rsi_exit and last_signal_date is not None and gc:
+                signals.append({
+                    'type': 'long_entry',
+                    'signal_date': last_signal_date,
+                    'signal_price': last_signal_price,
+                    'confirm_date': df.index[idx],
+                    'confirm_price': df['Close'].iloc[idx],
+                    'confirm_rsi': rsi
+                })
+                in_oversold = False
+                last_signal_date = None
+    return signals
+
+
+# ===== 기존 구현 (eth_long_yearly.py 등 - 매수/매도 한 루프, 확인 봉만) =====
+
+def legacy_signals_combined(df_year, rsi_buy, rsi_buy_exit, rsi_sell, rsi_sell_exit):
+    buy_signals, sell_signals = [], []
+    in_oversold, in_overbought = False, False
+    last_buy, last_sell = None, None
+    
+    for idx in range(len(df_year)):
+        rsi = df_year['rsi'].iloc[idx]
+        if pd.isna(rsi):
+            continue
+        
+        if rsi < rsi_buy:
+            in_oversold = True
+            last_buy = df_year.index[idx]
+        elif in_oversold and rsi >= rsi_buy_exit and last_buy:
+            buy_signals.append({'date': df_year.index[idx], 'price': df_year['Close'].iloc[idx]})
+            in_oversold = False
+            last_buy = None
+        
+        if rsi > rsi_sell:
+            in_overbought = True
+            last_sell = df_year.index[idx]
+        elif in_overbought and rsi <= rsi_sell_exit and last_sell:
+            sell_signals.append({'date': df_year.index[idx], 'price': df_year['Close'].iloc[idx]})
+            in_overbought = False
+            last_sell = None
+    
+    return buy_signals, sell_signals
+
+
+# ===== 기존 구현 (dashboard_4h_dual.py - 숏 진입, GC 피크 / DC 하향 돌파) =====
+
+def legacy_short_signals(df: pd.DataFrame, rsi_peak: float = 78, rsi_entry: float = 65, lookback: int = 24, dc_rsi_threshold: float = 55):
+    """
+    숏 진입 시그널 찾기 (하락장 방어 최적화)
+    
+    골든크로스(상승장):
+        최근 lookback봉 내 RSI > rsi_peak 경험 + RSI <= rsi_entry 하락
+    
+    데드크로스(하락장):
+        RSI > dc_rsi_threshold → RSI <= dc_rsi_threshold 하향
+    """
+    signals = []
+    
+    for idx in range(lookback, len(df)):
+        curr_rsi = df['rsi'].iloc[idx]
+        prev_rsi = df['rsi'].iloc[idx-1]
+        
+        if pd.isna(curr_rsi) or pd.isna(prev_rsi):
+            continue
+        
+        is_gc = df['golden_cross'].iloc[idx] if 'golden_cross' in df.columns else True
+        is_dc = df['dead_cross'].iloc[idx] if 'dead_cross' in df.columns else False
+        
+        # 골든크로스: RSI peak 전략
+        if is_gc:
+            recent_rsi = df['rsi'].iloc[idx-lookback:idx]
+            had_peak = any(recent_rsi > rsi_peak)
+            
+            if had_peak and prev_rsi > rsi_entry and curr_rsi <= rsi_entry:
+                peak_idx = None
+                for j in range(idx-1, max(idx-lookback, 0)-1, -1):
+                    if df['rsi'].iloc[j] > rsi_peak:
+                        peak_idx = j
+                        break
+                
+                if peak_idx is not None:
+                    signals.append({
+                        'type': 'short',
+                        'signal_date': df.index[peak_idx],
+                        'signal_price': df['Close'].iloc[peak_idx],
+                        'signal_rsi': df['rsi'].iloc[peak_idx],
+                        'confirm_date': df.index[idx],
+                        'confirm_price': df['Close'].iloc[idx],
+                        'confirm_rsi': curr_rsi
+                    })
+        
+        # 데드크로스: RSI threshold 하향 전략 (하락장 방어)
+        elif is_dc:
+            if prev_rsi > dc_rsi_threshold and curr_rsi <= dc_rsi_threshold:
+                signals.append({
+                    'type': 'short',
+                    'signal_date': df.index[idx],
+                    'signal_price': df['Close'].iloc[idx],
+                    'signal_rsi': prev_rsi,
+                    'confirm_date': df.index[idx],
+                    'confirm_price': df['Close'].iloc[idx],
+                    'confirm_rsi': curr_rsi
+                })
+    
+    return signals
+
+
+# ===== 기존 구현 (optimize_dual_strategy.py / verify_dashboard_calc.py - 숏 진입, 피크만) =====
+
+def legacy_short_signals_peak(df: pd.DataFrame, rsi_peak: float = 80, rsi_exit: float = 70, lookback: int = 30):
+    """숏 진입 시그널 (대시보드와 동일)"""
+    signals = []
+    
+    for idx in range(lookback, len(df)):
+        recent_rsi = df['rsi'].iloc[idx-lookback:idx]
+        had_peak = any(recent_rsi > rsi_peak)
+        
+        if not had_peak:
+            continue
+        
+        curr_rsi = df['rsi'].iloc[idx]
+        prev_rsi = df['rsi'].iloc[idx-1]
+        
+        if pd.isna(curr_rsi) or pd.isna(prev_rsi):
+            continue
+        
+        if prev_rsi > rsi_exit and curr_rsi <= rsi_exit:
+            peak_idx = None
+            for j in range(idx-1, max(idx-lookback, 0)-1, -1):
+                if df['rsi'].iloc[j] > rsi_peak:
+                    peak_idx = j
+                    break
+            
+            if peak_idx is not None:
+                signals.append({
+                    'type': 'short',
+                    'signal_date': df.index[peak_idx],
+                    'signal_price': df['Close'].iloc[peak_idx],
+                    'signal_rsi': df['rsi'].iloc[peak_idx],
+                    'confirm_date': df.index[idx],
+                    'confirm_price': df['Close'].iloc[idx],
+                    'confirm_rsi': curr_rsi
+                })
+    
+    return signals
+
+
+# ===== 기존 구현 (scripts/check_4h.py / check_4h_dual.py - 최근 봉 라이브 체크) =====
+
+def legacy_live_buy(recent_df: pd.DataFrame, rsi_oversold: float, rsi_exit: float, use_gc: bool = False) -> bool:
+    """직전 봉 또는 현재 봉에서 과매도 탈출 (use_gc면 check_4h_dual 롱 진입)"""
+    signal = False
+    current_rsi = recent_df['rsi'].iloc[-1]
+    current_gc = recent_df['golden_cross'].iloc[-1] if not pd.isna(recent_df['golden_cross'].iloc[-1]) else False
+    in_oversold = False
+    for i in range(len(recent_df) - 1):
+        rsi = recent_df['rsi'].iloc[i]
+        gc = recent_df['golden_cross'].iloc[i]
+        
+        if rsi < rsi_oversold:
+            in_oversold = True
+        elif in_oversold and rsi >= rsi_exit:
+            if i == len(recent_df) - 2 and (gc or not use_gc):
+                signal = True
+            in_oversold = False
+    
+    if in_oversold and current_rsi >= rsi_exit and (current_gc or not use_gc):
+        signal = True
+    return signal
+
+
+def legacy_live_sell(recent_df: pd.DataFrame, rsi_overbought: float, rsi_exit: float) -> bool:
+    """직전 봉 또는 현재 봉에서 과매수 탈출"""
+    signal = False
+    current_rsi = recent_df['rsi'].iloc[-1]
+    in_overbought = False
+    for i in range(len(recent_df) - 1):
+        rsi = recent_df['rsi'].iloc[i]
+        if rsi > rsi_overbought:
+            in_overbought = True
+        elif in_overbought and rsi <= rsi_exit:
+            if i == len(recent_df) - 2:
+                signal = True
+            in_overbought = False
+    
+    if in_overbought and current_rsi <= rsi_exit:
+        signal = True
+    return signal
+
+
+def legacy_live_short(df: pd.DataFrame, rsi_peak: float, rsi_entry: float, lookback: int, dc_rsi_threshold: float) -> bool:
+    """현재 봉 숏 진입 (GC: 피크 후 하향, DC: threshold 하향)"""
+    latest = df.iloc[-1]
+    current_rsi = latest.get('rsi', 0)
+    current_gc = latest['golden_cross'] if not pd.isna(latest['golden_cross']) else False
+    current_dc = latest['dead_cross'] if not pd.isna(latest['dead_cross']) else False
+    if current_gc:
+        recent_rsi = df['rsi'].iloc[-lookback-1:-1]
+        had_peak = any(recent_rsi > rsi_peak)
+        prev_rsi = df['rsi'].iloc[-2]
+        return bool(had_peak and prev_rsi > rsi_entry and current_rsi <= rsi_entry)
+    elif current_dc:
+        prev_rsi = df['rsi'].iloc[-2]
+        return bool(prev_rsi > dc_rsi_threshold and current_rsi <= dc_rsi_threshold)
+    return False
+
+
+# ===== 기존 구현 (final_comparison.py / final_comparison_daily.py / debug_dashboard.py - 숏 확인 봉만) =====
+
+def legacy_short_confirms(df: pd.DataFrame, rsi_peak: float, rsi_entry: float, lookback: int,
+                          dc_rsi_threshold: float, use_dc_short: bool) -> list:
+    short_signals = []
+    
+    for idx in range(lookback, len(df)):
+        curr_rsi = df['rsi'].iloc[idx]
+        prev_rsi = df['rsi'].iloc[idx-1]
+        is_golden = df['golden_cross'].iloc[idx]
+        is_dead = df['dead_cross'].iloc[idx]
+        
+        if pd.isna(curr_rsi) or pd.isna(prev_rsi) or pd.isna(is_golden):
+            continue
+        
+        if use_dc_short:
+            if is_golden:
+                recent_rsi = df['rsi'].iloc[idx-lookback:idx]
+                had_peak = any(recent_rsi > rsi_peak)
+                if had_peak and prev_rsi > rsi_entry and curr_rsi <= rsi_entry:
+                    short_signals.append({'confirm_date': df.index[idx], 'confirm_price': df['Close'].iloc[idx]})
+            elif is_dead:
+                if prev_rsi > dc_rsi_threshold and curr_rsi <= dc_rsi_threshold:
+                    short_signals.append({'confirm_date': df.index[idx], 'confirm_price': df['Close'].iloc[idx]})
+        else:
+            recent_rsi = df['rsi'].iloc[idx-lookback:idx]
+            had_peak = any(recent_rsi > rsi_peak)
+            if had_peak and prev_rsi > rsi_entry and curr_rsi <= rsi_entry:
+                short_signals.append({'confirm_date': df.index[idx], 'confirm_price': df['Close'].iloc[idx]})
+    
+    return short_signals
+
+
+# ===== 기존 구현 (optimize_dc_rsi.py - 데드크로스 RSI 하향 돌파) =====
+
+def legacy_dc_cross(df: pd.DataFrame, rsi_th: float, warmup: int) -> list:
+    signals = []
+    for idx in range(warmup, len(df)):
+        is_dead = df['dead_cross'].iloc[idx]
+        rsi = df['rsi'].iloc[idx]
+        prev_rsi = df['rsi'].iloc[idx-1]
+        
+        if pd.isna(rsi) or pd.isna(prev_rsi):
+            continue
+        
+        if is_dead and prev_rsi > rsi_th and rsi <= rsi_th:
+            signals.append({'date': df.index[idx], 'price': df['Close'].iloc[idx], 'idx': idx})
+    return signals
+
+
+def live_confirmed(signals) -> bool:
+    """scripts/check_4h*.py: 직전 봉 또는 현재 봉에서 확인된 시그널"""
+    return bool((signals.confirm_idx >= len(signals.index) - 2).any())
+
+
+# ===== 비교 =====
+
+def same_signals(expected: list, actual: list) -> bool:
+    """기존 구현이 만든 키만 비교 (엔진은 키를 더 가질 수 있음)"""
+    if len(expected) != len(actual):
+        return False
+    return all(e[k] == a[k] or (pd.isna(e[k]) and pd.isna(a[k]))
+               for e, a in zip(expected, actual) for k in e)
+
+
+def load_frames() -> dict:
+    ti = TechnicalIndicators()
+    frames = {}
+    for name in ('btc', 'eth'):
+        df = pd.read_csv(f"data/{name}_4h_5y.csv", index_col=0, parse_dates=True)
+        df = ti.calculate(df[['Open', 'High', 'Low', 'Close', 'Volume']], ['rsi', 'golden_cross', 'dead_cross'])
+        frames[name.upper()] = df
+        
+        # 중간중간 RSI/golden_cross 결측 (NaN 봉 처리 방식이 구현마다 다름)
+        holed = df.copy()
+        holed['golden_cross'] = holed['golden_cross'].astype(object)
+        rng = np.random.default_rng(0)
+        for c in ('rsi', 'golden_cross'):
+            holed.loc[holed.index[rng.choice(len(holed), len(holed) // 50, replace=False)], c] = np.nan
+        frames[f"{name.upper()} (결측)"] = holed
+    return frames
+
+
+def check(label: str, cases) -> bool:
+    failed = [params for params, expected, actual in cases if not same_signals(expected, actual)]
+    total = len(cases)
+    print(f"  {'✅' if not failed else '❌'} {label}: {total - len(failed)}/{total} 일치")
+    for params in failed[:5]:
+        print(f"      불일치: {params}")
+    return not failed
+
+
+if __name__ == '__main__':
+    print("=" * 80)
+    print("🔍 RSI 시그널 엔진 동일성 검증")
+    print("=" * 80)
+    
+    ok = True
+    for name, df in load_frames().items():
+        print(f"\n📊 {name} ({len(df):,}봉)")
+        ok &= check("매수 (대시보드)", [
+            ((o, e, gc), legacy_buy_signals(df, o, e, gc), rsi_buy_signals(df, o, e, gc))
+            for (o, e), gc in itertools.product(BUY_GRID, (False, True))])
+        ok &= check("매수 (GC 거부 시 해제)", [
+            ((o, e), legacy_buy_signals_reset(df, o, e, True),
+             rsi_buy_signals(df, o, e, True, reset_on_reject=True, kind='long'))
+            for o, e in BUY_GRID])
+        ok &= check("매수 (첫 봉 기준)", [
+            ((o, e), legacy_buy_signals_first(df, o, e), rsi_buy_signals(df, o, e, anchor='first'))
+            for o, e in BUY_GRID])
+        ok &= check("매도 (대시보드)", [
+            ((o, e), legacy_sell_signals(df, o, e), rsi_sell_signals(df, o, e))
+            for o, e in SELL_GRID])
+        ok &= check("매도 (첫 봉 기준)", [
+            ((o, e), legacy_sell_signals_first(df, o, e), rsi_sell_signals(df, o, e, anchor='first'))
+            for o, e in SELL_GRID])
+        ok &= check("매수 (GC 결측 봉 건너뜀)", [
+            ((o, e), legacy_buy_signals_skip(df, o, e),
+             rsi_buy_signals(df, o, e, True, reset_on_reject=True, missing_filter='skip'))
+            for o, e in BUY_GRID])
+        ok &= check("매수 (GC 결측 허용)", [
+            ((o, e), legacy_buy_signals_accept(df, o, e, True),
+             rsi_buy_signals(df, o, e, True, missing_filter='accept', kind='long_entry'))
+            for o, e in BUY_GRID])
+        ok &= check("매수/매도 한 루프 (확인 봉만)", [
+            ((o, e, so, se), sum(legacy_signals_combined(df, o, e, so, se), []),
+             [{'date': s['confirm_date'], 'price': s['confirm_price']}
+              for s in rsi_buy_signals(df, o, e) + rsi_sell_signals(df, so, se)])
+            for (o, e), (so, se) in itertools.product(BUY_GRID[::4], SELL_GRID[::4])])
+        buy_first = rsi_buy_signal_sets(df, BUY_GRID, anchor='first')
+        buy_skip = rsi_buy_signal_sets(df, BUY_GRID, True, reset_on_reject=True, missing_filter='skip')
+        sell_first = rsi_sell_signal_sets(df, SELL_GRID, anchor='first')
+        sell_last = rsi_sell_signal_sets(df, SELL_GRID)
+        ok &= check("격자 일괄 계산 (매수 첫 봉 / GC 결측 건너뜀)", [
+            ((o, e), legacy_buy_signals_first(df, o, e) + legacy_buy_signals_skip(df, o, e),
+             buy_first[(o, e)].to_records() + buy_skip[(o, e)].to_records())
+            for o, e in BUY_GRID])
+        ok &= check("격자 일괄 계산 (매도 첫 봉 / 대시보드)", [
+            ((o, e), legacy_sell_signals_first(df, o, e) + legacy_sell_signals(df, o, e),
+             sell_first[(o, e)].to_records() + sell_last[(o, e)].to_records())
+            for o, e in SELL_GRID])
+        # 탈출 봉이 하나도 없는 임계값 (RSI가 닿지 않는 값)
+        never = [(o, 101) for o in (25, 35)]
+        ok &= check("격자 일괄 계산 (탈출 없음)", [
+            ((o, e, anchor), rsi_buy_signals(df, o, e, anchor=anchor),
+             rsi_buy_signal_sets(df, [(o, e)], anchor=anchor)[(o, e)].to_records())
+            for (o, e), anchor in itertools.product(never, ('last', 'first'))] + [
+            ((o, e, anchor), rsi_sell_signals(df, o, e, anchor=anchor),
+             rsi_sell_signal_sets(df, [(o, e)], anchor=anchor)[(o, e)].to_records())
+            for (o, e), anchor in itertools.product([(75, -1), (80, -1)], ('last', 'first'))])
+        ok &= check("숏 진입 (GC 피크 / DC 하향)", [
+            ((p, e, lb), legacy_short_signals(df, p, e, lb, 55), rsi_peak_short_signals(df, p, e, lb, 55))
+            for p, e, lb in SHORT_GRID])
+        batch = rsi_peak_short_signal_sets(df, SHORT_GRID)
+        ok &= check("숏 진입 (피크만, 일괄 계산)", [
+            ((p, e, lb), legacy_short_signals_peak(df, p, e, lb), batch[(p, e, lb)].to_records())
+            for p, e, lb in SHORT_GRID])
+        
+        # 스크립트 입력의 golden_cross는 MA 비교 결과(bool)라 결측이 없다
+        gc_df = df.assign(golden_cross=golden_cross_mask(df))
+        ends = range(len(gc_df) - 1, 250, -37)  # 최근 봉 시점을 바꿔가며
+        ok &= check("라이브 체크 (check_4h 매수/매도, check_4h_dual 롱/숏 청산)", [
+            ((end, o, e, gc), [{'fired': legacy_live_buy(gc_df.iloc[end - 29:end + 1], o, e, gc)}],
+             [{'fired': live_confirmed(rsi_buy_signal_set(gc_df.iloc[end - 29:end + 1], o, e, gc,
+                                                          reset_on_reject=True))}])
+            for end, ((o, e), gc) in itertools.product(ends, [((35, 40), False), ((35, 40), True), ((35, 45), False)])] + [
+            ((end, o, e), [{'fired': legacy_live_sell(gc_df.iloc[end - 29:end + 1], o, e)}],
+             [{'fired': live_confirmed(rsi_sell_signal_set(gc_df.iloc[end - 29:end + 1], o, e))}])
+            for end, (o, e) in itertools.product(ends, [(80, 55), (70, 60)])])
+        ok &= check("라이브 체크 (check_4h_dual 숏 진입)", [
+            ((end, p, e), [{'fired': legacy_live_short(gc_df.iloc[:end + 1], p, e, 24, 55)}],
+             [{'fired': end in rsi_peak_short_signal_set(gc_df.iloc[:end + 1], p, e, 24, 55).confirm_idx}])
+            for end, (p, e) in itertools.product(ends, [(78, 65), (70, 60)])])
+        ok &= check("숏 진입 확인 봉 (final_comparison / debug_dashboard)", [
+            ((p, e, dc), legacy_short_confirms(gc_df, p, e, 24, 65, dc),
+             rsi_peak_short_signals(gc_df, p, e, 24, 65 if dc else None))
+            for (p, e, _), dc in itertools.product(SHORT_GRID[::2], (False, True))])
+        ok &= check("DC 하향 돌파 (optimize_dc_rsi)", [
+            (th, legacy_dc_cross(gc_df, th, 201),
+             [{'date': gc_df.index[i], 'price': gc_df['Close'].iloc[i], 'idx': i}
+              for i in cross_below(gc_df['rsi'], th) if i >= 201 and gc_df['dead_cross'].iloc[i]])
+            for th in (40, 50, 55, 65)])
+    
+    print("\n" + "=" * 80)
+    print("✅ 모든 조합 동일" if ok else "❌ 불일치 발견")
+    print("=" * 80)
+    sys.exit(0 if ok else 1)
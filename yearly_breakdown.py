@@ -1,27 +1,22 @@
 """
 2022-2025 년별 롱/숏 수익 분석
 """
-import pandas as pd
 import numpy as np
 import sys
 sys.path.insert(0, '.')
 
 from dashboard_4h import find_buy_signals, find_sell_signals, simulate_trades
+from src.data.loader import load_window
+from src.data.store import OHLCVStore
+from src.features.technical import TechnicalIndicators
 
-def add_indicators(df):
-    df = df.copy()
-    delta = df['Close'].diff()
-    gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-    rs = gain / loss
-    df['rsi'] = 100 - (100 / (1 + rs))
-    df['MA40'] = df['Close'].rolling(window=40).mean()
-    df['MA200'] = df['Close'].rolling(window=200).mean()
-    df['golden_cross'] = df['MA40'] > df['MA200']
-    exp1 = df['Close'].ewm(span=12, adjust=False).mean()
-    exp2 = df['Close'].ewm(span=26, adjust=False).mean()
-    df['MACD'] = exp1 - exp2
-    return df
+# rsi(14), MA40/MA200 골든크로스, MACD(12/26, adjust=False)
+INDICATORS = ['rsi', 'MA40', 'MA200', 'golden_cross', 'macd']
+
+def add_indicators(df, start):
+    """start 이후 구간만 지표 계산 (앞의 워밍업 봉은 잘라냄)"""
+    df = TechnicalIndicators().calculate_window(df, INDICATORS, start=start)
+    return df.rename(columns={'macd': 'MACD'})
 
 def test_period(df):
     buy_signals = find_buy_signals(df, 35, 40, False)
@@ -60,12 +55,18 @@ def test_period(df):
         'total_profit': long_profit + short_profit
     }
 
-# 데이터 로드
-df_full = pd.read_csv('data/btc_4h_5y.csv', index_col=0, parse_dates=True)
-df_full = add_indicators(df_full)
-
 years = [2022, 2023, 2024, 2025]
 
+# 데이터 로드 (지표는 다시 계산하므로 OHLC만, 첫 해 앞에는 지표 워밍업에 필요한 봉만)
+store = OHLCVStore()
+if not store.exists('BTC-USD', '4h'):
+    store.import_csv('data/btc_4h_5y.csv', 'BTC-USD', '4h')
+first_day = f'{years[0]}-01-01'
+df_full = load_window(store, 'BTC-USD', '4h', start=first_day,
+                      lookback=TechnicalIndicators().lookback(INDICATORS),
+                      columns=['Open', 'High', 'Low', 'Close'])
+df_full = add_indicators(df_full, first_day)
+
 print("="*100)
 print("📊 년별 롱/숏 수익 분석 (2022-2025)")
 print("="*100)